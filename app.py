@@ -10,6 +10,9 @@ from browser.navigation import UdemyNavigator
 from browser.transcript_scraper import TranscriptScraper
 from utils.file_utils import MarkdownGenerator
 from core.models import Course, ScrapingProgress
+from utils.course_reference import parse_course_reference
+from utils.logger import as_logger
+from utils.profiler import profile_run, profile_stage
 
 class UdemyScraperApp:
     def __init__(self, 
@@ -26,7 +29,7 @@ class UdemyScraperApp:
         """
         self.progress_callback = progress_callback or (lambda c, t: None)
         self.status_callback = status_callback or (lambda m: None)
-        self.log_callback = log_callback or print
+        self.log_callback = as_logger(log_callback)
         
         # 컴포넌트 초기화
         self.auth = None
@@ -39,34 +42,43 @@ class UdemyScraperApp:
         
     def run_workflow(self, course_name: str) -> bool:
         """
-        전체 스크래핑 워크플로우 실행
+        전체 스크래핑 워크플로우 실행 (PROFILE_ENABLED이면 실행 전체 프로파일링)
 
         Args:
-            course_name: 추출할 강의명
+            course_name: 추출할 강의명 (강의 URL, slug, 숫자 ID도 가능)
 
         Returns:
             bool: 성공 여부
         """
+        with profile_run("workflow", self.log_callback):
+            return self._run_workflow(course_name)
+
+    def _run_workflow(self, course_name: str) -> bool:
+        """단계별 워크플로우 (프로파일 샘플은 단계 이름으로 태그)"""
         try:
             # 1. 초기화
-            if not self._initialize_components():
-                return False
+            with profile_stage("initialize"):
+                if not self._initialize_components():
+                    return False
             
             # 2. 강의 선택
             self.status_callback("강의 검색 중...")
-            course = self._select_course(course_name)
+            with profile_stage("select_course"):
+                course = self._select_course(course_name)
             if not course:
                 return False
             
             # 3. 강의 구조 분석
             self.status_callback("강의 구조 분석 중...")
-            if not self._analyze_course_structure(course):
-                return False
+            with profile_stage("curriculum"):
+                if not self._analyze_course_structure(course):
+                    return False
 
             # 4. 자막 추출 (파일 저장과 섹션 병합 포함)
             self.status_callback("자막 추출 시작...")
-            if not self._extract_all_subtitles(course):
-                return False
+            with profile_stage("scraping"):
+                if not self._extract_all_subtitles(course):
+                    return False
 
             # 파일 저장과 섹션 병합은 _extract_all_subtitles에서 이미 처리됨
 
@@ -109,6 +121,10 @@ class UdemyScraperApp:
                 wait=self.auth.wait,
                 log_callback=self.log_callback
             )
+            # 강의마다 재생 시간 가중 진행률/남은 시간 갱신
+            self.scraper.progress = self.progress
+            self.scraper.progress_callback = self.progress_callback
+            self.scraper.status_callback = self.status_callback
             
             self.markdown_generator = MarkdownGenerator(
                 log_callback=self.log_callback
@@ -124,12 +140,13 @@ class UdemyScraperApp:
     def _select_course(self, course_name: str) -> Optional[Course]:
         """강의 선택"""
         try:
-            # My Learning 페이지로 이동
-            if not self.navigator.go_to_my_learning():
-                return None
-            
-            # 강의 검색 및 선택
-            course = self.navigator.search_and_select_course(course_name)
+            reference = parse_course_reference(course_name)
+            if reference:
+                # URL/slug/ID는 My Learning을 거치지 않고 바로 이동
+                course = self.navigator.open_course_by_reference(reference)
+            else:
+                # 카탈로그에서 찾아 바로 이동 (없을 때만 My Learning에서 검색)
+                course = self.navigator.search_and_select_course(course_name)
             if course:
                 self.log_callback(f"✅ 강의 선택 완료: {course.title}")
             else:
@@ -237,6 +254,10 @@ class UdemyScraperApp:
             else:
                 self.log_callback("⚠️ 섹션별 통합 대본 생성 중 일부 실패")
 
+            if success and Config.STUDY_SUMMARY_ENABLED:
+                from study_summarizer import StudySummarizer
+                StudySummarizer(output_dir, log_callback=self.log_callback).run()
+
         except Exception as e:
             self.log_callback(f"❌ 섹션별 통합 대본 생성 실패: {str(e)}")
 
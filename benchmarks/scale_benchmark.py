@@ -0,0 +1,199 @@
+"""
+강의 크기별 확장성 벤치마크
+
+합성 강의(SyntheticCourse)를 여러 크기로 만들어 SectionMerger, MarkdownGenerator를
+실행하고, --browser이면 로컬 HTTP 서버로 페이지를 띄워 디버그 Chrome에서
+CurriculumAnalyzer, TranscriptExtractor도 실행합니다. 단계별 시간/메모리(파이썬 측
+최대 할당량)와 크기 대비 증가 지수(1이면 선형)를 표로 출력합니다.
+
+    python -m benchmarks.scale_benchmark --sizes 10x10x100,50x20x300,200x50x1000 --browser
+"""
+
+import argparse
+import contextlib
+import functools
+import io
+import json
+import math
+import tempfile
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from config import Config
+from benchmarks.synthetic_course import CourseShape, SyntheticCourse
+
+DEFAULT_SIZES = "10x10x100,25x20x300,50x40x500"
+SUPERLINEAR_EXPONENT = 1.3  # 이보다 크면 확장성 절벽 후보로 표시
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """단계 하나의 측정값"""
+    stage: str
+    size: str
+    units: int  # 증가 지수 계산 기준 (강의 수 또는 cue 수)
+    seconds: float
+    peak_mb: float
+    ok: bool = True
+
+
+def measure(stage: str, size: str, units: int, func: Callable[[], object]) -> BenchmarkResult:
+    """시간과 파이썬 최대 할당량 측정 (출력은 버림)"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        outcome = func()
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return BenchmarkResult(stage, size, units, seconds, peak / 1024 / 1024, ok=outcome is not False and outcome is not None)
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@contextlib.contextmanager
+def serve_directory(directory: Path):
+    """directory를 임의 포트의 로컬 HTTP 서버로 제공 → 기본 URL"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(_QuietHandler, directory=str(directory)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class ScaleBenchmark:
+    """크기 목록마다 파일/모델 단계와 (선택) 브라우저 단계 측정"""
+
+    def __init__(self, shapes: List[CourseShape], browser: bool = False, port: Optional[int] = None):
+        self.shapes = shapes
+        self.browser = browser
+        self.port = port or Config.CHROME_DEBUG_PORT
+        self.results: List[BenchmarkResult] = []
+        self._manager = None
+
+    def run(self) -> List[BenchmarkResult]:
+        if self.browser and not self._connect():
+            print(f"⚠️ 디버그 Chrome(포트 {self.port})에 연결하지 못해 브라우저 단계는 건너뜀")
+            self.browser = False
+
+        try:
+            for shape in self.shapes:
+                print(f"📏 {shape.label}: {shape.sections}개 섹션 × {shape.lectures}개 강의 × {shape.cues}개 cue")
+                with tempfile.TemporaryDirectory(prefix="udemy_bench_") as work_dir:
+                    self._run_shape(SyntheticCourse(shape), Path(work_dir))
+        finally:
+            if self._manager:
+                self._manager.cleanup()
+        return self.results
+
+    def _connect(self) -> bool:
+        from browser.manager import ExistingBrowserManager
+
+        self._manager = ExistingBrowserManager(log_callback=lambda message: None)
+        return self._manager.connect_to_existing_browser(self.port)
+
+    def _run_shape(self, course: SyntheticCourse, work_dir: Path):
+        from section_merger import SectionMerger
+        from utils.file_utils import MarkdownGenerator
+
+        shape = course.shape
+        total_cues = shape.total_lectures * shape.cues
+
+        course_dir = course.write_transcripts(work_dir / "output")
+        self._record(measure("SectionMerger", shape.label, total_cues,
+                             lambda: SectionMerger(str(course_dir)).merge_all_sections()))
+
+        model = course.build_course()
+        generator = MarkdownGenerator(log_callback=lambda message: None)
+        markdown_dir = work_dir / "markdown"
+        self._record(measure("MarkdownGenerator", shape.label, total_cues, lambda: all(
+            generator.create_section_file(section, markdown_dir, idx + 1) for idx, section in enumerate(model.sections)
+        )))
+        del model
+
+        if self.browser:
+            course.write_page(work_dir / "page.html")
+            with serve_directory(work_dir) as base_url:
+                self._run_browser_stages(course, f"{base_url}/page.html")
+
+    def _run_browser_stages(self, course: SyntheticCourse, url: str):
+        from browser.curriculum_analyzer import CurriculumAnalyzer
+        from browser.transcript_extractor import TranscriptExtractor
+        from core.models import Course
+
+        driver, wait = self._manager.driver, self._manager.wait
+        quiet = lambda message: None
+        shape = course.shape
+
+        load = measure("page load", shape.label, shape.total_lectures, lambda: driver.get(url) or True)
+        self._record(load)
+
+        # 캐시를 쓰면 두 번째 크기부터 분석을 건너뛰므로 끔
+        cache_enabled, Config.CURRICULUM_CACHE_ENABLED = Config.CURRICULUM_CACHE_ENABLED, False
+        try:
+            analyzed = Course(title=course.title)
+            analyzer = CurriculumAnalyzer(driver, wait, quiet)
+            self._record(measure("CurriculumAnalyzer", shape.label, shape.total_lectures,
+                                 lambda: analyzer.analyze_curriculum(analyzed)))
+        finally:
+            Config.CURRICULUM_CACHE_ENABLED = cache_enabled
+
+        extractor = TranscriptExtractor(driver, wait, quiet)
+        self._record(measure("TranscriptExtractor", shape.label, shape.cues, extractor.extract_transcript_content))
+
+    def _record(self, result: BenchmarkResult):
+        self.results.append(result)
+        status = "" if result.ok else " (실패)"
+        print(f"   {result.stage:<20} {result.seconds:9.3f}초 {result.peak_mb:9.1f}MB{status}")
+
+    def report(self) -> str:
+        """단계별 표와 이전 크기 대비 증가 지수"""
+        lines = [f"{'단계':<20} {'크기':<16} {'단위':>10} {'시간(초)':>10} {'최대MB':>9} {'증가 지수':>9}"]
+        for stage in dict.fromkeys(result.stage for result in self.results):
+            previous = None
+            for result in (r for r in self.results if r.stage == stage):
+                exponent = ""
+                if previous and result.units > previous.units and previous.seconds > 0 and result.seconds > 0:
+                    value = math.log(result.seconds / previous.seconds) / math.log(result.units / previous.units)
+                    exponent = f"{value:.2f}" + (" ⚠️" if value > SUPERLINEAR_EXPONENT else "")
+                lines.append(f"{stage:<20} {result.size:<16} {result.units:>10} {result.seconds:>10.3f} "
+                             f"{result.peak_mb:>9.1f} {exponent:>9}")
+                previous = result
+        return "\n".join(lines)
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="합성 대형 강의 확장성 벤치마크")
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help="섹션x강의xcue 목록 (쉼표 구분)")
+    parser.add_argument('--browser', action='store_true', help="디버그 Chrome에서 CurriculumAnalyzer/TranscriptExtractor도 측정")
+    parser.add_argument('--port', type=int, help="디버그 Chrome 포트 (기본: CHROME_DEBUG_PORT)")
+    parser.add_argument('--json', help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    shapes = sorted((CourseShape.parse(size) for size in args.sizes.split(",")),
+                    key=lambda shape: shape.total_lectures * shape.cues)
+    benchmark = ScaleBenchmark(shapes, browser=args.browser, port=args.port)
+    benchmark.run()
+    print()
+    print(benchmark.report())
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump([asdict(result) for result in benchmark.results], f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+저장된 페이지 캡처로 셀렉터 적중률 측정 (브라우저 없이)
+
+UdemySelectors의 셀렉터와 CurriculumAnalyzer, SmartWaiter, CourseFinder 안의 셀렉터
+목록을 캡처한 HTML마다 평가해 일치 수와 첫 일치 위치(문서 순서상 요소 번호)를 표로
+출력하고, 일치가 없는 셀렉터를 뺀 뒤 여러 캡처에서 일치하는 순서(같으면 먼저 일치하는
+순서)로 재정렬한 셀렉터 표를 만듭니다. 다른 페이지(내 학습/검색)용 목록과 태그만 있는
+일반 셀렉터(h2, //h3 등)만 일치하는 목록은 캡처가 대상 페이지라는 증거가 없으므로
+그대로 둡니다.
+
+    python -m benchmarks.selector_coverage "normal body.html" "script body.html" --output selector_table.txt
+    python -m benchmarks.selector_coverage "my learning.html" --page my_learning
+"""
+
+import argparse
+import ast
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config import Config
+
+LECTURE_PAGE = "lecture"  # 강의 수강 페이지
+MY_LEARNING_PAGE = "my_learning"  # 내 학습/검색 페이지
+
+DEFAULT_CAPTURES = ["normal body.html", "script body.html"]
+# 소스 파일 → 그 안의 셀렉터 목록이 쓰이는 페이지
+INLINE_SOURCES = {
+    "browser/curriculum_analyzer.py": LECTURE_PAGE,
+    "browser/smart_waiter.py": LECTURE_PAGE,
+    "browser/course_finder.py": MY_LEARNING_PAGE
+}
+_SELECTOR_CHARS = "[.#>*:/"  # 키워드 목록('quiz', 'document' 등)과 셀렉터 목록 구분
+_TAG = re.compile(r"^(?:[a-zA-Z][a-zA-Z0-9]*|\*)$")
+
+
+@dataclass(slots=True)
+class SelectorGroup:
+    """코드에서 함께 쓰이는 셀렉터 목록 하나"""
+    name: str
+    selectors: List[str]
+    dynamic: int = 0  # f-string이라 평가하지 못한 항목 수
+    page: Optional[str] = None  # 대상 페이지 (None이면 모든 페이지)
+
+
+@dataclass(slots=True)
+class SelectorHit:
+    """캡처 하나에서의 평가 결과"""
+    count: int = 0
+    first: Optional[int] = None  # 첫 일치 요소의 문서 순서 번호
+    error: str = ""
+
+    @property
+    def label(self) -> str:
+        if self.error:
+            return "오류"
+        return f"{self.count}@{self.first}" if self.count else "-"
+
+
+def is_xpath(selector: str) -> bool:
+    return selector.startswith(("/", "./", "("))
+
+
+def is_generic(selector: str) -> bool:
+    """태그 이름만 있는 셀렉터 (h3, h2 a, //h2 등은 어느 페이지에서나 일치하므로 페이지 적합성의 증거가 아님)"""
+    if is_xpath(selector):
+        return all(_TAG.match(step) for step in selector.split("/") if step and step != ".")
+    return all(_TAG.match(token) for part in selector.split(",") for token in re.split(r"[\s>+~]+", part.strip()) if token)
+
+
+def _looks_like_selectors(values: List[str]) -> bool:
+    return any(any(char in value for char in _SELECTOR_CHARS) for value in values)
+
+
+def class_groups(cls) -> List[SelectorGroup]:
+    """셀렉터 클래스의 문자열/문자열 목록 속성"""
+    groups = []
+    for name, value in vars(cls).items():
+        if name.startswith('_'):
+            continue
+        values = [value] if isinstance(value, str) else value
+        if isinstance(values, (list, tuple)) and values and all(isinstance(item, str) for item in values):
+            if _looks_like_selectors(list(values)):
+                groups.append(SelectorGroup(f"{cls.__name__}.{name}", list(values)))
+    return groups
+
+
+def inline_groups(path: Path, page: Optional[str] = None) -> List[SelectorGroup]:
+    """소스 파일 안의 셀렉터 리터럴 목록 (이름: 파일:줄 함수 [변수])"""
+    tree = ast.parse(path.read_text(encoding='utf-8'))
+    parents = {child: node for node in ast.walk(tree) for child in ast.iter_child_nodes(node)}
+    groups = []
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.List, ast.Tuple)) or not node.elts:
+            continue
+        if not all(isinstance(item, ast.JoinedStr) or (isinstance(item, ast.Constant) and isinstance(item.value, str))
+                   for item in node.elts):
+            continue
+        selectors = [item.value for item in node.elts if isinstance(item, ast.Constant)]
+        if not selectors or not _looks_like_selectors(selectors):
+            continue
+
+        name = f"{path.name}:{node.lineno}"
+        parent, function, target = parents.get(node), None, None
+        if isinstance(parent, ast.Assign) and isinstance(parent.targets[0], ast.Name):
+            target = parent.targets[0].id
+        while parent is not None and function is None:
+            if isinstance(parent, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                function = parent.name
+            parent = parents.get(parent)
+        name += "".join(f" {part}" for part in (function, target) if part)
+        groups.append(SelectorGroup(name, selectors, dynamic=len(node.elts) - len(selectors), page=page))
+    return groups
+
+
+def default_groups() -> List[SelectorGroup]:
+    from browser.selectors import UdemySelectors
+
+    groups = class_groups(UdemySelectors)
+    for source, page in INLINE_SOURCES.items():
+        groups += inline_groups(Config.BASE_DIR / source, page)
+    return groups
+
+
+class PageCapture:
+    """저장된 HTML 한 개 (CSS는 soupsieve, XPath는 lxml로 평가)"""
+
+    def __init__(self, path: Path):
+        from bs4 import BeautifulSoup
+        import lxml.html
+
+        self.path = Path(path)
+        html = self.path.read_text(encoding='utf-8', errors='replace')
+        self.soup = BeautifulSoup(html, 'lxml')
+        self._order = {id(tag): idx for idx, tag in enumerate(self.soup.find_all(True))}
+        self._tree = lxml.html.fromstring(html)
+        self._elements = list(self._tree.iter())
+        self._xorder = {element: idx for idx, element in enumerate(self._elements)}
+
+    def evaluate(self, selector: str) -> SelectorHit:
+        try:
+            if is_xpath(selector):
+                matches = [item for item in self._tree.xpath(selector) if item in self._xorder]
+                return SelectorHit(len(matches), self._xorder[matches[0]] if matches else None)
+            matches = self.soup.select(selector)
+            return SelectorHit(len(matches), self._order.get(id(matches[0])) if matches else None)
+        except Exception as e:
+            return SelectorHit(error=str(e).splitlines()[0])
+
+
+class SelectorCoverage:
+    """셀렉터 목록 × 캡처 평가와 정리된 셀렉터 표"""
+
+    def __init__(self, captures: List[Path], groups: Optional[List[SelectorGroup]] = None, page: str = LECTURE_PAGE):
+        self.capture_paths = [Path(path) for path in captures]
+        self.groups = groups if groups is not None else default_groups()
+        self.page = page  # 캡처한 페이지 종류
+        self.hits: Dict[str, Dict[str, List[SelectorHit]]] = {}
+
+    def run(self) -> Dict[str, Dict[str, List[SelectorHit]]]:
+        captures = [PageCapture(path) for path in self.capture_paths]
+        cache: Dict[str, List[SelectorHit]] = {}
+        for group in self.groups:
+            self.hits[group.name] = {}
+            for selector in group.selectors:
+                if selector not in cache:
+                    cache[selector] = [capture.evaluate(selector) for capture in captures]
+                self.hits[group.name][selector] = cache[selector]
+        return self.hits
+
+    def _matched_in(self, group: SelectorGroup, selector: str) -> int:
+        return sum(1 for hit in self.hits[group.name][selector] if hit.count)
+
+    def _first_hit(self, group: SelectorGroup, selector: str) -> int:
+        """캡처들 중 가장 앞선 첫 일치 위치"""
+        return min(hit.first for hit in self.hits[group.name][selector] if hit.count)
+
+    def _unproven_reason(self, group: SelectorGroup) -> Optional[str]:
+        """캡처가 이 목록의 대상 페이지라는 증거가 없으면 그 이유 (있으면 None)"""
+        if group.page is not None and group.page != self.page:
+            return f"{group.page} 페이지용"
+        if any(self._matched_in(group, selector) for selector in group.selectors if not is_generic(selector)):
+            return None
+        if any(self._matched_in(group, selector) for selector in group.selectors):
+            return "일반 태그 셀렉터만 일치"
+        return "일치 없음"
+
+    def _kept(self, group: SelectorGroup) -> List[str]:
+        """일치가 있는 셀렉터만, 더 많은 캡처에서 일치하는 순서 (같으면 먼저 일치하는 순서, 그다음 원래 순서)
+
+        대상 페이지라는 증거가 없는 목록은 빈 목록 (정리하지 않음)
+        """
+        if self._unproven_reason(group):
+            return []
+        kept = [selector for selector in group.selectors if self._matched_in(group, selector)]
+        return sorted(kept, key=lambda selector: (-self._matched_in(group, selector), self._first_hit(group, selector)))
+
+    def report(self) -> str:
+        """목록별 셀렉터 일치 수@첫 위치 표와 요약"""
+        names = [path.stem[:12] for path in self.capture_paths]
+        lines = [f"캡처: {', '.join(path.name for path in self.capture_paths)} (값: 일치 수@첫 일치 요소 번호)", ""]
+        dead_total = selector_total = 0
+        unproven = []
+        for group in self.groups:
+            kept = self._kept(group)
+            selector_total += len(group.selectors)
+            if not kept:
+                unproven.append(f"{group.name} ({self._unproven_reason(group)})")
+                continue
+            dead_total += len(group.selectors) - len(kept)
+            dynamic = f", 동적 {group.dynamic}개 제외" if group.dynamic else ""
+            lines.append(f"{group.name} (일치 {len(kept)}/{len(group.selectors)}{dynamic})")
+            lines.append("  " + "".join(f"{name:>14}" for name in names) + "  셀렉터")
+            for selector in group.selectors:
+                hits = self.hits[group.name][selector]
+                mark = "" if selector in kept else "  ✂️"
+                errors = "".join(f"  ({hit.error})" for hit in hits if hit.error)[:80]
+                lines.append("  " + "".join(f"{hit.label:>14}" for hit in hits) + f"  {selector}{mark}{errors}")
+            lines.append("")
+
+        lines.append(f"셀렉터 {selector_total}개 중 일치가 있는 목록에서 제거 후보 {dead_total}개")
+        if unproven:
+            lines.append(f"캡처가 대상 페이지라는 증거가 없는 목록 {len(unproven)}개 (그대로 유지):")
+            lines += [f"  - {name}" for name in unproven]
+        return "\n".join(lines)
+
+    def pruned_table(self) -> str:
+        """정리된 셀렉터 표 (UdemySelectors 속성은 붙여 넣을 수 있는 형태)"""
+        sources = ", ".join(path.name for path in self.capture_paths)
+        lines = [f"# 셀렉터 적중률 기준 정리 (캡처: {sources})", ""]
+        for group in self.groups:
+            kept = self._kept(group)
+            if not kept:
+                lines.append(f"# {group.name}: {self._unproven_reason(group)} - 그대로 유지")
+                lines.append("")
+                continue
+            removed = [selector for selector in group.selectors if selector not in kept]
+            attribute = group.name.split(".", 1)[1] if group.name.startswith("UdemySelectors.") else None
+            lines.append(f"# {group.name} ({len(group.selectors)}개 → {len(kept)}개)")
+            lines.append(f"{attribute or 'selectors'} = [")
+            for selector in kept:
+                matched = self._matched_in(group, selector)
+                lines.append(f"    {selector!r},  # {matched}/{len(self.capture_paths)}개 캡처에서 일치")
+            lines.append("]")
+            lines += [f"# 제거: {selector!r}" for selector in removed]
+            lines.append("")
+        return "\n".join(lines)
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="저장된 페이지 캡처로 셀렉터 적중률 측정")
+    parser.add_argument('captures', nargs='*', help="저장된 HTML 파일 (기본: normal body.html, script body.html)")
+    parser.add_argument('--output', help="정리된 셀렉터 표를 저장할 경로 (없으면 화면에 출력)")
+    parser.add_argument('--page', choices=[LECTURE_PAGE, MY_LEARNING_PAGE], default=LECTURE_PAGE,
+                        help="캡처한 페이지 종류 (이 페이지용 목록만 정리, 기본: lecture)")
+    args = parser.parse_args()
+
+    captures = [Path(path) for path in args.captures] or [Config.BASE_DIR / name for name in DEFAULT_CAPTURES]
+    missing = [str(path) for path in captures if not path.exists()]
+    if missing:
+        print(f"❌ 캡처 파일을 찾을 수 없음: {', '.join(missing)}")
+        return
+
+    coverage = SelectorCoverage(captures, page=args.page)
+    coverage.run()
+    print(coverage.report())
+    print()
+
+    table = coverage.pruned_table()
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(table)
+        print(f"💾 정리된 셀렉터 표 저장: {args.output}")
+    else:
+        print(table)
+
+
+if __name__ == "__main__":
+    main()
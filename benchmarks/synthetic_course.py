@@ -0,0 +1,226 @@
+"""
+합성 대형 강의 생성기 (실제 Udemy 마크업 형태)
+
+저장된 캡처("normal body.html", "script body.html")와 같은 구조로 임의 크기의
+course-taking 페이지, 트랜스크립트 패널, 스크래퍼 출력 폴더, Course 모델을 만듭니다.
+
+    python -m benchmarks.synthetic_course page.html --sections 200 --lectures 50 --cues 1000
+"""
+
+import argparse
+import html
+import json
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from core.models import Course, Section, Lecture, SubtitleTrack
+from utils.file_utils import sanitize_filename
+
+# 비디오가 아닌 항목 비율 (실제 캡처의 문서/퀴즈 비율과 비슷하게)
+_NON_VIDEO_ICONS = [("#icon-article", 0.08), ("#icon-quiz", 0.03), ("#icon-file", 0.02)]
+
+_WORDS = (
+    "스프링 부트 컨트롤러 서비스 리포지토리 트랜잭션 의존성 주입 애노테이션 설정 테스트 "
+    "Spring Boot Bean REST API JPA Hibernate 엔티티 쿼리 데이터베이스 보안 인증 토큰 "
+    "요청 응답 예외 처리 로깅 배포 컨테이너 Docker 프로필 속성 빌드 Maven Gradle"
+).split()
+
+_PAGE_HEAD = (
+    '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>{title} | Udemy</title></head>'
+    '<body><div class="ud-main-content-wrapper"><div class="ud-main-content">'
+    '<div class="ud-app-loader ud-component--course-taking--app ud-app-loaded" data-module-id="course-taking"'
+    ' data-module-args="{module_args}">'
+    '<div class="app--row--E-WFM"><div class="video-player--container--YDQRW">'
+    '<video class="video-player--video-player--HiAnq" preload="auto"></video>'
+    '<div class="popper-module--popper--mM5Ie"><button type="button" aria-expanded="{expanded}" data-purpose="transcript-toggle"'
+    ' class="ud-btn ud-btn-small ud-btn-ghost ud-btn-text-sm control-bar-dropdown--trigger--FnmP-">'
+    '<svg aria-label="사이드바 영역의 트랜스크립트" role="img" focusable="false" class="ud-icon ud-icon-medium">'
+    '<use xlink:href="#icon-transcript"></use></svg></button></div></div></div>'
+)
+
+_SECTION_HEAD = (
+    '<div data-purpose="section-panel-{idx}" class="accordion-panel-module--panel--Eb0it section--section--yXfqc">'
+    '<div class="ud-btn ud-btn-medium ud-btn-link ud-heading-md ud-accordion-panel-toggler">'
+    '<div data-purpose="section-heading" class="section--section-heading--gDf8W"><div class="section--flex--B9xUV">'
+    '<h3 class="ud-accordion-panel-heading"><button type="button" aria-disabled="false" aria-expanded="{expanded}"'
+    ' class="ud-btn ud-btn-medium ud-btn-link ud-heading-md js-panel-toggler">'
+    '<span class="ud-accordion-panel-title"><span class="truncate-with-tooltip--ellipsis--YJw4N">섹션 {number}: {title}</span>'
+    '</span></button></h3><div class="ud-text-xs section--header-subtitle-row--vbUGu" data-purpose="section-duration">'
+    '<span aria-hidden="true">0 / {count} | {minutes}분</span></div></div></div></div>'
+    '<div class="accordion-panel-module--content-wrapper--TkHqe" aria-hidden="{hidden}" role="group">'
+    '<div class="ud-accordion-panel-content accordion-panel-module--content--0dD7R"><ul class="ud-unstyled-list">'
+)
+
+_ITEM = (
+    '<li aria-current="false" class="curriculum-item-link--curriculum-item--OVP5S">'
+    '<div data-purpose="curriculum-item-{section}-{item}" class="item-link item-link--common--j8WLy ud-custom-focus-visible" role="">'
+    '<div><label class="curriculum-item-link--progress-toggle--f0M8W ud-toggle-input-container ud-text-sm">'
+    '<input data-purpose="progress-toggle-button" class="ud-sr-only ud-real-toggle-input" type="checkbox"></label></div>'
+    '<span class="ud-sr-only">재생</span><div class="curriculum-item-link--item-container--HFnn0">'
+    '<div class="ud-text-sm ud-focus-visible-target"><div class="curriculum-item-link--curriculum-item-title--VBsdR">'
+    '<span class="curriculum-item-link--curriculum-item-title-content--S-urg"><span class="truncate-with-tooltip--ellipsis--YJw4N">'
+    '<span data-purpose="item-title">{number}. {title}</span></span></span></div></div>'
+    '<div class="curriculum-item-link--bottom-row--AVBnl"><div class="ud-text-xs curriculum-item-link--metadata--XK804">'
+    '<button type="button" aria-label="재생 {title}" class="ud-btn ud-btn-medium ud-btn-link ud-btn-text-sm">'
+    '<svg aria-hidden="true" focusable="false" class="ud-icon ud-icon-xsmall"><use xlink:href="{icon}"></use></svg></button>'
+    '<span>{minutes}분</span></div></div></div></div></li>'
+)
+
+_CUE = (
+    '<div class="transcript--cue-container--Vuwj6"><p data-purpose="transcript-cue" class="transcript--underline-cue---xybZ"'
+    ' role="button" tabindex="-1"><span data-purpose="cue-text" class="">{text}</span></p></div>'
+)
+
+
+@dataclass(slots=True)
+class CourseShape:
+    """합성 강의 크기"""
+    sections: int
+    lectures: int  # 섹션당 항목 수
+    cues: int  # 강의당 cue 수
+    seed: int = 0
+
+    @property
+    def label(self) -> str:
+        return f"{self.sections}x{self.lectures}x{self.cues}"
+
+    @property
+    def total_lectures(self) -> int:
+        return self.sections * self.lectures
+
+    @classmethod
+    def parse(cls, text: str) -> 'CourseShape':
+        """"200x50x1000" 형식"""
+        sections, lectures, cues = (int(part) for part in text.lower().split("x"))
+        return cls(sections, lectures, cues)
+
+
+class SyntheticCourse:
+    """크기(CourseShape)로부터 결정적으로 같은 제목/cue를 만드는 생성기"""
+
+    def __init__(self, shape: CourseShape):
+        self.shape = shape
+        self.title = f"합성 강의 {shape.label}"
+
+    def _rng(self, *key) -> random.Random:
+        return random.Random(":".join(str(part) for part in (self.shape.seed,) + key))
+
+    def _sentence(self, rng: random.Random, words: int) -> str:
+        return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+    def section_title(self, section_idx: int) -> str:
+        return self._sentence(self._rng('section', section_idx), 4)
+
+    def lecture_title(self, section_idx: int, lecture_idx: int) -> str:
+        return self._sentence(self._rng('lecture', section_idx, lecture_idx), 5)
+
+    def lecture_icon(self, section_idx: int, lecture_idx: int) -> str:
+        roll = self._rng('icon', section_idx, lecture_idx).random()
+        for icon, ratio in _NON_VIDEO_ICONS:
+            if roll < ratio:
+                return icon
+            roll -= ratio
+        return "#icon-video"
+
+    def lecture_minutes(self, section_idx: int, lecture_idx: int) -> int:
+        return self._rng('minutes', section_idx, lecture_idx).randint(1, 25)
+
+    def cues(self, section_idx: int = 0, lecture_idx: int = 0) -> Iterator[str]:
+        rng = self._rng('cues', section_idx, lecture_idx)
+        for _ in range(self.shape.cues):
+            yield self._sentence(rng, rng.randint(5, 14))
+
+    def iter_page(self, transcript_open: bool = True, expanded_sections: int = -1) -> Iterator[str]:
+        """course-taking 페이지 HTML 조각 (expanded_sections=-1이면 모든 섹션 펼침)"""
+        module_args = html.escape(json.dumps({'initialCurriculumItemType': "lecture", 'useCache': True}), quote=True)
+        yield _PAGE_HEAD.format(title=html.escape(self.title), module_args=module_args,
+                                expanded=str(transcript_open).lower())
+
+        yield '<div class="app--row--E-WFM"><div data-purpose="curriculum-section-container">'
+        for section_idx in range(self.shape.sections):
+            expanded = expanded_sections < 0 or section_idx < expanded_sections
+            minutes = sum(self.lecture_minutes(section_idx, idx) for idx in range(self.shape.lectures))
+            yield _SECTION_HEAD.format(idx=section_idx, number=section_idx + 1,
+                                       title=html.escape(self.section_title(section_idx)),
+                                       count=self.shape.lectures, minutes=minutes,
+                                       expanded=str(expanded).lower(), hidden=str(not expanded).lower())
+            if expanded:
+                for lecture_idx in range(self.shape.lectures):
+                    yield _ITEM.format(section=section_idx, item=lecture_idx, number=lecture_idx + 1,
+                                       title=html.escape(self.lecture_title(section_idx, lecture_idx)),
+                                       icon=self.lecture_icon(section_idx, lecture_idx),
+                                       minutes=self.lecture_minutes(section_idx, lecture_idx))
+            yield '</ul></div></div></div>'
+        yield '</div></div>'
+
+        if transcript_open:
+            yield ('<div class="app--row--E-WFM app--dashboard--Z4Zxm"><div class="dashboard-transcript--transcript-panel--VIxtH"'
+                   ' data-purpose="transcript-panel"><div class="transcript--transcript-panel--JLceZ" data-purpose="transcript-panel" dir="auto">')
+            for text in self.cues():
+                yield _CUE.format(text=html.escape(text))
+            yield '</div></div></div>'
+
+        yield '</div></div></div></body></html>'
+
+    def write_page(self, path: Path, **kwargs) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.writelines(self.iter_page(**kwargs))
+        return path
+
+    def write_transcripts(self, output_dir: Path) -> Path:
+        """TranscriptScraper와 같은 폴더 구조로 강의별 자막 파일 저장 → 강의 폴더"""
+        course_dir = Path(output_dir) / sanitize_filename(self.title)
+        for section_idx in range(self.shape.sections):
+            section_dir = course_dir / f"Section_{section_idx + 1:02d}_{sanitize_filename(self.section_title(section_idx))}"
+            section_dir.mkdir(parents=True, exist_ok=True)
+            for lecture_idx in range(self.shape.lectures):
+                if self.lecture_icon(section_idx, lecture_idx) != "#icon-video":
+                    continue
+                title = sanitize_filename(self.lecture_title(section_idx, lecture_idx))
+                with open(section_dir / f"{lecture_idx + 1:02d}_{title}.txt", 'w', encoding='utf-8') as f:
+                    f.write("\n".join(self.cues(section_idx, lecture_idx)))
+        return course_dir
+
+    def build_course(self, with_subtitles: bool = True) -> Course:
+        """자막까지 채운 Course 모델 (MarkdownGenerator 입력)"""
+        course = Course(title=self.title)
+        for section_idx in range(self.shape.sections):
+            section = Section(title=self.section_title(section_idx), section_index=section_idx)
+            for lecture_idx in range(self.shape.lectures):
+                lecture = Lecture(title=self.lecture_title(section_idx, lecture_idx),
+                                  duration=f"{self.lecture_minutes(section_idx, lecture_idx)}분",
+                                  lecture_index=lecture_idx)
+                if with_subtitles and self.lecture_icon(section_idx, lecture_idx) == "#icon-video":
+                    track = SubtitleTrack()
+                    for cue_idx, text in enumerate(self.cues(section_idx, lecture_idx)):
+                        start = cue_idx * 4.0
+                        track.add(f"{int(start) // 3600:02d}:{int(start) // 60 % 60:02d}:{int(start) % 60:02d}",
+                                  text, start, start + 4.0)
+                    lecture.subtitles = track
+                    lecture.has_subtitles = True
+                section.lectures.append(lecture)
+            course.sections.append(section)
+        return course
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="합성 course-taking 페이지 생성")
+    parser.add_argument('path', help="저장할 HTML 파일")
+    parser.add_argument('--sections', type=int, default=200)
+    parser.add_argument('--lectures', type=int, default=50)
+    parser.add_argument('--cues', type=int, default=1000)
+    parser.add_argument('--closed', action='store_true', help="트랜스크립트 패널 닫힌 상태(normal body)로 생성")
+    args = parser.parse_args()
+
+    course = SyntheticCourse(CourseShape(args.sections, args.lectures, args.cues))
+    path = course.write_page(Path(args.path), transcript_open=not args.closed)
+    print(f"✅ {path} 생성 ({path.stat().st_size / 1024 / 1024:.1f}MB, {course.shape.total_lectures}개 항목)")
+
+
+if __name__ == "__main__":
+    main()
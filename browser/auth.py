@@ -14,13 +14,15 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 from config import Config
+from utils.logger import as_logger
+from utils.rate_limiter import get_scheduler, NAVIGATION
 
 class UdemyAuth:
     def __init__(self, headless=False, log_callback=None):
         self.driver = None
         self.wait = None
         self.headless = headless
-        self.log_callback = log_callback or print
+        self.log_callback = as_logger(log_callback)
         self.is_logged_in = False
 
     def setup_driver(self):
@@ -116,6 +118,7 @@ class UdemyAuth:
             self.log_callback("💾 저장된 세션 로드 시도...")
 
             # Udemy 메인 페이지로 이동
+            get_scheduler().acquire(NAVIGATION)
             self.driver.get(Config.UDEMY_BASE_URL)
             time.sleep(2)
 
@@ -197,6 +200,7 @@ class UdemyAuth:
 
             # 2. 메인 페이지로 이동 후 로그인 버튼 클릭
             self.log_callback("🏠 Udemy 메인 페이지로 이동...")
+            get_scheduler().acquire(NAVIGATION)
             self.driver.get(Config.UDEMY_BASE_URL)
             time.sleep(3)
 
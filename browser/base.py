@@ -4,19 +4,44 @@
 
 import time
 import random
+from contextlib import contextmanager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from utils.logger import as_logger
+from utils.rate_limiter import get_scheduler, NAVIGATION
+
+_DEFAULT_SCRIPT_TIMEOUT = 30  # WebDriver 기본 비동기 스크립트 시간 제한 (초)
+
+
+@contextmanager
+def script_timeout(driver, seconds: float):
+    """비동기 스크립트 시간 제한을 잠시 바꾸고 원래 값으로 복원 (드라이버 전체 설정이므로)"""
+    try:
+        previous = driver.timeouts.script
+    except Exception:
+        previous = _DEFAULT_SCRIPT_TIMEOUT
+    driver.set_script_timeout(seconds)
+    try:
+        yield
+    finally:
+        try:
+            driver.set_script_timeout(previous)
+        except Exception:
+            pass  # 세션이 끊긴 경우
 
 
 class BrowserBase:
     """모든 브라우저 작업 클래스의 베이스 클래스"""
 
+    # 차단/속도 제한 페이지 제목 표식
+    THROTTLE_TITLE_MARKERS = ("429", "too many requests", "access denied", "just a moment", "rate limit")
+
     def __init__(self, driver, wait, log_callback=None):
         self.driver = driver
         self.wait = wait
-        self.log_callback = log_callback or print
+        self.log_callback = as_logger(log_callback)
 
     def human_like_typing(self, element, text):
         """인간처럼 타이핑 시뮬레이션"""
@@ -30,6 +55,28 @@ class BrowserBase:
         element.click()
         time.sleep(random.uniform(0.5, 1.5))
 
+    def navigate(self, url) -> bool:
+        """요청 스케줄러 토큰을 받은 뒤 페이지 이동 (차단 페이지면 속도를 낮추고 False)"""
+        scheduler = get_scheduler()
+        scheduler.acquire(NAVIGATION)
+        self.driver.get(url)
+
+        if self.is_throttled_page():
+            rate = scheduler.report_throttled(NAVIGATION)
+            self.log_callback.warning(f"🐢 차단/속도 제한 페이지 감지 - 이동 속도 분당 {rate:.1f}회로 감소")
+            return False
+
+        scheduler.report_success(NAVIGATION)
+        return True
+
+    def is_throttled_page(self) -> bool:
+        """현재 페이지가 429/차단 페이지인지 (제목 기준)"""
+        try:
+            title = (self.driver.title or "").lower()
+        except Exception:
+            return False
+        return any(marker in title for marker in self.THROTTLE_TITLE_MARKERS)
+
     def wait_for_element(self, selector, timeout=10, by=By.CSS_SELECTOR):
         """요소 대기"""
         try:
@@ -46,6 +93,33 @@ class BrowserBase:
         except TimeoutException:
             return None
 
+    def wait_for_selectors_event(self, selectors, timeout=10) -> bool:
+        """MutationObserver로 모든 CSS 선택자가 나타나는 즉시 반환 (폴링 없음)"""
+        script = """
+            var selectors = arguments[0];
+            var timeoutMs = arguments[1];
+            var done = arguments[arguments.length - 1];
+            function ready() {
+                if (document.readyState === 'loading') return false;
+                for (var i = 0; i < selectors.length; i++) {
+                    if (!document.querySelector(selectors[i])) return false;
+                }
+                return true;
+            }
+            if (ready()) { done(true); return; }
+            var observer = new MutationObserver(function () {
+                if (ready()) { observer.disconnect(); clearTimeout(timer); done(true); }
+            });
+            observer.observe(document.documentElement, {childList: true, subtree: true});
+            var timer = setTimeout(function () { observer.disconnect(); done(ready()); }, timeoutMs);
+        """
+        try:
+            with script_timeout(self.driver, timeout + 5):
+                return bool(self.driver.execute_async_script(script, list(selectors), int(timeout * 1000)))
+        except Exception:
+            # 페이지 전환 중 스크립트가 끊기면 일반 대기로 폴백
+            return all(self.wait_for_element(selector, timeout) for selector in selectors)
+
     def find_element_safe(self, selector, by=By.CSS_SELECTOR):
         """안전한 요소 찾기 (예외 없이)"""
         try:
@@ -64,7 +138,7 @@ class BrowserBase:
         """여러 선택자로 클릭 시도"""
         for i, selector in enumerate(selectors):
             try:
-                self.log_callback(f"🔍 {element_name} 클릭 시도 {i+1}/{len(selectors)}: {selector}")
+                self.log_callback.debug("🔍 %s 클릭 시도 %s/%s: %s", element_name, i+1, len(selectors), selector)
 
                 if selector.startswith("//"):
                     elements = self.find_elements_safe(selector, By.XPATH)
@@ -78,11 +152,11 @@ class BrowserBase:
                             self.log_callback(f"✅ {element_name} 클릭 완료")
                             return True
                         except Exception as e:
-                            self.log_callback(f"   요소 {j+1} 클릭 실패: {str(e)}")
+                            self.log_callback.debug("   요소 %s 클릭 실패: %s", j+1, e)
                             continue
 
             except Exception as e:
-                self.log_callback(f"   선택자 {i+1} 실패: {str(e)}")
+                self.log_callback.debug("   선택자 %s 실패: %s", i+1, e)
                 continue
 
         self.log_callback(f"❌ 모든 {element_name} 선택자 실패")
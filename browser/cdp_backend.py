@@ -0,0 +1,159 @@
+"""
+CDP 백엔드 (Selenium 대신 asyncio 웹소켓으로 자막 추출)
+
+TranscriptExtractor / SmartWaiter가 쓰는 동작 중 자막 추출에 필요한 부분만
+CDPPage 위에 스크립트로 구현하고, 여러 탭을 한 이벤트 루프에서 동시에 돌립니다.
+"""
+
+import asyncio
+import time
+from typing import Dict, Hashable, List, Optional, Tuple
+from config import Config
+from utils.logger import as_logger
+from utils.rate_limiter import get_scheduler, NAVIGATION
+from utils.run_metrics import get_metrics
+from .cdp_client import CDPBrowser, CDPError, CDPPage
+from .selectors import UdemySelectors
+
+
+# 모든 선택자가 나타날 때까지 MutationObserver로 대기 (SmartWaiter 대응)
+_WAIT_SELECTORS_FN = """
+function (selectors, anyOf, timeoutMs) {
+    function ready() {
+        var found = selectors.map(function (s) { return !!document.querySelector(s); });
+        return anyOf ? found.some(Boolean) : found.every(Boolean);
+    }
+    return new Promise(function (resolve) {
+        if (ready()) { resolve(true); return; }
+        var observer = new MutationObserver(function () {
+            if (ready()) { observer.disconnect(); clearTimeout(timer); resolve(true); }
+        });
+        observer.observe(document.documentElement, {childList: true, subtree: true});
+        var timer = setTimeout(function () { observer.disconnect(); resolve(ready()); }, timeoutMs);
+    });
+}
+"""
+
+# 트랜스크립트 버튼이 닫혀 있으면 클릭 (TranscriptExtractor.open_transcript_panel 대응)
+_OPEN_PANEL_FN = """
+function (buttonSelectors) {
+    for (var i = 0; i < buttonSelectors.length; i++) {
+        var button = document.querySelector(buttonSelectors[i]);
+        if (!button) continue;
+        if (button.getAttribute('aria-expanded') !== 'true') button.click();
+        return true;
+    }
+    return false;
+}
+"""
+
+# cue 텍스트를 한 번에 수집 (TranscriptExtractor.extract_transcript_content 대응)
+_EXTRACT_CUES_FN = """
+function (cueSelectors, textSelectors) {
+    for (var i = 0; i < cueSelectors.length; i++) {
+        var cues = document.querySelectorAll(cueSelectors[i]);
+        if (!cues.length) continue;
+        var lines = [];
+        cues.forEach(function (cue) {
+            var textEl = null;
+            for (var j = 0; j < textSelectors.length && !textEl; j++) textEl = cue.querySelector(textSelectors[j]);
+            var text = (textEl || cue).textContent.trim();
+            if (text) lines.push(text);
+        });
+        return lines;
+    }
+    return [];
+}
+"""
+
+class CDPLectureSurface:
+    """CDPPage 위의 강의 페이지 동작"""
+
+    def __init__(self, page: CDPPage):
+        self.page = page
+
+    async def wait_for_selectors(self, selectors: List[str], timeout: float = 10, any_of: bool = False) -> bool:
+        return bool(await self.page.call(_WAIT_SELECTORS_FN, list(selectors), any_of, int(timeout * 1000),
+                                         await_promise=True, timeout=timeout + 5))
+
+    async def wait_for_video_ready(self, timeout: float = 15) -> bool:
+        return await self.wait_for_selectors(UdemySelectors.VIDEO_AREAS, timeout, any_of=True)
+
+    async def open_transcript_panel(self, timeout: float = 10) -> bool:
+        if not await self.wait_for_selectors(UdemySelectors.TRANSCRIPT_BUTTONS, timeout, any_of=True):
+            return False
+        return bool(await self.page.call(_OPEN_PANEL_FN, UdemySelectors.TRANSCRIPT_BUTTONS))
+
+    async def extract_transcript(self, timeout: float = 10) -> Optional[str]:
+        if not await self.wait_for_selectors(UdemySelectors.TRANSCRIPT_CUES, timeout, any_of=True):
+            return None
+        lines = await self.page.call(_EXTRACT_CUES_FN, UdemySelectors.TRANSCRIPT_CUES, UdemySelectors.TRANSCRIPT_CUE_TEXT)
+        return "\\n".join(lines) if lines else None
+
+
+class CDPTranscriptBackend:
+    """디버그 Chrome에 탭 여러 개를 열어 강의 자막을 동시에 추출"""
+
+    def __init__(self, port: int, log_callback=None, concurrency: Optional[int] = None):
+        self.port = port
+        self.log_callback = as_logger(log_callback)
+        self.concurrency = max(1, concurrency or Config.CDP_CONCURRENCY)
+
+    def extract_transcripts(self, urls: Dict[Hashable, str]) -> Dict[Hashable, Tuple[Optional[str], str]]:
+        """{키: 강의 URL} → {키: (자막 또는 None, 실패 단계)} (동기 호출용)"""
+        return asyncio.run(self._extract_all(urls))
+
+    async def _extract_all(self, urls: Dict[Hashable, str]) -> Dict[Hashable, Tuple[Optional[str], str]]:
+        browser = CDPBrowser(self.port)
+        await browser.connect()
+        queue: asyncio.Queue = asyncio.Queue()
+        for key, url in urls.items():
+            queue.put_nowait((key, url))
+
+        results: Dict[Hashable, Tuple[Optional[str], str]] = {}
+        try:
+            pages = await asyncio.gather(*(browser.new_page() for _ in range(min(self.concurrency, len(urls)))))
+            self.log_callback(f"⚡ CDP 백엔드: 탭 {len(pages)}개로 강의 {len(urls)}개 추출")
+            await asyncio.gather(*(self._worker(CDPLectureSurface(page), queue, results) for page in pages))
+        finally:
+            await browser.close()
+        return results
+
+    async def _worker(self, surface: CDPLectureSurface, queue: asyncio.Queue, results: dict):
+        while not queue.empty():
+            key, url = queue.get_nowait()
+            with get_metrics().busy():
+                results[key] = await self._extract_one(surface, url)
+
+    async def _extract_one(self, surface: CDPLectureSurface, url: str) -> Tuple[Optional[str], str]:
+        """강의 하나 (이동 → 플레이어 → 패널 → cue), 실패 시 단계 이름과 함께 None"""
+        stage = 'page_load'
+        metrics = get_metrics()
+        try:
+            # 공용 토큰 버킷 (블로킹 대기는 스레드로 넘겨 이벤트 루프를 막지 않음)
+            await asyncio.to_thread(get_scheduler().acquire, NAVIGATION)
+            started = time.perf_counter()
+            if not await surface.page.navigate(url, timeout=Config.WAIT_TIMEOUT * 3):
+                return None, stage
+            if not await surface.wait_for_video_ready(timeout=15):
+                return None, stage
+            metrics.record_stage('page_load', time.perf_counter() - started)
+
+            stage = 'panel_open'
+            started = time.perf_counter()
+            if not await surface.open_transcript_panel(timeout=Config.WAIT_TIMEOUT):
+                return None, stage
+            metrics.record_stage('panel_open', time.perf_counter() - started)
+
+            stage = 'extraction'
+            started = time.perf_counter()
+            content = await surface.extract_transcript(timeout=Config.WAIT_TIMEOUT)
+            metrics.record_stage('transcript', time.perf_counter() - started)
+            return content, stage
+        except (CDPError, asyncio.TimeoutError) as e:
+            self.log_callback.debug("CDP 추출 실패 (%s): %s", url, e, stage=stage)
+            return None, stage
+        except Exception as e:
+            # 예상 못한 오류도 이 강의만 실패로 돌려 다른 탭의 결과는 유지
+            self.log_callback.warning(f"⚠️ CDP 추출 중 오류 ({url}): {str(e)}", stage=stage)
+            return None, stage
@@ -0,0 +1,220 @@
+"""
+asyncio 웹소켓 Chrome DevTools Protocol 클라이언트
+
+Selenium WebDriver의 요청당 HTTP 왕복 대신 탭(target)마다 웹소켓 하나로 명령을
+파이프라이닝하고 이벤트를 구독합니다. 하나의 이벤트 루프에서 여러 탭을 동시에 다룹니다.
+
+    browser = CDPBrowser(9222)
+    await browser.connect()
+    page = await browser.new_page()
+    await page.navigate(url)
+    title = await page.evaluate("document.title")
+"""
+
+import asyncio
+import itertools
+import json
+from typing import Any, Callable, Dict, List, Optional
+from urllib.request import urlopen
+
+try:
+    import websockets
+except ImportError:  # 선택 의존성 (CDP 백엔드에서만 사용)
+    websockets = None
+
+
+class CDPError(Exception):
+    """CDP 명령 오류 응답 또는 페이지 스크립트 예외"""
+
+
+class CDPConnection:
+    """웹소켓 하나 위의 CDP 세션 (명령 파이프라이닝 + 이벤트 디스패치)"""
+
+    def __init__(self, ws_url: str):
+        self.ws_url = ws_url
+        self._ws = None
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._listeners: Dict[str, List[Callable[[dict], Any]]] = {}
+        self._reader: Optional[asyncio.Task] = None
+
+    async def connect(self):
+        if websockets is None:
+            raise CDPError("websockets 패키지가 필요합니다 (pip install websockets)")
+        self._ws = await websockets.connect(self.ws_url, max_size=None)
+        self._reader = asyncio.get_running_loop().create_task(self._read_loop())
+
+    async def close(self):
+        if self._reader:
+            self._reader.cancel()
+        if self._ws:
+            await self._ws.close()
+        self._fail_pending(CDPError("연결 종료"))
+
+    async def send(self, method: str, params: Optional[dict] = None, timeout: float = 30) -> dict:
+        """명령 전송 후 응답 대기 (여러 send를 동시에 await하면 파이프라이닝됨)"""
+        message_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        try:
+            try:
+                await self._ws.send(json.dumps({'id': message_id, 'method': method, 'params': params or {}}))
+            except Exception as e:
+                # 탭/브라우저가 닫혀 소켓이 끊긴 경우 (websockets.ConnectionClosed 등)
+                raise CDPError(f"명령 전송 실패 ({method}): {e}") from e
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(message_id, None)
+
+    def on(self, event: str, callback: Callable[[dict], Any]):
+        """이벤트 구독 (예: 'Page.loadEventFired')"""
+        self._listeners.setdefault(event, []).append(callback)
+
+    def off(self, event: str, callback: Callable[[dict], Any]):
+        if callback in self._listeners.get(event, []):
+            self._listeners[event].remove(callback)
+
+    def expect_event(self, event: str, predicate: Optional[Callable[[dict], bool]] = None) -> asyncio.Future:
+        """조건에 맞는 다음 이벤트의 Future (명령을 보내기 전에 미리 등록)"""
+        future = asyncio.get_running_loop().create_future()
+
+        def listener(params):
+            if not future.done() and (predicate is None or predicate(params)):
+                future.set_result(params)
+
+        self.on(event, listener)
+        future.add_done_callback(lambda _: self.off(event, listener))
+        return future
+
+    async def wait_for_event(self, event: str, timeout: float = 30,
+                             predicate: Optional[Callable[[dict], bool]] = None) -> dict:
+        """조건에 맞는 이벤트 하나를 기다림"""
+        return await asyncio.wait_for(self.expect_event(event, predicate), timeout)
+
+    async def _read_loop(self):
+        error = CDPError("연결 종료")
+        try:
+            async for raw in self._ws:
+                message = json.loads(raw)
+                if 'id' in message:
+                    future = self._pending.get(message['id'])
+                    if future and not future.done():
+                        if 'error' in message:
+                            future.set_exception(CDPError(message['error'].get('message', str(message['error']))))
+                        else:
+                            future.set_result(message.get('result', {}))
+                else:
+                    for callback in list(self._listeners.get(message.get('method'), [])):
+                        callback(message.get('params', {}))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = CDPError(f"웹소켓 오류: {e}")
+        finally:
+            # 소켓이 정상 종료돼도 응답을 기다리는 send가 시간 초과까지 멈추지 않도록 바로 실패 처리
+            self._fail_pending(error)
+
+    def _fail_pending(self, error: Exception):
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+
+class CDPPage:
+    """탭 하나 (Runtime/Page 도메인의 작은 표면)"""
+
+    def __init__(self, target_id: str, connection: CDPConnection, owned: bool = False):
+        self.target_id = target_id
+        self.connection = connection
+        self.owned = owned  # 이 클라이언트가 만든 탭이면 정리 시 닫음
+
+    async def enable(self):
+        await asyncio.gather(
+            self.connection.send('Page.enable'),
+            self.connection.send('Runtime.enable')
+        )
+
+    async def evaluate(self, expression: str, await_promise: bool = False, timeout: float = 30) -> Any:
+        """식 평가 후 값 반환 (JSON 직렬화 가능한 값만)"""
+        result = await self.connection.send('Runtime.evaluate', {
+            'expression': expression,
+            'awaitPromise': await_promise,
+            'returnByValue': True
+        }, timeout=timeout)
+        if 'exceptionDetails' in result:
+            details = result['exceptionDetails']
+            raise CDPError(details.get('exception', {}).get('description') or details.get('text', "스크립트 오류"))
+        return result.get('result', {}).get('value')
+
+    async def call(self, function_source: str, *args, await_promise: bool = False, timeout: float = 30) -> Any:
+        """function(...) 소스를 JSON 인자로 호출"""
+        expression = f"({function_source}).apply(null, {json.dumps(list(args), ensure_ascii=False)})"
+        return await self.evaluate(expression, await_promise=await_promise, timeout=timeout)
+
+    async def navigate(self, url: str, timeout: float = 30) -> bool:
+        """이동 후 load 이벤트까지 대기"""
+        loaded = self.connection.expect_event('Page.loadEventFired')
+        result = await self.connection.send('Page.navigate', {'url': url})
+        if result.get('errorText'):
+            loaded.cancel()
+            raise CDPError(result['errorText'])
+        try:
+            await asyncio.wait_for(loaded, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def current_url(self) -> str:
+        return await self.evaluate("location.href")
+
+
+class CDPBrowser:
+    """디버그 포트로 열린 Chrome (브라우저 수준 연결 + 탭 생성/종료)"""
+
+    def __init__(self, port: int = 9222, host: str = "127.0.0.1"):
+        self.port = port
+        self.host = host
+        self.connection: Optional[CDPConnection] = None
+        self.pages: List[CDPPage] = []
+
+    def _http_json(self, path: str):
+        with urlopen(f"http://{self.host}:{self.port}{path}", timeout=5) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+    async def connect(self):
+        version = await asyncio.to_thread(self._http_json, "/json/version")
+        self.connection = CDPConnection(version['webSocketDebuggerUrl'])
+        await self.connection.connect()
+
+    async def new_page(self, url: str = "about:blank") -> CDPPage:
+        """새 탭을 만들고 연결"""
+        result = await self.connection.send('Target.createTarget', {'url': url})
+        return await self.attach(result['targetId'], owned=True)
+
+    async def attach(self, target_id: str, owned: bool = False) -> CDPPage:
+        """기존 탭에 연결"""
+        connection = CDPConnection(f"ws://{self.host}:{self.port}/devtools/page/{target_id}")
+        await connection.connect()
+        page = CDPPage(target_id, connection, owned)
+        await page.enable()
+        self.pages.append(page)
+        return page
+
+    async def close_page(self, page: CDPPage):
+        """탭 연결 해제 (직접 만든 탭이면 닫기)"""
+        await page.connection.close()
+        if page.owned:
+            try:
+                await self.connection.send('Target.closeTarget', {'targetId': page.target_id})
+            except CDPError:
+                pass
+        if page in self.pages:
+            self.pages.remove(page)
+
+    async def close(self):
+        """연결만 정리 (브라우저와 사용자가 연 탭은 그대로)"""
+        for page in list(self.pages):
+            await self.close_page(page)
+        if self.connection:
+            await self.connection.close()
@@ -8,13 +8,206 @@ from typing import Optional, List
 from selenium.webdriver.common.by import By
 from bs4 import BeautifulSoup
 from config import Config
-from core.models import Course, Section, Lecture
+from core.models import Course, Section, Lecture, EnrolledCourse
+from utils.course_catalog import CourseCatalog
+from utils.fuzzy_matcher import FuzzyMatcher, normalize, similarity
+from utils.course_reference import CourseReference, parse_course_reference
+from utils.profiler import profile_stage
 from .base import BrowserBase
+from .course_metadata import CourseMetadataReader
+from .udemy_api import UdemyApiClient
 
 
 class CourseFinder(BrowserBase):
+    COURSE_PAGE_SELECTOR = "div[data-module-id='course-taking']"
+    COURSE_READY_SELECTORS = [COURSE_PAGE_SELECTOR, "div[data-purpose^='section-panel-']"]
+
     def __init__(self, driver, wait, log_callback=None):
         super().__init__(driver, wait, log_callback)
+        self.api = UdemyApiClient(driver, wait, log_callback)
+        self._catalog = None
+        self._matcher = None
+        self.last_course: Optional[Course] = None  # 마지막으로 연 강의
+
+    @property
+    def catalog(self) -> CourseCatalog:
+        """수강 강의 카탈로그 (최초 접근 시 로드)"""
+        if self._catalog is None:
+            self._catalog = CourseCatalog(log_callback=self.log_callback)
+        return self._catalog
+
+    def sync_course_catalog(self, full: bool = False) -> int:
+        """수강 강의 목록을 페이지 단위로 받아 카탈로그 동기화 (추가된 강의 수 반환)"""
+        catalog = self.catalog
+        full = full or len(catalog) == 0
+        self.log_callback(f"📚 강의 카탈로그 {'전체' if full else '증분'} 동기화 중...")
+        self._ensure_udemy_origin()
+
+        fetched = []
+        added = 0
+        for page in self.api.iter_subscribed_courses():
+            entries = [
+                EnrolledCourse.from_dict({
+                    'course_id': item['id'],
+                    'title': item.get('title', ""),
+                    'url': item.get('url', ""),
+                    'last_update_date': item.get('last_update_date')
+                })
+                for item in page if item.get('id') is not None
+            ]
+            if full:
+                fetched.extend(entries)
+                continue
+
+            # 최근 등록순이므로 새 강의가 없는 페이지를 만나면 중단
+            page_added = catalog.upsert(entries)
+            added += page_added
+            if page_added == 0:
+                break
+
+        if full:
+            if not fetched:
+                self.log_callback("⚠️ 수강 강의 목록을 가져오지 못했습니다.")
+                return 0
+            added = len(fetched)
+            catalog.replace_all(fetched)
+
+        catalog.mark_synced()
+        catalog.save()
+        self._matcher = None
+        self.log_callback(f"✅ 강의 카탈로그 동기화 완료: 총 {len(catalog)}개 (신규 {added}개)")
+        return added
+
+    def _ensure_udemy_origin(self) -> bool:
+        """API 호출(fetch)은 Udemy 페이지에서만 되므로 다른 페이지면 홈으로 이동"""
+        if self.driver.current_url.startswith(Config.UDEMY_BASE_URL):
+            return True
+        return self.navigate(Config.UDEMY_BASE_URL)
+
+    def select_course_from_catalog(self, course_name: str) -> Optional[Course]:
+        """카탈로그에서 강의를 찾아 수강 페이지로 바로 이동"""
+        if not Config.COURSE_CATALOG_ENABLED:
+            return None
+
+        try:
+            if len(self.catalog) == 0:
+                self.sync_course_catalog(full=True)
+
+            entry = self._find_in_catalog(course_name)
+            if not entry and self.sync_course_catalog() > 0:
+                entry = self._find_in_catalog(course_name)
+
+            if not entry:
+                self.log_callback(f"ℹ️ 카탈로그에서 '{course_name}' 강의를 찾지 못해 검색으로 진행")
+                return None
+
+            return self.open_enrolled_course(entry)
+
+        except Exception as e:
+            self.log_callback(f"⚠️ 카탈로그 조회 실패: {str(e)}")
+            return None
+
+    @property
+    def matcher(self) -> FuzzyMatcher:
+        """카탈로그 강의명 trigram 색인 (동기화 후 재생성)"""
+        if self._matcher is None:
+            self._matcher = FuzzyMatcher((entry.course_id, entry.title) for entry in self.catalog.entries())
+        return self._matcher
+
+    def suggest_courses(self, course_name: str, limit: int = 5, min_score: float = 0.2) -> List[EnrolledCourse]:
+        """입력과 비슷한 수강 강의 후보 (유사도 순)"""
+        entries = (self.catalog.get(result.key) for result in self.matcher.search(course_name, limit)
+                   if result.score >= min_score)
+        return [entry for entry in entries if entry]
+
+    def _log_suggestions(self, course_name: str):
+        """강의를 못 찾았을 때 카탈로그에서 비슷한 강의명 안내"""
+        if not Config.COURSE_CATALOG_ENABLED or len(self.catalog) == 0:
+            return
+        suggestions = self.suggest_courses(course_name, limit=3)
+        if suggestions:
+            self.log_callback("💡 비슷한 수강 강의:")
+            for i, entry in enumerate(suggestions):
+                self.log_callback(f"   {i+1}. {entry.title}")
+
+    def _find_in_catalog(self, course_name: str) -> Optional[EnrolledCourse]:
+        """카탈로그 항목 중 가장 유사한 강의 (모호하면 후보만 안내)"""
+        best, candidates = self.matcher.resolve(course_name)
+
+        if best:
+            self.log_callback(f"📚 카탈로그 일치 강의: '{best.title}' (유사도: {best.score:.2f})")
+            return self.catalog.get(best.key)
+
+        if candidates and candidates[0].score >= 0.3:
+            self.log_callback(f"⚠️ '{course_name}'과 비슷한 강의가 여러 개입니다. 더 구체적으로 입력해 주세요:")
+            for i, candidate in enumerate(candidates):
+                self.log_callback(f"   {i+1}. {candidate.title} (유사도: {candidate.score:.2f})")
+        return None
+
+    def open_enrolled_course(self, entry: EnrolledCourse) -> Optional[Course]:
+        """강의 수강 페이지로 직접 이동"""
+        if not self._open_course_page(entry.learn_url):
+            return None
+
+        return Course(
+            title=entry.title,
+            course_id=entry.course_id,
+            last_update_date=entry.last_update_date
+        )
+
+    def open_course_by_reference(self, reference: CourseReference) -> Optional[Course]:
+        """강의 URL/slug/ID로 My Learning 검색 없이 바로 이동"""
+        try:
+            self.log_callback(f"🔗 직접 입력된 강의: {reference}")
+
+            path = reference.learn_path
+            entry = None
+            if not path and reference.course_id is not None:
+                entry = self.catalog.get(reference.course_id) or self._lookup_course_by_id(reference.course_id)
+                # slug를 모르면 Udemy 리다이렉트 주소 사용
+                path = entry.learn_url if entry else f"/course-dashboard-redirect/?course_id={reference.course_id}"
+
+            if not self._open_course_page(path):
+                return None
+
+            if entry:
+                return Course(title=entry.title, course_id=entry.course_id, last_update_date=entry.last_update_date)
+
+            title = CourseMetadataReader(self.driver, self.wait, self.log_callback).read_course_title()
+            return Course(title=title or str(reference), course_id=reference.course_id)
+
+        except Exception as e:
+            self.log_callback(f"❌ 강의 직접 이동 실패: {str(e)}")
+            return None
+
+    def _lookup_course_by_id(self, course_id: int) -> Optional[EnrolledCourse]:
+        """강의 ID로 제목/URL 조회 (Udemy 페이지에서만 가능)"""
+        if 'udemy.com' not in self.driver.current_url:
+            return None
+        data = self.api.get_json(f"/courses/{course_id}/", {'fields[course]': 'id,title,url,last_update_date'})
+        if not data or not data.get('url'):
+            return None
+        return EnrolledCourse.from_dict({
+            'course_id': course_id,
+            'title': data.get('title', ""),
+            'url': data['url'],
+            'last_update_date': data.get('last_update_date')
+        })
+
+    def _open_course_page(self, path: str) -> bool:
+        """강의 페이지 이동 후 커리큘럼이 나타나는 즉시 반환"""
+        url = f"{Config.UDEMY_BASE_URL}{path}"
+        self.log_callback(f"🚀 강의 페이지로 직접 이동: {url}")
+        if not self.navigate(url):
+            self.log_callback("⚠️ 강의 페이지 대신 차단/속도 제한 페이지가 열림")
+            return False
+
+        if not self.wait_for_selectors_event(self.COURSE_READY_SELECTORS, timeout=Config.WAIT_TIMEOUT * 2):
+            self.log_callback(f"⚠️ 강의 페이지 로딩 확인 실패: {self.driver.current_url}")
+            return False
+
+        self.log_callback("✅ 강의 페이지 준비 완료")
+        return True
 
     def go_to_my_learning(self) -> bool:
         """로그인 상태 확인하고 '내 학습' 페이지로 이동"""
@@ -60,19 +253,19 @@ class CourseFinder(BrowserBase):
             button_clicked = False
             for i, selector in enumerate(my_learning_selectors):
                 try:
-                    self.log_callback(f"🔍 시도 {i+1}/{len(my_learning_selectors)}: {selector}")
+                    self.log_callback.debug("🔍 시도 %s/%s: %s", i+1, len(my_learning_selectors), selector)
 
                     if selector.startswith("//"):
                         elements = self.driver.find_elements(By.XPATH, selector)
                     else:
                         elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
 
-                    self.log_callback(f"   발견된 요소 수: {len(elements)}")
+                    self.log_callback.debug("   발견된 요소 수: %s", len(elements))
 
                     for j, button in enumerate(elements):
                         if button and button.is_displayed() and button.is_enabled():
                             try:
-                                self.log_callback(f"   요소 {j+1} 클릭 시도 중...")
+                                self.log_callback.debug("   요소 %s 클릭 시도 중...", j+1)
                                 button.click()
                                 self.log_callback("✅ '내 학습' 버튼 클릭 완료")
                                 button_clicked = True
@@ -85,24 +278,27 @@ class CourseFinder(BrowserBase):
                         break
 
                 except Exception as e:
-                    self.log_callback(f"   ❌ 선택자 실패: {str(e)}")
+                    self.log_callback.debug("   ❌ 선택자 실패: %s", e)
                     continue
 
             if not button_clicked:
                 # 페이지 정보 출력
                 self.log_callback("❌ 모든 '내 학습' 버튼 선택자 실패")
-                self.log_callback(f"🔍 현재 URL: {self.driver.current_url}")
-                self.log_callback(f"🔍 페이지 제목: {self.driver.title}")
+                if not self.log_callback.debug_enabled:
+                    return False
+
+                self.log_callback.debug("🔍 현재 URL: %s", self.driver.current_url)
+                self.log_callback.debug("🔍 페이지 제목: %s", self.driver.title)
 
                 # 페이지에 있는 모든 링크 텍스트 확인
                 links = self.driver.find_elements(By.TAG_NAME, "a")
-                self.log_callback(f"🔍 페이지의 모든 링크 개수: {len(links)}")
+                self.log_callback.debug("🔍 페이지의 모든 링크 개수: %s", len(links))
                 for i, link in enumerate(links[:10]):  # 처음 10개만
                     try:
                         text = link.text.strip()
                         href = link.get_attribute('href')
                         if text and href:
-                            self.log_callback(f"   링크 {i+1}: '{text}' -> {href}")
+                            self.log_callback.debug("   링크 %s: '%s' -> %s", i+1, text, href)
                     except:
                         continue
                 return False
@@ -127,6 +323,19 @@ class CourseFinder(BrowserBase):
         try:
             self.log_callback(f"🔍 강의 검색 시작: '{course_name}'")
 
+            # 0. URL/slug/ID는 바로 이동, 강의명은 로컬 카탈로그에서 먼저 찾기
+            reference = parse_course_reference(course_name)
+            if reference:
+                return self.open_course_by_reference(reference)
+
+            course = self.select_course_from_catalog(course_name)
+            if course:
+                return course
+
+            # 카탈로그에 없을 때만 My Learning으로 이동해 검색
+            if not self.go_to_my_learning():
+                return None
+
             # 1. 검색 입력 필드 찾기
             search_input = self._find_search_input()
             if not search_input:
@@ -156,6 +365,7 @@ class CourseFinder(BrowserBase):
                 return course
             else:
                 self.log_callback(f"❌ '{course_name}' 강의를 찾을 수 없습니다.")
+                self._log_suggestions(course_name)
                 return None
 
         except Exception as e:
@@ -186,7 +396,7 @@ class CourseFinder(BrowserBase):
 
             for i, selector in enumerate(search_selectors):
                 try:
-                    self.log_callback(f"🔍 검색 필드 시도 {i+1}/{len(search_selectors)}: {selector}")
+                    self.log_callback.debug("🔍 검색 필드 시도 %s/%s: %s", i+1, len(search_selectors), selector)
                     elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
 
                     for j, element in enumerate(elements):
@@ -194,17 +404,18 @@ class CourseFinder(BrowserBase):
                             self.log_callback(f"✅ 내 강의 검색 필드 발견: {selector}")
                             return element
                         else:
-                            self.log_callback(f"   요소 {j+1} 숨겨져 있음")
+                            self.log_callback.debug("   요소 %s 숨겨져 있음", j+1)
 
                 except Exception as e:
-                    self.log_callback(f"   선택자 실패: {str(e)}")
+                    self.log_callback.debug("   선택자 실패: %s", e)
                     continue
 
             self.log_callback("⚠️ 내 강의 검색 필드를 찾을 수 없음")
 
             # 현재 페이지 정보 출력
-            self.log_callback(f"🔍 현재 URL: {self.driver.current_url}")
-            self.log_callback(f"🔍 페이지 제목: {self.driver.title}")
+            if self.log_callback.debug_enabled:
+                self.log_callback.debug("🔍 현재 URL: %s", self.driver.current_url)
+                self.log_callback.debug("🔍 페이지 제목: %s", self.driver.title)
 
             return None
 
@@ -243,10 +454,10 @@ class CourseFinder(BrowserBase):
 
             for i, selector in enumerate(search_button_selectors):
                 try:
-                    self.log_callback(f"🔍 검색 버튼 시도 {i+1}/{len(search_button_selectors)}: {selector}")
+                    self.log_callback.debug("🔍 검색 버튼 시도 %s/%s: %s", i+1, len(search_button_selectors), selector)
 
                     elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    self.log_callback(f"   발견된 요소 수: {len(elements)}")
+                    self.log_callback.debug("   발견된 요소 수: %s", len(elements))
 
                     for j, button in enumerate(elements):
                         try:
@@ -254,17 +465,17 @@ class CourseFinder(BrowserBase):
                                 # 버튼의 상세 정보 로깅
                                 button_classes = button.get_attribute("class")
                                 button_type = button.get_attribute("type")
-                                self.log_callback(f"   버튼 {j+1}: type='{button_type}', classes='{button_classes}'")
+                                self.log_callback.debug("   버튼 %s: type='%s', classes='%s'", j+1, button_type, button_classes)
 
                                 # SVG 아이콘이 있는지 확인
                                 try:
                                     svg = button.find_element(By.CSS_SELECTOR, "svg")
                                     aria_label = svg.get_attribute("aria-label")
-                                    self.log_callback(f"   SVG 발견: aria-label='{aria_label}'")
+                                    self.log_callback.debug("   SVG 발견: aria-label='%s'", aria_label)
 
                                     # 검색 아이콘인지 확인
                                     if aria_label and ('검색' in aria_label or 'Search' in aria_label.lower()):
-                                        self.log_callback(f"   ✅ 검색 아이콘 확인됨")
+                                        self.log_callback.debug("   ✅ 검색 아이콘 확인됨")
                                         button.click()
                                         self.log_callback(f"✅ 검색 버튼 클릭 완료: {selector}")
                                         return True
@@ -273,7 +484,7 @@ class CourseFinder(BrowserBase):
                                         try:
                                             use_elem = svg.find_element(By.CSS_SELECTOR, "use")
                                             href = use_elem.get_attribute("xlink:href") or use_elem.get_attribute("href")
-                                            self.log_callback(f"   USE 태그: href='{href}'")
+                                            self.log_callback.debug("   USE 태그: href='%s'", href)
                                             if href and 'search' in href:
                                                 button.click()
                                                 self.log_callback(f"✅ 검색 버튼 클릭 완료: {selector}")
@@ -284,19 +495,19 @@ class CourseFinder(BrowserBase):
                                 except:
                                     # SVG가 없어도 submit 타입이면 시도
                                     if button_type == "submit":
-                                        self.log_callback(f"   SVG 없는 submit 버튼 클릭 시도")
+                                        self.log_callback.debug("   SVG 없는 submit 버튼 클릭 시도")
                                         button.click()
                                         self.log_callback(f"✅ Submit 버튼 클릭 완료: {selector}")
                                         return True
                             else:
-                                self.log_callback(f"   버튼 {j+1} 클릭 불가 (숨겨짐 또는 비활성화)")
+                                self.log_callback.debug("   버튼 %s 클릭 불가 (숨겨짐 또는 비활성화)", j+1)
 
                         except Exception as click_error:
-                            self.log_callback(f"   버튼 {j+1} 클릭 실패: {str(click_error)}")
+                            self.log_callback.debug("   버튼 %s 클릭 실패: %s", j+1, click_error)
                             continue
 
                 except Exception as e:
-                    self.log_callback(f"   선택자 실패: {str(e)}")
+                    self.log_callback.debug("   선택자 실패: %s", e)
                     continue
 
             # 모든 선택자 실패시 JavaScript로 시도
@@ -328,14 +539,14 @@ class CourseFinder(BrowserBase):
                 """
 
                 result = self.driver.execute_script(js_script)
-                self.log_callback(f"JavaScript 실행 결과: {result}")
+                self.log_callback.debug("JavaScript 실행 결과: %s", result)
 
                 if result.startswith("SUCCESS"):
                     self.log_callback("✅ JavaScript로 검색 버튼 클릭 완료")
                     return True
 
             except Exception as js_error:
-                self.log_callback(f"JavaScript 실행 실패: {str(js_error)}")
+                self.log_callback.debug("JavaScript 실행 실패: %s", js_error)
 
             self.log_callback("⚠️ 모든 방법으로 검색 버튼을 찾을 수 없음")
             return False
@@ -419,7 +630,7 @@ class CourseFinder(BrowserBase):
                         # 첫 번째 성공한 선택자의 결과 사용
                         return cards
                 except Exception as e:
-                    self.log_callback(f"   선택자 {selector} 실패: {str(e)}")
+                    self.log_callback.debug("   선택자 %s 실패: %s", selector, e)
                     continue
 
             if not all_cards:
@@ -446,7 +657,7 @@ class CourseFinder(BrowserBase):
                         return filtered_cards
 
                 except Exception as e:
-                    self.log_callback(f"   일반 요소 검색 실패: {str(e)}")
+                    self.log_callback.debug("   일반 요소 검색 실패: %s", e)
 
             return all_cards
 
@@ -472,14 +683,14 @@ class CourseFinder(BrowserBase):
                     # 유사도 계산
                     score = self._calculate_match_score(course_title, target_name)
 
-                    self.log_callback(f"   카드 {i+1}: '{course_title}' (유사도: {score:.2f})")
+                    self.log_callback.debug("   카드 %s: '%s' (유사도: %.2f)", i+1, course_title, score)
 
                     if score > best_score:
                         best_score = score
                         best_match = card
 
                 except Exception as e:
-                    self.log_callback(f"   카드 {i+1} 분석 실패: {str(e)}")
+                    self.log_callback.debug("   카드 %s 분석 실패: %s", i+1, e)
                     continue
 
             if best_match and best_score >= 0.3:  # 최소 30% 유사도
@@ -538,108 +749,74 @@ class CourseFinder(BrowserBase):
     def _calculate_match_score(self, course_title: str, target: str) -> float:
         """강의 제목과 검색어 간의 유사도 점수 계산"""
         try:
-            # 소문자로 변환하여 비교
-            title_lower = course_title.lower()
-            target_lower = target.lower()
+            # 기호/괄호를 제거하고 비교 (예: "【한글자막】")
+            title_normalized = normalize(course_title)
+            target_normalized = normalize(target)
 
             # 완전 일치
-            if title_lower == target_lower:
+            if title_normalized == target_normalized:
                 return 1.0
 
             # 포함 관계
-            if target_lower in title_lower:
+            if target_normalized and target_normalized in title_normalized:
                 return 0.8
-            if title_lower in target_lower:
+            if title_normalized and title_normalized in target_normalized:
                 return 0.7
 
-            # 단어 단위 일치 검사
-            title_words = set(title_lower.split())
-            target_words = set(target_lower.split())
-
-            if title_words and target_words:
-                common_words = title_words.intersection(target_words)
-                return len(common_words) / len(target_words.union(title_words))
-
-            return 0.0
+            # 자모 trigram 유사도
+            return similarity(title_normalized, target_normalized)
 
         except:
             return 0.0
 
-    def find_and_scrape_course(self, course_name: str, progress_callback=None, status_callback=None) -> bool:
-        """강의를 검색하고 바로 스크래핑 진행"""
+    def open_course(self, course_name: str) -> Optional[Course]:
+        """URL/slug/ID는 바로 이동, 강의명은 카탈로그 조회 후 직접 이동, 없으면 My Learning에서 검색"""
+        reference = parse_course_reference(course_name)
+        if reference:
+            course = self.open_course_by_reference(reference)
+        else:
+            course = self.select_course_from_catalog(course_name)
+            if not course and self.go_to_my_learning() and self._search_and_open_first_course(course_name):
+                course = Course(title=course_name)
+            if not course:
+                self._log_suggestions(course_name)
+        self.last_course = course
+        return course
+
+    def find_and_scrape_course(self, course_name: str, progress_callback=None, status_callback=None,
+                               shard=None, shard_plan=None) -> bool:
+        """강의를 검색하고 바로 스크래핑 진행 (shard=(번호, 전체 수)이면 shard_plan 배정 기준으로 맡은 강의만)"""
         try:
-            # 1. 강의 검색
-            self.log_callback(f"🔍 '{course_name}' 강의 검색 중...")
-
-            # 검색 필드 찾기
-            search_field = self._find_search_input()
-            if not search_field:
-                self.log_callback("❌ 검색 필드를 찾을 수 없습니다")
-                return False
-
-            # 검색어 입력
-            search_field.clear()
-            search_field.send_keys(course_name)
-            time.sleep(1)
-
-            # 검색 버튼 클릭
-            if not self._click_search_button():
-                self.log_callback("❌ 검색 버튼을 찾을 수 없습니다")
-                return False
-
-            # 검색 결과 대기
-            self._wait_for_search_results(course_name)
-
-            # 강의 카드 찾기
-            course_cards = self._find_course_cards()
-            if not course_cards:
-                self.log_callback(f"❌ '{course_name}' 검색 결과가 없습니다")
-                return False
-
-            # 강의 카드만 필터링 (enrolled-course-card 클래스를 가진 카드만)
-            actual_course_cards = []
-            for card in course_cards:
-                try:
-                    # 실제 강의 카드인지 확인 (href="/course-dashboard-redirect" 포함)
-                    course_link = card.find_element(By.CSS_SELECTOR, "a[href*='/course-dashboard-redirect']")
-                    if course_link:
-                        actual_course_cards.append(course_link)
-                        break  # 첫 번째 강의 카드만 필요
-                except:
-                    continue
-
-            if not actual_course_cards:
-                self.log_callback(f"❌ 강의 카드를 찾을 수 없습니다")
+            # 1. 강의 페이지 열기
+            with profile_stage("select_course"):
+                course = self.open_course(course_name)
+            if not course:
                 return False
 
-            # 첫 번째 실제 강의 클릭
-            first_course = actual_course_cards[0]
-            course_title = first_course.text
-            self.log_callback(f"🎯 강의 선택: {course_title}")
-            first_course.click()
-            time.sleep(3)
-
             # 2. 강의 페이지에서 스크래핑 진행
             self.log_callback("📝 강의 내용 스크래핑 시작...")
 
             from browser.navigation import UdemyNavigator
             from browser.transcript_scraper import TranscriptScraper
-            from core.models import Course
 
-            # 강의 정보 수집
-            course = Course(title=course_name)
             navigator = UdemyNavigator(self.driver, self.wait, self.log_callback)
 
             # 🔧 수정: 상태 체크를 먼저 하고 섹션 영역 확인 후 스크래핑 진행
             self.log_callback("🔍 강의 페이지 상태 체크 및 섹션 영역 확인...")
 
             # 1. 섹션 영역이 제대로 보이는지 확인하고 커리큘럼 분석
-            success = navigator.analyze_curriculum(course)
+            with profile_stage("curriculum"):
+                success = navigator.analyze_curriculum(course)
 
             # 2. 분석 완료 후 스크래핑 워크플로우 시작 (TranscriptScraper 사용)
             if success:
                 scraper = TranscriptScraper(self.driver, self.wait, self.log_callback)
-                success = scraper.start_complete_scraping_workflow(course)
+                scraper.shard = shard
+                scraper.shard_plan = shard_plan
+                scraper.progress_callback = progress_callback
+                scraper.status_callback = status_callback
+                with profile_stage("scraping"):
+                    success = scraper.start_complete_scraping_workflow(course)
 
             if success:
                 self.log_callback(f"💾 '{course_name}' 스크래핑 완료")
@@ -652,6 +829,59 @@ class CourseFinder(BrowserBase):
             self.log_callback(f"❌ 강의 검색 및 스크래핑 실패: {str(e)}")
             return False
 
+    def _search_and_open_first_course(self, course_name: str) -> bool:
+        """My Learning 검색으로 첫 번째 강의 열기"""
+        self.log_callback(f"🔍 '{course_name}' 강의 검색 중...")
+
+        # 검색 필드 찾기
+        search_field = self._find_search_input()
+        if not search_field:
+            self.log_callback("❌ 검색 필드를 찾을 수 없습니다")
+            return False
+
+        # 검색어 입력
+        search_field.clear()
+        search_field.send_keys(course_name)
+        time.sleep(1)
+
+        # 검색 버튼 클릭
+        if not self._click_search_button():
+            self.log_callback("❌ 검색 버튼을 찾을 수 없습니다")
+            return False
+
+        # 검색 결과 대기
+        self._wait_for_search_results(course_name)
+
+        # 강의 카드 찾기
+        course_cards = self._find_course_cards()
+        if not course_cards:
+            self.log_callback(f"❌ '{course_name}' 검색 결과가 없습니다")
+            return False
+
+        # 강의 카드만 필터링 (enrolled-course-card 클래스를 가진 카드만)
+        actual_course_cards = []
+        for card in course_cards:
+            try:
+                # 실제 강의 카드인지 확인 (href="/course-dashboard-redirect" 포함)
+                course_link = card.find_element(By.CSS_SELECTOR, "a[href*='/course-dashboard-redirect']")
+                if course_link:
+                    actual_course_cards.append(course_link)
+                    break  # 첫 번째 강의 카드만 필요
+            except:
+                continue
+
+        if not actual_course_cards:
+            self.log_callback(f"❌ 강의 카드를 찾을 수 없습니다")
+            return False
+
+        # 첫 번째 실제 강의 클릭
+        first_course = actual_course_cards[0]
+        course_title = first_course.text
+        self.log_callback(f"🎯 강의 선택: {course_title}")
+        first_course.click()
+        time.sleep(3)
+        return True
+
     def _list_available_courses(self, course_cards: List):
         """사용 가능한 강의 목록 출력"""
         try:
@@ -746,7 +976,7 @@ class CourseFinder(BrowserBase):
                     if elements:
                         for element in elements:
                             if element.is_displayed():
-                                self.log_callback(f"✅ 로그인 확인: {selector}")
+                                self.log_callback.debug("✅ 로그인 확인: %s", selector)
                                 return True
 
                 except Exception as e:
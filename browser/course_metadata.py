@@ -0,0 +1,63 @@
+"""
+강의 메타데이터 읽기 모듈 (course-taking 페이지의 data-module-args)
+"""
+
+import json
+from typing import Optional, Dict, Any
+from core.models import Course
+from .base import BrowserBase
+
+
+class CourseMetadataReader(BrowserBase):
+    """course-taking 모듈에 내장된 강의 메타데이터 읽기"""
+
+    MODULE_SELECTOR = "div[data-module-id='course-taking']"
+    TITLE_SELECTOR = "[data-purpose='dashboard-overview-container'] [data-purpose='title']"
+
+    def __init__(self, driver, wait, log_callback=None):
+        super().__init__(driver, wait, log_callback)
+
+    def read_module_args(self) -> Optional[Dict[str, Any]]:
+        """data-module-args JSON 읽기"""
+        try:
+            raw = self.driver.execute_script(
+                "var el = document.querySelector(arguments[0]);"
+                "return el ? el.getAttribute('data-module-args') : null;",
+                self.MODULE_SELECTOR
+            )
+            if not raw:
+                return None
+            return json.loads(raw)
+        except Exception as e:
+            self.log_callback(f"⚠️ 강의 메타데이터 읽기 실패: {str(e)}")
+            return None
+
+    def read_course_title(self) -> Optional[str]:
+        """개요 탭의 강의 제목 읽기 (숨겨진 탭이어도 textContent로 읽음)"""
+        try:
+            title = self.driver.execute_script(
+                "var el = document.querySelector(arguments[0]);"
+                "return el ? el.textContent : null;",
+                self.TITLE_SELECTOR
+            )
+            return title.strip() if title and title.strip() else None
+        except Exception:
+            return None
+
+    def apply_to_course(self, course: Course) -> bool:
+        """courseId / last_update_date를 Course에 반영"""
+        args = self.read_module_args()
+        if not args:
+            return False
+
+        course_id = args.get('courseId')
+        lead_data = args.get('courseLeadData') or {}
+
+        if course_id is not None:
+            course.course_id = int(course_id)
+        course.last_update_date = lead_data.get('last_update_date') or course.last_update_date
+        if not course.total_duration and lead_data.get('content_info_short'):
+            course.total_duration = lead_data['content_info_short']
+
+        self.log_callback(f"🆔 강의 ID: {course.course_id}, 최종 업데이트: {course.last_update_date or '알 수 없음'}")
+        return course.course_id is not None
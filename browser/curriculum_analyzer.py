@@ -8,18 +8,29 @@ from selenium.webdriver.common.by import By
 from bs4 import BeautifulSoup
 from config import Config
 from core.models import Course, Section, Lecture
+from utils.curriculum_cache import CurriculumCache
 from .base import BrowserBase
+from .course_metadata import CourseMetadataReader
+from .curriculum_classifier import CurriculumClassifier
 
 
 class CurriculumAnalyzer(BrowserBase):
     def __init__(self, driver, wait, log_callback=None):
         super().__init__(driver, wait, log_callback)
+        self.metadata_reader = CourseMetadataReader(driver, wait, log_callback)
+        self.classifier = CurriculumClassifier(driver, wait, log_callback)
+        self.cache = CurriculumCache(log_callback=self.log_callback)
 
     def analyze_curriculum(self, course: Course) -> bool:
         """강의 커리큘럼 분석"""
         try:
             self.log_callback("📋 강의 커리큘럼 분석 시작...")
 
+            # 0. 강의 ID/업데이트일 확인 후 캐시 조회
+            self.metadata_reader.apply_to_course(course)
+            if self.cache.load(course):
+                return True
+
             # 1. 커리큘럼 영역으로 스크롤
             self._scroll_curriculum_to_top()
 
@@ -32,13 +43,18 @@ class CurriculumAnalyzer(BrowserBase):
             self.log_callback(f"✅ {len(section_elements)}개 섹션 발견")
 
             # 3. 각 섹션 분석
+            course.sections = []
             for idx, section_element in enumerate(section_elements):
                 section = self._analyze_section(section_element, idx)
                 if section:
                     course.sections.append(section)
                     self.log_callback(f"   섹션 {idx + 1}: '{section.title}' ({section.lecture_count}개 강의)")
 
+            # 4. 전체 항목 타입/시간 일괄 분류 (비디오가 아닌 항목은 스크래핑 전에 제외됨)
+            self.classifier.classify_course(course)
+
             self.log_callback(f"📊 커리큘럼 분석 완료: {len(course.sections)}개 섹션, {course.total_lectures}개 강의")
+            self.cache.save(course)
             return True
 
         except Exception as e:
@@ -66,7 +82,7 @@ class CurriculumAnalyzer(BrowserBase):
                         self.log_callback(f"✅ {selector}로 {len(elements)}개 섹션 발견")
                         return elements
                 except Exception as e:
-                    self.log_callback(f"   선택자 {selector} 실패: {str(e)}")
+                    self.log_callback.debug("   선택자 %s 실패: %s", selector, e)
                     continue
 
             # 모든 선택자 실패 시 페이지 소스 분석
@@ -91,7 +107,7 @@ class CurriculumAnalyzer(BrowserBase):
                     return selenium_elements
 
             except Exception as e:
-                self.log_callback(f"   BeautifulSoup 분석 실패: {str(e)}")
+                self.log_callback.debug("   BeautifulSoup 분석 실패: %s", e)
 
             return []
 
@@ -289,7 +305,8 @@ class CurriculumAnalyzer(BrowserBase):
                 ".curriculum-item-duration",
                 ".duration",
                 ".lecture-duration",
-                "span[class*='duration']"
+                "span[class*='duration']",
+                "[class*='curriculum-item-link--metadata'] span"
             ]
 
             duration = "시간 정보 없음"
@@ -313,4 +330,4 @@ class CurriculumAnalyzer(BrowserBase):
             return lecture
 
         except Exception as e:
-            return None
\ No newline at end of file
+            return None
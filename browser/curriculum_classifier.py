@@ -0,0 +1,192 @@
+"""
+커리큘럼 항목 일괄 분류 (강의 타입/ID/재생 시간)
+
+항목마다 아이콘을 조회하는 대신 커리큘럼 API 한 번, 또는 렌더링된 항목 스냅샷
+스크립트 한 번으로 전체를 분류합니다.
+"""
+
+import re
+from typing import Dict, List, Optional
+from core.models import Course, Lecture, format_duration
+from .base import BrowserBase
+from .udemy_api import UdemyApiClient
+
+
+# API asset_type → Lecture.lecture_type
+_ASSET_TYPES = {
+    'video': 'video',
+    'videomashup': 'video',
+    'article': 'document',
+    'e-book': 'document',
+    'presentation': 'document',
+    'file': 'resource',
+    'externallink': 'resource'
+}
+
+# 커리큘럼 아이콘 → Lecture.lecture_type
+_ICON_TYPES = [
+    ("#icon-video", "video"),
+    ("#icon-article", "document"),
+    ("#icon-quiz", "quiz"),
+    ("#icon-assignment", "quiz"),
+    ("#icon-file", "resource"),
+    ("#icon-download", "resource")
+]
+
+# 렌더링된 curriculum-item-S-I 항목의 아이콘/제목/시간을 한 번에 수집
+_SNAPSHOT_SCRIPT = """
+    var root = arguments[0] ? document.querySelector(arguments[0]) : document;
+    if (!root) return [];
+    var items = root.querySelectorAll("[data-purpose^='curriculum-item-']");
+    var result = [];
+    for (var i = 0; i < items.length; i++) {
+        var key = items[i].getAttribute('data-purpose').slice('curriculum-item-'.length);
+        if (!/^\\d+-\\d+$/.test(key)) continue;
+        var icons = [];
+        var uses = items[i].querySelectorAll('svg use');
+        for (var j = 0; j < uses.length; j++) {
+            icons.push(uses[j].getAttribute('xlink:href') || uses[j].getAttribute('href') || '');
+        }
+        var title = items[i].querySelector("[data-purpose='item-title']");
+        var duration = items[i].querySelector("[class*='curriculum-item-link--metadata'] span");
+        result.push({
+            key: key,
+            icons: icons,
+            title: title ? title.textContent.trim() : '',
+            duration: duration ? duration.textContent.trim() : ''
+        });
+    }
+    return result;
+"""
+
+
+def type_from_icons(icons: List[str]) -> str:
+    """아이콘 href 목록으로 강의 타입 결정"""
+    for icon_id, lecture_type in _ICON_TYPES:
+        if any(icon_id in href for href in icons):
+            return lecture_type
+    return "unknown"
+
+
+class CurriculumClassifier(BrowserBase):
+    """전체 커리큘럼을 한 번에 분류해 Course 모델에 반영"""
+
+    def __init__(self, driver, wait, log_callback=None):
+        super().__init__(driver, wait, log_callback)
+        self.api = UdemyApiClient(driver, wait, log_callback)
+
+    def classify_course(self, course: Course) -> bool:
+        """API로 분류하고, 실패하면 렌더링된 항목 스냅샷으로 보완"""
+        if self.classify_from_api(course):
+            return True
+        return self.classify_from_snapshot(course)
+
+    def classify_from_api(self, course: Course) -> bool:
+        """커리큘럼 API로 강의 ID/타입/시간 채우기 (섹션 내 순서 기준으로 대응)
+
+        페이지 분석에서 항목이 비어 있던 섹션(접힌 아코디언)은 API 항목으로 채웁니다.
+        """
+        if course.course_id is None:
+            self.log_callback.debug("강의 ID가 없어 커리큘럼 API 분류 생략")
+            return False
+
+        chapters: List[list] = []
+        for page in self.api.iter_curriculum_items(course.course_id):
+            for item in page:
+                if item.get('_class') == 'chapter':
+                    chapters.append([])
+                elif chapters:
+                    chapters[-1].append(item)
+
+        if len(chapters) != len(course.sections):
+            self.log_callback(f"⚠️ 커리큘럼 API 섹션 수 불일치: API {len(chapters)}개, 페이지 {len(course.sections)}개")
+            return False
+
+        for section, items in zip(course.sections, chapters):
+            if not section.lectures:
+                section.lectures = [Lecture(title=item.get('title', ""), duration="", lecture_index=idx)
+                                    for idx, item in enumerate(items)]
+            elif len(items) != len(section.lectures):
+                self.log_callback.debug("섹션 '%s' 항목 수 불일치: API %d개, 페이지 %d개",
+                                        section.title, len(items), len(section.lectures))
+                continue
+
+            for lecture, item in zip(section.lectures, items):
+                self._apply_api_item(lecture, item)
+
+        self._log_summary(course, "커리큘럼 API")
+        return True
+
+    def classify_from_snapshot(self, course: Course) -> bool:
+        """렌더링된(펼쳐진) 섹션의 항목을 스크립트 한 번으로 분류"""
+        snapshot = self.snapshot_items()
+        if not snapshot:
+            return False
+
+        for section_idx, section in enumerate(course.sections):
+            for lecture_idx, lecture in enumerate(section.lectures):
+                item = snapshot.get(f"{section_idx}-{lecture_idx}")
+                if item:
+                    self._apply_snapshot_item(lecture, item)
+
+        self._log_summary(course, "항목 스냅샷")
+        return True
+
+    def snapshot_items(self, root_selector: Optional[str] = None) -> Dict[str, dict]:
+        """렌더링된 항목 {"S-I": {type, title, duration}} (root_selector 범위 한정 가능)"""
+        try:
+            items = self.driver.execute_script(_SNAPSHOT_SCRIPT, root_selector) or []
+        except Exception as e:
+            self.log_callback(f"⚠️ 커리큘럼 항목 스냅샷 실패: {str(e)}")
+            return {}
+
+        snapshot = {}
+        for item in items:
+            item['type'] = type_from_icons(item.get('icons') or [])
+            snapshot[item['key']] = item
+        return snapshot
+
+    def section_types(self, section_idx: int) -> List[str]:
+        """펼쳐진 섹션 하나의 항목 타입 목록 (항목 순서대로)"""
+        snapshot = self.snapshot_items(f"div[data-purpose='section-panel-{section_idx}']")
+        types = []
+        for lecture_idx in range(len(snapshot)):
+            item = snapshot.get(f"{section_idx}-{lecture_idx}")
+            types.append(item['type'] if item else "unknown")
+        return types
+
+    def _apply_api_item(self, lecture: Lecture, item: dict):
+        """API 항목 하나를 Lecture에 반영"""
+        item_class = item.get('_class')
+        asset = item.get('asset') or {}
+
+        if item_class == 'lecture' and lecture.lecture_id is None and item.get('id') is not None:
+            lecture.lecture_id = int(item['id'])
+
+        if item_class in ('quiz', 'practice'):
+            lecture.lecture_type = "quiz"
+        elif item_class == 'lecture':
+            lecture.lecture_type = _ASSET_TYPES.get((asset.get('asset_type') or "").lower(), lecture.lecture_type)
+
+        if asset.get('time_estimation') and not self._has_duration(lecture):
+            lecture.set_duration(format_duration(int(asset['time_estimation'])), int(asset['time_estimation']))
+
+    def _apply_snapshot_item(self, lecture: Lecture, item: dict):
+        """스냅샷 항목 하나를 Lecture에 반영"""
+        if item['type'] != "unknown":
+            lecture.lecture_type = item['type']
+        if item.get('duration') and not self._has_duration(lecture):
+            lecture.set_duration(item['duration'])
+
+    def _has_duration(self, lecture: Lecture) -> bool:
+        """재생 시간 정보가 이미 있는지"""
+        return bool(lecture.duration) and bool(re.search(r"\d", lecture.duration))
+
+    def _log_summary(self, course: Course, source: str):
+        """타입별 항목 수 로그"""
+        counts: Dict[str, int] = {}
+        for section in course.sections:
+            for lecture in section.lectures:
+                counts[lecture.lecture_type] = counts.get(lecture.lecture_type, 0) + 1
+        summary = ", ".join(f"{lecture_type} {count}개" for lecture_type, count in sorted(counts.items()))
+        self.log_callback(f"🏷️ {source}로 항목 분류 완료: {summary}")
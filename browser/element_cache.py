@@ -0,0 +1,102 @@
+"""
+자주 쓰는 플레이어 요소 핸들 캐시 (논리적 대상 + 페이지 경로 기준)
+"""
+
+import weakref
+from typing import Dict, List, Optional, Sequence
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
+
+
+# 캐시된 요소가 아직 문서에 붙어 있고 같은 경로면 그대로, 아니면 선택자로 다시 찾음.
+# 여러 대상을 한 번의 execute_script로 처리합니다.
+_RESOLVE_SCRIPT = """
+    var requests = arguments[0];
+    var route = location.pathname.replace(/\\/lecture\\/\\d+.*$/, '/');
+    function usable(el) {
+        return !!el && el.isConnected && el.getClientRects().length > 0
+            && getComputedStyle(el).visibility !== 'hidden';
+    }
+    function resolve(selectors) {
+        for (var i = 0; i < selectors.length; i++) {
+            var found = document.querySelectorAll(selectors[i]);
+            for (var j = 0; j < found.length; j++) {
+                if (usable(found[j])) return found[j];
+            }
+        }
+        return null;
+    }
+    var elements = requests.map(function (req) {
+        if (req.cached && req.route === route && usable(req.cached)) return req.cached;
+        return resolve(req.selectors);
+    });
+    return {route: route, elements: elements};
+"""
+
+
+class ElementHandleCache:
+    """드라이버별 WebElement 핸들 캐시
+
+    get()은 캐시된 요소의 유효성 확인과 (필요하면) 재탐색을 스크립트 한 번으로 처리합니다.
+    """
+
+    _instances = weakref.WeakKeyDictionary()
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._entries: Dict[str, tuple] = {}  # target -> (route, element)
+
+    @classmethod
+    def for_driver(cls, driver) -> 'ElementHandleCache':
+        """같은 드라이버를 쓰는 헬퍼들이 캐시를 공유하도록 드라이버별 인스턴스 반환"""
+        try:
+            cache = cls._instances.get(driver)
+            if cache is None:
+                cache = cls(driver)
+                cls._instances[driver] = cache
+            return cache
+        except TypeError:
+            # 약한 참조를 지원하지 않는 드라이버 객체
+            return cls(driver)
+
+    def get(self, target: str, selectors: Sequence[str]):
+        """대상 요소 하나 (없으면 None)"""
+        return self.get_many({target: selectors})[target]
+
+    def get_many(self, targets: Dict[str, Sequence[str]]) -> Dict[str, Optional[object]]:
+        """여러 대상을 한 번에 확인/탐색"""
+        names: List[str] = list(targets)
+        requests = []
+        for name in names:
+            route, element = self._entries.get(name, (None, None))
+            requests.append({'cached': element, 'route': route, 'selectors': list(targets[name])})
+
+        try:
+            result = self.driver.execute_script(_RESOLVE_SCRIPT, requests)
+        except StaleElementReferenceException:
+            # 캐시된 요소가 이미 분리됨 → 캐시 없이 다시 탐색
+            for request in requests:
+                request['cached'] = None
+            try:
+                result = self.driver.execute_script(_RESOLVE_SCRIPT, requests)
+            except WebDriverException:
+                return {name: None for name in names}
+        except WebDriverException:
+            return {name: None for name in names}
+
+        route = result.get('route') if result else None
+        elements = result.get('elements') if result else [None] * len(names)
+        resolved = {}
+        for name, element in zip(names, elements):
+            if element is not None:
+                self._entries[name] = (route, element)
+            else:
+                self._entries.pop(name, None)
+            resolved[name] = element
+        return resolved
+
+    def invalidate(self, target: Optional[str] = None):
+        """특정 대상 또는 전체 캐시 무효화"""
+        if target is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(target, None)
@@ -7,7 +7,9 @@ from typing import Optional, List
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support import expected_conditions as EC
+from utils.logger import as_logger
 from .selectors import UdemySelectors, ClickStrategies
+from .element_cache import ElementHandleCache
 
 
 class ElementFinder:
@@ -16,31 +18,36 @@ class ElementFinder:
     def __init__(self, driver, wait, log_callback=None):
         self.driver = driver
         self.wait = wait
-        self.log_callback = log_callback or print
+        self.log_callback = as_logger(log_callback)
+        self.handle_cache = ElementHandleCache.for_driver(driver)
 
     def find_transcript_button(self, max_attempts=10) -> Optional:
-        """트랜스크립트 버튼 찾기 (호버 + 검색 반복)"""
+        """트랜스크립트 버튼 찾기 (캐시 확인 → 호버 + 검색 반복)"""
         try:
+            # 1. 캐시된 핸들 확인/재탐색 (비디오 영역과 함께 스크립트 한 번)
+            handles = self.handle_cache.get_many({
+                'transcript_button': UdemySelectors.TRANSCRIPT_BUTTONS,
+                'video_area': UdemySelectors.VIDEO_AREAS
+            })
+            if handles['transcript_button']:
+                return handles['transcript_button']
+
             # 비디오 영역 찾기
-            video_area = self.find_video_area()
+            video_area = handles['video_area']
             if not video_area:
                 return None
 
             actions = ActionChains(self.driver)
 
-            # 1초마다 호버 + 버튼 검색 반복
+            # 2. 컨트롤바가 숨겨져 있으면 1초마다 호버 + 버튼 검색 반복
             for attempt in range(max_attempts):
                 # 비디오 영역에 호버하여 컨트롤바 활성화
                 actions.move_to_element(video_area).perform()
 
                 # 트랜스크립트 버튼 검색
-                for selector in UdemySelectors.TRANSCRIPT_BUTTONS:
-                    try:
-                        element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        if element and element.is_displayed():
-                            return element
-                    except:
-                        continue
+                element = self.handle_cache.get('transcript_button', UdemySelectors.TRANSCRIPT_BUTTONS)
+                if element:
+                    return element
 
                 # 1초 대기 후 재시도
                 time.sleep(1)
@@ -54,28 +61,14 @@ class ElementFinder:
     def find_video_area(self) -> Optional:
         """비디오 영역 찾기"""
         try:
-            for selector in UdemySelectors.VIDEO_AREAS:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if element and element.is_displayed():
-                        return element
-                except:
-                    continue
-            return None
+            return self.handle_cache.get('video_area', UdemySelectors.VIDEO_AREAS)
         except Exception:
             return None
 
     def find_transcript_panel(self) -> Optional:
         """트랜스크립트 패널 찾기"""
         try:
-            for selector in UdemySelectors.TRANSCRIPT_PANELS:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if element and element.is_displayed():
-                        return element
-                except:
-                    continue
-            return None
+            return self.handle_cache.get('transcript_panel', UdemySelectors.TRANSCRIPT_PANELS)
         except Exception:
             return None
 
@@ -85,7 +78,7 @@ class ClickHandler:
 
     def __init__(self, driver, log_callback=None):
         self.driver = driver
-        self.log_callback = log_callback or print
+        self.log_callback = as_logger(log_callback)
 
     def click_element_with_strategies(self, element, scroll_to_view=True) -> bool:
         """여러 전략으로 요소 클릭 시도 (최적화된 대기)"""
@@ -223,7 +216,7 @@ class SectionNavigator:
     def __init__(self, driver, wait, log_callback=None):
         self.driver = driver
         self.wait = wait
-        self.log_callback = log_callback or print
+        self.log_callback = as_logger(log_callback)
         self.click_handler = ClickHandler(driver, log_callback)
         # 순환 import 방지를 위해 lazy import
         self._smart_waiter = None
@@ -424,33 +417,33 @@ class SectionNavigator:
     def _debug_section_expansion(self, section_element, section_idx: int):
         """섹션 확장 디버깅 정보 출력"""
         try:
-            self.log_callback(f"    🔍 섹션 {section_idx + 1} 디버깅 정보:")
+            self.log_callback.debug(f"    🔍 섹션 {section_idx + 1} 디버깅 정보:")
 
             # 기본 속성들
             aria_expanded = section_element.get_attribute("aria-expanded")
             class_name = section_element.get_attribute("class") or ""
             data_state = section_element.get_attribute("data-state") or ""
 
-            self.log_callback(f"       aria-expanded: {aria_expanded}")
-            self.log_callback(f"       class: {class_name[:100]}...")
-            self.log_callback(f"       data-state: {data_state}")
+            self.log_callback.debug(f"       aria-expanded: {aria_expanded}")
+            self.log_callback.debug(f"       class: {class_name[:100]}...")
+            self.log_callback.debug(f"       data-state: {data_state}")
 
             # 버튼 상태 확인
             buttons = section_element.find_elements(By.CSS_SELECTOR, "button")
-            self.log_callback(f"       버튼 개수: {len(buttons)}")
+            self.log_callback.debug(f"       버튼 개수: {len(buttons)}")
             for i, button in enumerate(buttons[:3]):  # 처음 3개만
                 btn_expanded = button.get_attribute("aria-expanded")
                 btn_class = button.get_attribute("class") or ""
-                self.log_callback(f"       버튼{i+1}: aria-expanded={btn_expanded}, class={btn_class[:50]}...")
+                self.log_callback.debug(f"       버튼{i+1}: aria-expanded={btn_expanded}, class={btn_class[:50]}...")
 
             # 콘텐츠 요소 확인
             content_count = len(section_element.find_elements(By.CSS_SELECTOR, "[data-purpose*='curriculum-item']"))
             visible_content_count = len([elem for elem in section_element.find_elements(By.CSS_SELECTOR, "[data-purpose*='curriculum-item']") if elem.is_displayed()])
 
-            self.log_callback(f"       콘텐츠 요소: 총 {content_count}개, 보이는 것 {visible_content_count}개")
+            self.log_callback.debug(f"       콘텐츠 요소: 총 {content_count}개, 보이는 것 {visible_content_count}개")
 
         except Exception as e:
-            self.log_callback(f"       디버깅 실패: {str(e)}")
+            self.log_callback.debug(f"       디버깅 실패: {str(e)}")
 
     def _wait_for_section_expand_smart(self, section_element, section_idx: int, max_wait_seconds=10) -> bool:
         """섹션이 실제로 열릴 때까지 스마트 대기 (개선된 로직)"""
@@ -475,20 +468,20 @@ class SectionNavigator:
                     has_content = self._has_visible_content(section_element, section_idx)
 
                     if attempt % 5 == 0 or attempt <= 3:  # 처음 3번과 5번마다 상태 로그
-                        self.log_callback(f"    🔄 시도 {attempt}: expanded={is_expanded}, content={has_content}")
+                        self.log_callback.debug("    🔄 시도 %s: expanded=%s, content=%s", attempt, is_expanded, has_content)
 
                     if is_expanded and has_content:
                         self.log_callback(f"    ✅ 섹션 {section_idx + 1} 확장 및 콘텐츠 로딩 완료 (시도 {attempt})")
                         return True
 
                     # 콘텐츠가 없다면 더 자세한 디버깅
-                    if is_expanded and not has_content and attempt == 5:
+                    if is_expanded and not has_content and attempt == 5 and self.log_callback.debug_enabled:
                         self._debug_section_expansion(section_element, section_idx)
 
                     time.sleep(0.3)  # 더 짧은 간격으로 변경
 
                 except Exception as inner_e:
-                    self.log_callback(f"    🔄 시도 {attempt} 섹션 상태 확인 중... ({str(inner_e)[:30]})")
+                    self.log_callback.debug("    🔄 시도 %s 섹션 상태 확인 중... (%s)", attempt, str(inner_e)[:30])
                     time.sleep(0.3)  # 더 짧은 간격으로 변경
 
             self.log_callback(f"    ❌ 섹션 {section_idx + 1} 확장 대기 시간 초과 (총 {attempt}번 시도)")
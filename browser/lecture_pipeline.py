@@ -0,0 +1,134 @@
+"""
+두 탭 파이프라인 (다음 강의 미리 로딩)
+
+활성 탭에서 자막을 추출/저장하는 동안 대기 탭은 다음 강의로 이동해 로딩을 끝내 두고,
+강의가 끝나면 두 탭의 역할을 바꿉니다.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+from config import Config
+from core.models import Course, Lecture
+from utils.rate_limiter import get_scheduler, NAVIGATION
+from .base import BrowserBase
+from .element_cache import ElementHandleCache
+from .curriculum_classifier import CurriculumClassifier
+
+
+# location.href 변경을 setTimeout으로 미뤄 스크립트가 로딩 완료를 기다리지 않고 바로 반환되게 함
+_NAVIGATE_SCRIPT = "var url = arguments[0]; setTimeout(function () { window.location.href = url; }, 0);"
+
+
+@dataclass(slots=True)
+class LectureJob:
+    """파이프라인 작업 단위 (섹션/강의 인덱스와 강의 정보)"""
+    section_idx: int
+    lecture_idx: int
+    lecture: Lecture
+
+
+class LecturePrefetchPipeline(BrowserBase):
+    """활성 탭 / 대기 탭 두 개로 강의 페이지 로딩을 추출과 겹치게 처리"""
+
+    def __init__(self, driver, wait, log_callback=None):
+        super().__init__(driver, wait, log_callback)
+        self.classifier = CurriculumClassifier(driver, wait, log_callback)
+        self.active_handle: Optional[str] = None
+        self.standby_handle: Optional[str] = None
+        self.course_slug: str = ""
+
+    def build_jobs(self, course: Course, include: Optional[Callable[[int, int], bool]] = None) -> List[LectureJob]:
+        """비디오(또는 타입 미상) 강의 작업 목록 (include로 맡은 위치만)
+
+        하나라도 강의 ID를 확인하지 못하면 빈 목록을 돌려 클릭 방식으로 처리하게 함
+        (ID 없는 강의를 빼고 진행하면 추출되지도, 실패로 기록되지도 않음)
+        """
+        if any(lecture.lecture_id is None and lecture.lecture_type in ("video", "unknown")
+               for section in course.sections for lecture in section.lectures):
+            self.resolve_lecture_ids(course)
+
+        jobs, unresolved = [], 0
+        for section_idx, section in enumerate(course.sections):
+            for lecture_idx, lecture in enumerate(section.lectures):
+                if lecture.lecture_type not in ("video", "unknown"):
+                    continue
+                if include is not None and not include(section_idx, lecture_idx):
+                    continue
+                if lecture.lecture_id is None:
+                    unresolved += 1
+                    continue
+                jobs.append(LectureJob(section_idx, lecture_idx, lecture))
+
+        if unresolved:
+            self.log_callback(f"⚠️ 강의 ID를 확인하지 못한 강의 {unresolved}개")
+            return []
+        return jobs
+
+    def resolve_lecture_ids(self, course: Course) -> bool:
+        """커리큘럼 API로 강의 ID/타입 채우기"""
+        if course.course_id is None:
+            self.log_callback("⚠️ 강의 ID를 몰라 커리큘럼 API를 호출할 수 없음")
+            return False
+        return self.classifier.classify_from_api(course)
+
+    def lecture_url(self, lecture: Lecture) -> str:
+        """강의 페이지 URL"""
+        return f"{Config.UDEMY_BASE_URL}/course/{self.course_slug}/learn/lecture/{lecture.lecture_id}"
+
+    def read_course_slug(self) -> bool:
+        """현재 URL에서 강의 slug 읽기"""
+        match = re.search(r"/course/([^/?#]+)", self.driver.current_url)
+        if not match:
+            self.log_callback("⚠️ 현재 URL에서 강의 slug를 찾을 수 없음")
+            return False
+        self.course_slug = match.group(1)
+        return True
+
+    def open(self) -> bool:
+        """현재 탭을 활성 탭으로 두고 대기 탭 하나 추가"""
+        try:
+            if not self.read_course_slug():
+                return False
+
+            self.active_handle = self.driver.current_window_handle
+            self.driver.switch_to.new_window('tab')
+            self.standby_handle = self.driver.current_window_handle
+            self.driver.switch_to.window(self.active_handle)
+            self.log_callback("🗂️ 미리 로딩용 탭 준비 완료")
+            return True
+        except Exception as e:
+            self.log_callback(f"❌ 미리 로딩용 탭 생성 실패: {str(e)}")
+            self.standby_handle = None
+            return False
+
+    def prefetch(self, lecture: Lecture):
+        """대기 탭에서 다음 강의로 이동 시작 (로딩 완료를 기다리지 않음)"""
+        try:
+            get_scheduler().acquire(NAVIGATION)
+            self.driver.switch_to.window(self.standby_handle)
+            self.driver.execute_script(_NAVIGATE_SCRIPT, self.lecture_url(lecture))
+        except Exception as e:
+            self.log_callback(f"    ⚠️ 다음 강의 미리 로딩 실패: {str(e)}")
+        finally:
+            self.driver.switch_to.window(self.active_handle)
+
+    def swap(self):
+        """대기 탭을 활성 탭으로 전환 (이전 활성 탭은 다음 미리 로딩에 사용)"""
+        self.active_handle, self.standby_handle = self.standby_handle, self.active_handle
+        self.driver.switch_to.window(self.active_handle)
+        # 다른 탭의 요소 핸들은 쓸 수 없음
+        ElementHandleCache.for_driver(self.driver).invalidate()
+
+    def close(self):
+        """대기 탭 닫고 활성 탭으로 복귀"""
+        try:
+            if self.standby_handle and self.standby_handle in self.driver.window_handles:
+                self.driver.switch_to.window(self.standby_handle)
+                self.driver.close()
+            if self.active_handle:
+                self.driver.switch_to.window(self.active_handle)
+        except Exception as e:
+            self.log_callback(f"⚠️ 미리 로딩용 탭 정리 실패: {str(e)}")
+        finally:
+            self.standby_handle = None
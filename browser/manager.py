@@ -7,18 +7,39 @@ import socket
 import subprocess
 import requests
 import os
+import shutil
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from config import Config
+from utils.logger import as_logger
+
+DEFAULT_PROFILE_DIR = '/tmp/chrome_debug_profile_udemy'
+
+# 로그인 상태를 옮기는 데 필요한 프로필 파일 (쿠키 암호화 키는 Local State에 있음)
+PROFILE_SESSION_FILES = [
+    'Local State',
+    'Default/Cookies',
+    'Default/Network/Cookies',
+    'Default/Preferences'
+]
+
+
+def profile_dir_for_port(debug_port: int) -> str:
+    """디버그 포트별 Chrome 프로필 (기본 포트는 기본 프로필, 나머지는 포트별 복제본)"""
+    if debug_port == Config.CHROME_DEBUG_PORT:
+        return DEFAULT_PROFILE_DIR
+    return f"{DEFAULT_PROFILE_DIR}_{debug_port}"
+
 
 class ExistingBrowserManager:
     def __init__(self, log_callback=None):
         self.driver = None
         self.wait = None
-        self.log_callback = log_callback or print
+        self.log_callback = as_logger(log_callback)
 
     def check_debug_port(self, port=9222):
         """디버그 포트가 열려있는지 확인"""
@@ -120,12 +141,12 @@ class ExistingBrowserManager:
         self.log_callback("❌ Chrome 실행 파일을 찾을 수 없습니다")
         return None
 
-    def kill_existing_chrome_debug_processes(self):
+    def kill_existing_chrome_debug_processes(self, debug_port=9222):
         """기존 Chrome 디버그 프로세스 종료"""
         try:
             self.log_callback("🔄 기존 Chrome 디버그 프로세스 확인...")
             # 포트를 사용하는 프로세스 확인
-            result = subprocess.run(['lsof', '-ti:9222'], capture_output=True, text=True)
+            result = subprocess.run(['lsof', f'-ti:{debug_port}'], capture_output=True, text=True)
             if result.stdout.strip():
                 pids = result.stdout.strip().split('\n')
                 for pid in pids:
@@ -135,7 +156,25 @@ class ExistingBrowserManager:
         except Exception as e:
             self.log_callback(f"⚠️ 프로세스 정리 중 오류: {str(e)}")
 
-    def start_chrome_with_debug_port(self, debug_port=9222):
+    def clone_profile(self, target_dir, source_dir=DEFAULT_PROFILE_DIR):
+        """기본 디버그 프로필의 쿠키/설정만 복사해 로그인 상태를 공유하는 새 프로필 생성"""
+        copied = 0
+        for relative in PROFILE_SESSION_FILES:
+            source = os.path.join(source_dir, relative)
+            if not os.path.exists(source):
+                continue
+            target = os.path.join(target_dir, relative)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copy2(source, target)
+            copied += 1
+
+        if copied:
+            self.log_callback(f"📋 프로필 복제: {source_dir} → {target_dir} ({copied}개 파일)")
+        else:
+            self.log_callback(f"⚠️ 복제할 로그인 프로필이 없습니다 ({source_dir}) - 새 Chrome에서 직접 로그인하세요")
+        return copied > 0
+
+    def start_chrome_with_debug_port(self, debug_port=9222, user_data_dir=DEFAULT_PROFILE_DIR):
         """디버그 포트를 활성화한 Chrome 시작"""
         try:
             self.log_callback("🌐 디버그 모드로 Chrome 시작 중...")
@@ -146,13 +185,13 @@ class ExistingBrowserManager:
                 return False
 
             # 기존 디버그 프로세스 정리
-            self.kill_existing_chrome_debug_processes()
+            self.kill_existing_chrome_debug_processes(debug_port)
 
             # Chrome을 디버그 포트와 함께 시작
             chrome_cmd = [
                 chrome_path,
                 f'--remote-debugging-port={debug_port}',
-                '--user-data-dir=/tmp/chrome_debug_profile_udemy',
+                f'--user-data-dir={user_data_dir}',
                 '--disable-web-security',
                 '--disable-features=VizDisplayCompositor',
                 '--no-first-run',
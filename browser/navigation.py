@@ -6,6 +6,8 @@ from .course_finder import CourseFinder
 from .curriculum_analyzer import CurriculumAnalyzer
 from .transcript_scraper import TranscriptScraper
 from core.models import Course
+from utils.course_reference import CourseReference
+from utils.logger import as_logger
 from typing import Optional
 from selenium.webdriver.common.by import By
 import time
@@ -15,7 +17,7 @@ class UdemyNavigator:
     def __init__(self, driver, wait, log_callback=None):
         self.driver = driver
         self.wait = wait
-        self.log_callback = log_callback or print
+        self.log_callback = as_logger(log_callback)
 
         # 하위 모듈들 초기화
         self.course_finder = CourseFinder(driver, wait, log_callback)
@@ -30,6 +32,10 @@ class UdemyNavigator:
         """강의 검색 및 선택"""
         return self.course_finder.search_and_select_course(course_name)
 
+    def open_course_by_reference(self, reference: CourseReference) -> Optional[Course]:
+        """강의 URL/slug/ID로 바로 이동"""
+        return self.course_finder.open_course_by_reference(reference)
+
     def analyze_curriculum(self, course: Course) -> bool:
         """강의 커리큘럼 분석"""
         return self.curriculum_analyzer.analyze_curriculum(course)
@@ -36,6 +36,11 @@ class UdemySelectors:
         ".caption-text"
     ]
 
+    # === 자막 언어 메뉴 관련 ===
+    CAPTIONS_DROPDOWN_BUTTON = "button[data-purpose='captions-dropdown-button']"
+    CAPTIONS_LANGUAGE_ITEMS = "[data-purpose='captions-dropdown-menu'] button[role='menuitemradio']"
+    CAPTIONS_OFF_LABELS = ["끄기", "Off"]
+
     # === 비디오 플레이어 관련 ===
     VIDEO_AREAS = [
         "video",
@@ -0,0 +1,111 @@
+"""
+브라우저 세션 감시 및 자동 재연결
+
+Chrome이 죽거나 디버그 포트/WebDriver 세션이 끊기면 디버그 포트로 Chrome을 다시 띄우거나
+다시 붙고, 새 드라이버를 돌려줍니다.
+"""
+
+import os
+import socket
+import time
+from typing import Optional, Tuple
+from selenium.common.exceptions import (
+    InvalidSessionIdException, NoSuchWindowException, WebDriverException
+)
+from config import Config
+from utils.logger import as_logger
+from .manager import ExistingBrowserManager, DEFAULT_PROFILE_DIR, profile_dir_for_port
+
+
+# 세션이 끊겼음을 뜻하는 WebDriver 오류 메시지
+_DEAD_SESSION_MARKERS = (
+    "chrome not reachable",
+    "disconnected",
+    "session deleted",
+    "invalid session id",
+    "no such window",
+    "target window already closed",
+    "connection refused"
+)
+
+
+class SessionWatchdog:
+    """WebDriver 세션 생존 확인과 재연결"""
+
+    def __init__(self, driver, log_callback=None, debug_port: Optional[int] = None,
+                 user_data_dir: Optional[str] = None):
+        self.driver = driver
+        self.log_callback = as_logger(log_callback)
+        self.debug_port = debug_port or self._debug_port_of(driver) or Config.CHROME_DEBUG_PORT
+        # 분할 실행 Chrome은 포트별 복제 프로필을 씀 (기본 프로필로 띄우면 기존 프로세스에 넘어가 포트가 열리지 않음)
+        self.user_data_dir = user_data_dir or profile_dir_for_port(self.debug_port)
+        self.reconnect_count = 0
+
+    def _debug_port_of(self, driver) -> Optional[int]:
+        """드라이버가 붙어 있는 Chrome 디버그 포트"""
+        try:
+            address = driver.capabilities.get('goog:chromeOptions', {}).get('debuggerAddress', "")
+            return int(address.rsplit(":", 1)[1]) if ":" in address else None
+        except Exception:
+            return None
+
+    def port_open(self) -> bool:
+        """디버그 포트가 열려 있는지 (소켓 연결만 확인)"""
+        try:
+            with socket.create_connection(('127.0.0.1', self.debug_port), timeout=1):
+                return True
+        except OSError:
+            return False
+
+    def is_alive(self) -> bool:
+        """가벼운 스크립트 한 번으로 세션 생존 확인"""
+        try:
+            self.driver.execute_script("return 1")
+            return True
+        except (InvalidSessionIdException, NoSuchWindowException):
+            return False
+        except WebDriverException as e:
+            message = str(e).lower()
+            if any(marker in message for marker in _DEAD_SESSION_MARKERS):
+                return False
+            # 페이지 스크립트 오류 등은 세션과 무관
+            return self.port_open()
+        except Exception:
+            # chromedriver 프로세스 자체가 죽으면 urllib3 연결 오류
+            return False
+
+    def reconnect(self) -> Optional[Tuple[object, object]]:
+        """Chrome을 다시 띄우거나 다시 붙어 (driver, wait) 반환 (실패 시 None)"""
+        self._discard_driver()
+
+        for attempt in range(1, Config.SESSION_RECONNECT_ATTEMPTS + 1):
+            self.log_callback.warning(f"🩺 브라우저 세션 복구 시도 {attempt}/{Config.SESSION_RECONNECT_ATTEMPTS} (포트 {self.debug_port})")
+            manager = ExistingBrowserManager(log_callback=self.log_callback)
+
+            if not self.port_open() and not self._relaunch(manager):
+                time.sleep(Config.RETRY_DELAY * attempt)
+                continue
+
+            if manager.connect_to_existing_browser(self.debug_port):
+                self.driver = manager.driver
+                self.reconnect_count += 1
+                self.log_callback("✅ 브라우저 세션 복구 완료")
+                return manager.driver, manager.wait
+
+            time.sleep(Config.RETRY_DELAY * attempt)
+
+        self.log_callback("❌ 브라우저 세션 복구 실패")
+        return None
+
+    def _relaunch(self, manager: ExistingBrowserManager) -> bool:
+        """이 포트의 프로필로 Chrome 다시 시작 (복제 프로필이 없으면 기본 프로필에서 복제)"""
+        if self.user_data_dir != DEFAULT_PROFILE_DIR and not os.path.isdir(self.user_data_dir):
+            manager.clone_profile(self.user_data_dir)
+        return manager.start_chrome_with_debug_port(self.debug_port, user_data_dir=self.user_data_dir)
+
+    def _discard_driver(self):
+        """죽은 세션의 chromedriver 정리 (브라우저 자체는 이미 끊긴 상태)"""
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
@@ -7,6 +7,7 @@ from typing import Optional, Callable, List, Union
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from utils.logger import as_logger
 from .selectors import UdemySelectors
 
 
@@ -16,7 +17,7 @@ class SmartWaiter:
     def __init__(self, driver, wait, log_callback=None):
         self.driver = driver
         self.wait = wait
-        self.log_callback = log_callback or print
+        self.log_callback = as_logger(log_callback)
 
     def wait_for_transcript_panel_close(self, transcript_button, max_wait_seconds=10) -> bool:
         """트랜스크립트 패널이 닫힐 때까지 대기"""
@@ -85,7 +86,7 @@ class SmartWaiter:
 
             # 즉시 한 번 확인 (이미 준비되어 있을 수 있음)
             lecture_elements = self._find_fresh_lecture_elements(section_content)
-            self.log_callback(f"    🔍 현재 발견된 강의 수: {len(lecture_elements) if lecture_elements else 0}")
+            self.log_callback.debug("    🔍 현재 발견된 강의 수: %s", len(lecture_elements) if lecture_elements else 0)
 
             if lecture_elements and len(lecture_elements) > next_lecture_idx:
                 next_lecture = lecture_elements[next_lecture_idx]
@@ -93,8 +94,9 @@ class SmartWaiter:
                     self.log_callback(f"    ✅ 다음 강의({next_lecture_idx + 1})가 이미 클릭 가능합니다")
                     return True
                 else:
-                    # 클릭 불가능한 이유 디버깅
-                    self._debug_lecture_clickability(next_lecture, next_lecture_idx)
+                    # 클릭 불가능한 이유 디버깅 (DEBUG 레벨에서만 DOM 탐색)
+                    if self.log_callback.debug_enabled:
+                        self._debug_lecture_clickability(next_lecture, next_lecture_idx)
 
             # 아직 준비되지 않았다면 대기
             start_time = time.time()
@@ -106,12 +108,12 @@ class SmartWaiter:
                     lecture_elements = self._find_fresh_lecture_elements(section_content)
 
                     if not lecture_elements:
-                        self.log_callback(f"    🔄 시도 {attempt}: 강의 목록을 찾을 수 없음")
+                        self.log_callback.debug("    🔄 시도 %s: 강의 목록을 찾을 수 없음", attempt)
                         time.sleep(1)
                         continue
 
                     if len(lecture_elements) <= next_lecture_idx:
-                        self.log_callback(f"    🔄 시도 {attempt}: 강의 {next_lecture_idx + 1}번이 목록에 없음 ({len(lecture_elements)}개만 발견)")
+                        self.log_callback.debug("    🔄 시도 %s: 강의 %s번이 목록에 없음 (%s개만 발견)", attempt, next_lecture_idx + 1, len(lecture_elements))
                         time.sleep(1)
                         continue
 
@@ -123,12 +125,12 @@ class SmartWaiter:
                         return True
 
                     if attempt % 5 == 0:  # 5번마다 상태 로그
-                        self.log_callback(f"    🔄 시도 {attempt}: 강의 {next_lecture_idx + 1}번 아직 클릭 불가")
+                        self.log_callback.debug("    🔄 시도 %s: 강의 %s번 아직 클릭 불가", attempt, next_lecture_idx + 1)
 
                     time.sleep(1)
 
                 except Exception as inner_e:
-                    self.log_callback(f"    🔄 시도 {attempt} 강의 상태 확인 중... ({str(inner_e)[:50]})")
+                    self.log_callback.debug("    🔄 시도 %s 강의 상태 확인 중... (%s)", attempt, str(inner_e)[:50])
                     time.sleep(1)
 
             self.log_callback("    ⚠️ 다음 강의 클릭 가능 상태 대기 시간 초과")
@@ -514,7 +516,7 @@ class StateMonitor:
 
     def __init__(self, driver, log_callback=None):
         self.driver = driver
-        self.log_callback = log_callback or print
+        self.log_callback = as_logger(log_callback)
 
     def monitor_page_transition(self, from_state: str, to_state: str, max_wait=15) -> bool:
         """페이지 전환 모니터링"""
@@ -573,10 +575,10 @@ class StateMonitor:
     def _debug_lecture_clickability(self, lecture_element, lecture_idx: int):
         """강의 클릭 가능성 디버깅"""
         try:
-            self.log_callback(f"    🔍 강의 {lecture_idx + 1} 클릭 가능성 디버깅:")
-            self.log_callback(f"      태그: {lecture_element.tag_name}")
-            self.log_callback(f"      displayed: {lecture_element.is_displayed()}")
-            self.log_callback(f"      enabled: {lecture_element.is_enabled()}")
+            self.log_callback.debug(f"    🔍 강의 {lecture_idx + 1} 클릭 가능성 디버깅:")
+            self.log_callback.debug(f"      태그: {lecture_element.tag_name}")
+            self.log_callback.debug(f"      displayed: {lecture_element.is_displayed()}")
+            self.log_callback.debug(f"      enabled: {lecture_element.is_enabled()}")
 
             # 속성 정보
             classes = lecture_element.get_attribute('class') or 'None'
@@ -584,18 +586,18 @@ class StateMonitor:
             data_purpose = lecture_element.get_attribute('data-purpose') or 'None'
             aria_label = lecture_element.get_attribute('aria-label') or 'None'
 
-            self.log_callback(f"      class: {classes[:50]}")
-            self.log_callback(f"      href: {href[:50]}")
-            self.log_callback(f"      data-purpose: {data_purpose}")
-            self.log_callback(f"      aria-label: {aria_label[:50]}")
+            self.log_callback.debug(f"      class: {classes[:50]}")
+            self.log_callback.debug(f"      href: {href[:50]}")
+            self.log_callback.debug(f"      data-purpose: {data_purpose}")
+            self.log_callback.debug(f"      aria-label: {aria_label[:50]}")
 
             # 텍스트 내용
             text = lecture_element.text[:100] if lecture_element.text else 'None'
-            self.log_callback(f"      text: {text}")
+            self.log_callback.debug(f"      text: {text}")
 
             # 클릭 가능한 하위 요소 확인
             clickable_children = lecture_element.find_elements(By.CSS_SELECTOR, "a, button")
-            self.log_callback(f"      클릭 가능한 하위 요소 수: {len(clickable_children)}")
+            self.log_callback.debug(f"      클릭 가능한 하위 요소 수: {len(clickable_children)}")
 
         except Exception as e:
-            self.log_callback(f"      ❌ 디버깅 실패: {str(e)}")
\ No newline at end of file
+            self.log_callback.debug(f"      ❌ 디버깅 실패: {str(e)}")
\ No newline at end of file
@@ -3,9 +3,12 @@
 """
 
 import time
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.support import expected_conditions as EC
+from utils.logger import as_logger
+from .base import script_timeout
 from .selectors import UdemySelectors, ClickStrategies
 from .element_finder import ElementFinder, ClickHandler
 from .smart_waiter import SmartWaiter
@@ -17,7 +20,7 @@ class TranscriptExtractor:
     def __init__(self, driver, wait, log_callback=None):
         self.driver = driver
         self.wait = wait
-        self.log_callback = log_callback or print
+        self.log_callback = as_logger(log_callback)
         self.element_finder = ElementFinder(driver, wait, log_callback)
         self.click_handler = ClickHandler(driver, log_callback)
         self.smart_waiter = SmartWaiter(driver, wait, log_callback)
@@ -153,7 +156,8 @@ class TranscriptExtractor:
             cue_elements = self._find_transcript_cues(transcript_panel)
             if not cue_elements:
                 self.log_callback("    ❌ 트랜스크립트 cue 요소가 없습니다.")
-                self._debug_panel_contents(transcript_panel)
+                if self.log_callback.debug_enabled:
+                    self._debug_panel_contents(transcript_panel)
                 return None
 
             self.log_callback(f"    📊 트랜스크립트 cue 요소 {len(cue_elements)}개 발견")
@@ -173,6 +177,117 @@ class TranscriptExtractor:
             self.log_callback(f"    ❌ 트랜스크립트 내용 추출 중 오류: {str(e)}")
             return None
 
+    def is_panel_open(self) -> bool:
+        """트랜스크립트 패널이 열려 있는지 (호버 없이 캐시된 버튼으로 확인)"""
+        try:
+            button = self.element_finder.handle_cache.get('transcript_button', UdemySelectors.TRANSCRIPT_BUTTONS)
+            return bool(button) and button.get_attribute('aria-expanded') == 'true'
+        except Exception:
+            return False
+
+    def capture_first_cue(self):
+        """현재 트랜스크립트의 첫 번째 cue 요소와 텍스트 (강의 전환 감지용)"""
+        try:
+            return self.driver.execute_script(
+                "var cue = document.querySelector(arguments[0]);"
+                "return cue ? [cue, cue.textContent] : [null, ''];",
+                ", ".join(UdemySelectors.TRANSCRIPT_CUES)
+            )
+        except Exception:
+            return [None, ""]
+
+    def wait_for_cue_list_replaced(self, previous_cue, timeout=10) -> bool:
+        """패널을 연 채로 강의가 바뀌어 cue 목록이 새로 그려질 때까지 대기 (MutationObserver)"""
+        script = """
+            var selector = arguments[0];
+            var previous = arguments[1][0];
+            var previousText = arguments[1][1];
+            var timeoutMs = arguments[2];
+            var done = arguments[arguments.length - 1];
+            function replaced() {
+                var cue = document.querySelector(selector);
+                if (!cue || !cue.textContent.trim()) return false;
+                return !previous || !previous.isConnected || cue !== previous || cue.textContent !== previousText;
+            }
+            if (replaced()) { done(true); return; }
+            var observer = new MutationObserver(function () {
+                if (replaced()) { observer.disconnect(); clearTimeout(timer); done(true); }
+            });
+            observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+            var timer = setTimeout(function () { observer.disconnect(); done(replaced()); }, timeoutMs);
+        """
+        selector = ", ".join(UdemySelectors.TRANSCRIPT_CUES)
+        previous_cue = previous_cue or [None, ""]
+        try:
+            with script_timeout(self.driver, timeout + 5):
+                try:
+                    return bool(self.driver.execute_async_script(script, selector, previous_cue, int(timeout * 1000)))
+                except StaleElementReferenceException:
+                    # 이전 cue가 이미 분리됨 → 새 cue가 나타나기만 기다림
+                    return bool(self.driver.execute_async_script(script, selector, [None, ""], int(timeout * 1000)))
+        except Exception as e:
+            self.log_callback(f"    ⚠️ cue 목록 전환 대기 실패: {str(e)}")
+            return False
+
+    def caption_languages(self) -> List[Tuple[str, bool]]:
+        """플레이어 자막 메뉴의 언어 목록 [(이름, 선택 여부)] ("끄기" 제외)"""
+        languages = self._read_caption_menu()
+        if not languages and self._toggle_caption_menu():
+            # 메뉴가 열려야 항목이 그려지는 경우
+            languages = self._read_caption_menu()
+            self._toggle_caption_menu()
+        return [(label, checked) for label, checked in languages if label not in UdemySelectors.CAPTIONS_OFF_LABELS]
+
+    def select_caption_language(self, label: str, timeout=10) -> bool:
+        """자막 언어를 바꾸고 트랜스크립트 cue 목록이 새 언어로 다시 그려질 때까지 대기"""
+        previous_cue = self.capture_first_cue()
+        script = """
+            var items = document.querySelectorAll(arguments[0]);
+            for (var i = 0; i < items.length; i++) {
+                if (items[i].textContent.trim() === arguments[1]) {
+                    if (items[i].getAttribute('aria-checked') === 'true') return 'active';
+                    items[i].click();
+                    return 'clicked';
+                }
+            }
+            return 'missing';
+        """
+        try:
+            result = self.driver.execute_script(script, UdemySelectors.CAPTIONS_LANGUAGE_ITEMS, label)
+            if result == 'missing' and self._toggle_caption_menu():
+                result = self.driver.execute_script(script, UdemySelectors.CAPTIONS_LANGUAGE_ITEMS, label)
+            if result == 'active':
+                return True
+            if result != 'clicked':
+                self.log_callback(f"    ⚠️ 자막 언어를 찾을 수 없음: {label}")
+                return False
+        except Exception as e:
+            self.log_callback(f"    ⚠️ 자막 언어 전환 실패 ({label}): {str(e)}")
+            return False
+        return self.wait_for_cue_list_replaced(previous_cue, timeout)
+
+    def _read_caption_menu(self) -> List[Tuple[str, bool]]:
+        try:
+            items = self.driver.execute_script(
+                "return Array.from(document.querySelectorAll(arguments[0])).map(function (item) {"
+                "  return [item.textContent.trim(), item.getAttribute('aria-checked') === 'true']; });",
+                UdemySelectors.CAPTIONS_LANGUAGE_ITEMS
+            )
+            return [(label, bool(checked)) for label, checked in items or [] if label]
+        except Exception:
+            return []
+
+    def _toggle_caption_menu(self) -> bool:
+        """자막 메뉴 버튼 클릭 (열기/닫기)"""
+        try:
+            return bool(self.driver.execute_script(
+                "var button = document.querySelector(arguments[0]);"
+                "if (!button) return false; button.click(); return true;",
+                UdemySelectors.CAPTIONS_DROPDOWN_BUTTON
+            ))
+        except Exception:
+            return False
+
     def _wait_for_panel_open(self, transcript_button) -> bool:
         """패널이 열릴 때까지 대기"""
         try:
@@ -217,10 +332,10 @@ class TranscriptExtractor:
                     if text:
                         transcript_lines.append(text)
                         if i < 3:  # 처음 3개만 로그
-                            self.log_callback(f"      {i+1}. '{text[:30]}...'")
+                            self.log_callback.debug("      %d. '%s...'", i + 1, text[:30])
             except Exception as e:
                 if i < 3:
-                    self.log_callback(f"      ❌ {i+1}번째 cue 추출 실패: {str(e)}")
+                    self.log_callback.debug("      ❌ %d번째 cue 추출 실패: %s", i + 1, e)
                 continue
 
         return transcript_lines
@@ -241,13 +356,13 @@ class TranscriptExtractor:
     def _debug_panel_contents(self, panel_element):
         """패널 내용 디버깅"""
         try:
-            self.log_callback("    🔍 패널 내용 디버깅:")
-            self.log_callback(f"      패널 태그: {panel_element.tag_name}")
-            self.log_callback(f"      패널 클래스: {panel_element.get_attribute('class')}")
+            self.log_callback.debug("    🔍 패널 내용 디버깅:")
+            self.log_callback.debug(f"      패널 태그: {panel_element.tag_name}")
+            self.log_callback.debug(f"      패널 클래스: {panel_element.get_attribute('class')}")
 
             # 모든 자식 요소들 확인
             children = panel_element.find_elements(By.CSS_SELECTOR, "*")
-            self.log_callback(f"      자식 요소 수: {len(children)}")
+            self.log_callback.debug(f"      자식 요소 수: {len(children)}")
 
             # 처음 5개 자식 요소 정보
             for i, child in enumerate(children[:5]):
@@ -255,10 +370,10 @@ class TranscriptExtractor:
                 classes = child.get_attribute('class') or 'no-class'
                 data_purpose = child.get_attribute('data-purpose') or 'no-data-purpose'
                 text_preview = child.text[:50] if child.text else 'no-text'
-                self.log_callback(f"        {i+1}. {tag}.{classes} [{data_purpose}]: {text_preview}")
+                self.log_callback.debug(f"        {i+1}. {tag}.{classes} [{data_purpose}]: {text_preview}")
 
         except Exception as e:
-            self.log_callback(f"    ❌ 디버깅 중 오류: {str(e)}")
+            self.log_callback.debug(f"    ❌ 디버깅 중 오류: {str(e)}")
 
     def _wait_for_transcript_content_loaded(self, transcript_panel, max_wait_seconds=5) -> bool:
         """트랜스크립트 콘텐츠가 로딩될 때까지 스마트 대기"""
@@ -298,7 +413,7 @@ class VideoNavigator:
     def __init__(self, driver, wait, log_callback=None):
         self.driver = driver
         self.wait = wait
-        self.log_callback = log_callback or print
+        self.log_callback = as_logger(log_callback)
         self.smart_waiter = SmartWaiter(driver, wait, log_callback)
 
     def wait_for_video_page_load(self, lecture_type_hint=None) -> bool:
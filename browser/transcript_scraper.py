@@ -4,14 +4,27 @@ Udemy 강의 자막/스크립트 추출 모듈 (리팩토링된 버전)
 
 import time
 import os
-from typing import Optional, List
+import re
+from itertools import groupby
+from pathlib import Path
+from typing import Dict, Optional, List, Tuple
 from selenium.webdriver.common.by import By
 from config import Config
-from core.models import Course, Section, Lecture
+from core.models import Course, Section, Lecture, ScrapingProgress
 from utils.file_utils import ensure_directory, sanitize_filename
+from utils.curriculum_cache import CurriculumCache
+from utils.course_manifest import CourseManifest
+from utils.work_scheduler import lecture_weights, longest_first
+from utils.run_metrics import get_metrics
+from utils.rate_limiter import get_scheduler, NAVIGATION
+from utils.retry import retry_call, FailureQueue, FailedLecture, CLICK, PAGE_LOAD, PANEL_OPEN, EXTRACTION
 from .base import BrowserBase
 from .element_finder import ElementFinder, ClickHandler, SectionNavigator
 from .transcript_extractor import TranscriptExtractor, VideoNavigator
+from .lecture_pipeline import LecturePrefetchPipeline
+from .cdp_backend import CDPTranscriptBackend
+from .curriculum_classifier import CurriculumClassifier
+from .session_watchdog import SessionWatchdog
 from .selectors import UdemySelectors
 from .smart_waiter import SmartWaiter
 from section_merger import SectionMerger
@@ -23,19 +36,75 @@ class TranscriptScraper(BrowserBase):
     def __init__(self, driver, wait, log_callback=None):
         super().__init__(driver, wait, log_callback)
         self.current_course = None
-
-        # 헬퍼 클래스들 초기화
+        self.failures = FailureQueue()
+        self.watchdog = SessionWatchdog(driver, self.log_callback) if Config.SESSION_WATCHDOG_ENABLED else None
+        self._resume_url = None  # 세션 복구 후 돌아갈 마지막 강의 페이지
+        self.shard: Optional[Tuple[int, int]] = None  # (번호, 전체 수) - 멀티 프로세스 분할 시 맡은 강의만 처리
+        self.shard_plan: Optional[Dict[Tuple[int, int], int]] = None  # (섹션, 강의) → 담당 분할 번호 (오케스트레이터가 계산)
+        self.only_sections: Optional[set] = None  # 작업 큐의 섹션 작업이면 맡은 섹션 인덱스만 처리
+        self.update_targets: Optional[set] = None  # 업데이트 모드면 다시 추출할 (섹션, 강의) 위치만 처리
+        self._superseded = {}  # 업데이트 모드: (섹션, 강의) → 새 자막 저장 후 지울 이전 파일 항목
+        self._merged_sections = set()
+        self.progress = ScrapingProgress()  # 재생 시간 가중 진행률/남은 시간
+        self.progress_callback = None  # (완료 강의 수, 전체 강의 수)
+        self.status_callback = None  # 상태 메시지 (남은 시간 포함)
+        self._weights = {}  # (섹션, 강의) → 재생 시간 초
+        self._completed = set()
+        self._init_helpers()
+
+    def _init_helpers(self):
+        """헬퍼 클래스들 초기화 (세션 복구 후 새 드라이버로 다시 생성)"""
+        driver, wait, log_callback = self.driver, self.wait, self.log_callback
         self.element_finder = ElementFinder(driver, wait, log_callback)
         self.click_handler = ClickHandler(driver, log_callback)
         self.section_navigator = SectionNavigator(driver, wait, log_callback)
         self.transcript_extractor = TranscriptExtractor(driver, wait, log_callback)
         self.video_navigator = VideoNavigator(driver, wait, log_callback)
         self.smart_waiter = SmartWaiter(driver, wait, log_callback)
+        self.classifier = CurriculumClassifier(driver, wait, log_callback)
+
+    def rebind_driver(self, driver, wait):
+        """새 드라이버로 교체하고 헬퍼 재생성"""
+        self.driver = driver
+        self.wait = wait
+        self._init_helpers()
+
+    def _ensure_session(self, section_idx: Optional[int] = None) -> bool:
+        """세션이 살아 있는지 확인하고, 끊겼으면 복구 (복구 실패 시 False)"""
+        if not self.watchdog or self.watchdog.is_alive():
+            return True
+        return self._restore_session(section_idx)
+
+    def _session_recovered(self, section_idx: int) -> bool:
+        """실패 원인이 세션 끊김이었고 복구에 성공했는지"""
+        if not self.watchdog or self.watchdog.is_alive():
+            return False
+        return self._restore_session(section_idx)
+
+    def _restore_session(self, section_idx: Optional[int] = None) -> bool:
+        """재연결 후 마지막 강의 페이지와 섹션 상태 복원"""
+        self.log_callback.warning("🩺 브라우저 세션 끊김 감지")
+        restored = self.watchdog.reconnect()
+        if not restored:
+            return False
+
+        self.rebind_driver(*restored)
+        try:
+            if self._resume_url:
+                self.navigate(self._resume_url)
+            self._ensure_normal_body_state()
+            if section_idx is not None:
+                self.section_navigator.open_section_accordion(section_idx)
+        except Exception as e:
+            self.log_callback(f"⚠️ 세션 복구 후 페이지 복원 실패: {str(e)}")
+        return True
 
     def start_complete_scraping_workflow(self, course: Course) -> bool:
         """전체 스크래핑 워크플로우 시작"""
         try:
             self.current_course = course
+            self.failures = FailureQueue()
+            self._resume_url = self.driver.current_url
             self.log_callback("🚀 전체 스크래핑 워크플로우 시작...")
             self.log_callback(f"📚 대상 강의: {course.title}")
             self.log_callback(f"📊 총 {len(course.sections)}개 섹션, {course.total_lectures}개 강의")
@@ -51,11 +120,45 @@ class TranscriptScraper(BrowserBase):
                     self.log_callback("❌ 커리큘럼 재분석 실패")
                     return False
 
+            # 업데이트 모드: 이전 실행의 매니페스트와 비교해 바뀐 강의만 처리
+            self.update_targets = None
+            self._superseded = {}
+            self._merged_sections = set()
+            affected_sections = set()
+            if Config.UPDATE_ONLY:
+                plan = self._plan_update(course)
+                if plan is not None:
+                    self.update_targets, affected_sections = plan
+                    if not self.update_targets:
+                        for section_idx in sorted(affected_sections):
+                            self._create_section_merged_file(section_idx)
+                        self._save_manifest(course)
+                        self.log_callback("✅ 다시 추출할 강의 없음 - 업데이트 완료")
+                        return True
+
+            self._plan_work(course)
+
             # 모든 섹션 처리
             success_count = 0
             total_sections = len(course.sections)
 
-            for section_idx, section in enumerate(course.sections):
+            # CDP 백엔드 또는 두 탭 미리 로딩 모드 (준비 실패 시 기존 클릭 방식으로 진행)
+            pipelined = None
+            if Config.BROWSER_BACKEND == 'cdp' and Config.CAPTION_LANGUAGES:
+                # CDP 백엔드는 현재 자막 언어만 추출하므로 다른 언어를 요청하면 Selenium 경로 사용
+                self.log_callback.warning("⚠️ CAPTION_LANGUAGES는 CDP 백엔드에서 지원하지 않음 - Selenium 방식으로 진행")
+            elif Config.BROWSER_BACKEND == 'cdp':
+                pipelined = self._process_course_cdp(course)
+            if pipelined is None and Config.PREFETCH_NEXT_LECTURE:
+                pipelined = self._process_course_pipelined(course)
+            if pipelined is not None:
+                success_count = pipelined
+
+            for section_idx, section in enumerate(course.sections if pipelined is None else []):
+                if self.only_sections is not None and section_idx not in self.only_sections:
+                    continue
+                if self.update_targets is not None and not any(target[0] == section_idx for target in self.update_targets):
+                    continue
                 self.log_callback(f"\\n📁 섹션 {section_idx + 1}/{total_sections}: {section.title}")
 
                 if self._process_section(section, section_idx):
@@ -67,7 +170,21 @@ class TranscriptScraper(BrowserBase):
                 # 섹션 간 최소 대기 (성능 최적화)
                 time.sleep(0.5)
 
+            # 실패한 강의는 깨끗한 페이지 상태에서 한 번 더 처리하고, 남은 실패는 기록
+            self._retry_failed_lectures()
+            failed_file = self.failures.save(self._course_output_dir(), self._failures_file_name())
+            if failed_file:
+                self.log_callback(f"⚠️ 끝내 실패한 강의 {len(self.failures)}개 - {failed_file}에 기록")
+
+            # 파일 이동/삭제만 있었던 섹션도 통합 파일 다시 생성
+            for section_idx in sorted(affected_sections - self._merged_sections):
+                self._create_section_merged_file(section_idx)
+            self._save_manifest(course)
+
             self.log_callback(f"\\n🏁 스크래핑 완료: {success_count}/{total_sections}개 섹션 성공")
+
+            # 방문하며 확인한 강의 ID를 캐시에 반영
+            CurriculumCache(log_callback=self.log_callback).save(course)
             return success_count > 0
 
         except Exception as e:
@@ -123,6 +240,119 @@ class TranscriptScraper(BrowserBase):
             self.log_callback(f"❌ 커리큘럼 재분석 중 오류: {str(e)}")
             return False
 
+    def _process_course_pipelined(self, course: Course) -> Optional[int]:
+        """두 탭 파이프라인으로 전체 강의 처리 (성공 섹션 수, 준비 실패 시 None)"""
+        pipeline = LecturePrefetchPipeline(self.driver, self.wait, self.log_callback)
+        jobs = pipeline.build_jobs(course, include=self._in_shard)
+        if not jobs:
+            self.log_callback("⚠️ 강의 ID를 확인하지 못해 미리 로딩 모드를 사용할 수 없음 - 기존 방식으로 진행")
+            return None
+        if not pipeline.open():
+            return None
+
+        self.log_callback(f"🗂️ 두 탭 미리 로딩 모드: {len(jobs)}개 강의")
+        succeeded_sections = set()
+        try:
+            pipeline.prefetch(jobs[0].lecture)
+            for job_idx, job in enumerate(jobs):
+                reconnects = self.watchdog.reconnect_count if self.watchdog else 0
+                if not self._ensure_session():
+                    for remaining in jobs[job_idx:]:
+                        self._fail(remaining.section_idx, remaining.lecture_idx, remaining.lecture.title,
+                                   "session", "브라우저 세션 복구 실패")
+                    break
+                if self.watchdog and self.watchdog.reconnect_count != reconnects:
+                    # 새 브라우저에는 대기 탭이 없으므로 다시 준비하고 현재 강의부터 미리 로딩
+                    pipeline = LecturePrefetchPipeline(self.driver, self.wait, self.log_callback)
+                    if not pipeline.open():
+                        break
+                    pipeline.prefetch(job.lecture)
+
+                # 미리 로딩된 탭으로 전환하고, 비워진 탭에서 다음 강의 로딩 시작
+                pipeline.swap()
+                self._resume_url = pipeline.lecture_url(job.lecture)
+                if job_idx + 1 < len(jobs):
+                    pipeline.prefetch(jobs[job_idx + 1].lecture)
+
+                with get_metrics().busy():
+                    result = self._process_prefetched_lecture(job, pipeline.lecture_url(job.lecture))
+                if result == "success":
+                    succeeded_sections.add(job.section_idx)
+
+                # 섹션의 마지막 작업이면 섹션 통합 파일 생성
+                next_section = jobs[job_idx + 1].section_idx if job_idx + 1 < len(jobs) else None
+                if next_section != job.section_idx and job.section_idx in succeeded_sections:
+                    self._create_section_merged_file(job.section_idx)
+        finally:
+            pipeline.close()
+
+        return len(succeeded_sections)
+
+    def _process_course_cdp(self, course: Course) -> Optional[int]:
+        """CDP 웹소켓 백엔드로 여러 탭에서 동시에 추출 (성공 섹션 수, 준비 실패 시 None)"""
+        pipeline = LecturePrefetchPipeline(self.driver, self.wait, self.log_callback)
+        jobs = pipeline.build_jobs(course, include=self._in_shard)
+        if not jobs or not pipeline.read_course_slug():
+            self.log_callback("⚠️ 강의 ID를 확인하지 못해 CDP 백엔드를 사용할 수 없음 - 기존 방식으로 진행")
+            return None
+
+        # 탭들이 동시에 끝나도록 긴 강의부터 배분
+        jobs = longest_first(jobs, lambda job: self._weights.get((job.section_idx, job.lecture_idx), 0))
+        port = self.watchdog.debug_port if self.watchdog else Config.CHROME_DEBUG_PORT
+        backend = CDPTranscriptBackend(port, self.log_callback)
+        try:
+            results = backend.extract_transcripts({
+                (job.section_idx, job.lecture_idx): pipeline.lecture_url(job.lecture) for job in jobs
+            })
+        except Exception as e:
+            self.log_callback(f"⚠️ CDP 백엔드 사용 불가 ({str(e)}) - 기존 방식으로 진행")
+            return None
+
+        succeeded_sections = set()
+        for job in sorted(jobs, key=lambda job: (job.section_idx, job.lecture_idx)):
+            content, stage = results.get((job.section_idx, job.lecture_idx), (None, PAGE_LOAD))
+            if not content:
+                # 실패한 강의는 실행 끝의 Selenium 재처리로 넘김
+                self._fail(job.section_idx, job.lecture_idx, job.lecture.title, stage, "CDP 추출 실패")
+                continue
+            self._save_transcript(content, job.lecture.title, job.section_idx, job.lecture_idx)
+            succeeded_sections.add(job.section_idx)
+
+        for section_idx in sorted(succeeded_sections):
+            self._create_section_merged_file(section_idx)
+        self.log_callback(f"⚡ CDP 백엔드 완료: {len(jobs) - len(self.failures)}/{len(jobs)}개 강의 추출")
+        return len(succeeded_sections)
+
+    def _process_prefetched_lecture(self, job, lecture_url: str) -> str:
+        """미리 로딩된 탭에서 강의 하나 추출/저장 (로딩 실패 시 lecture_url로 다시 이동)"""
+        lecture = job.lecture
+        log = self.log_callback.bind(section=job.section_idx + 1, lecture=job.lecture_idx + 1)
+        try:
+            self.log_callback(f"  📚 섹션 {job.section_idx + 1} 강의 {job.lecture_idx + 1}: {lecture.title}")
+
+            # 대기 탭에서 이미 로딩이 진행됐으므로 대부분 바로 통과
+            with log.timed("page_load"):
+                page_loaded = retry_call(PAGE_LOAD, self.video_navigator.wait_for_video_page_load,
+                                         lecture_type_hint=lecture.lecture_type, log=log,
+                                         before_retry=lambda: self.navigate(lecture_url))
+            if not page_loaded:
+                log.warning("    ⚠️ 강의 페이지 로딩 실패 - 실행 끝에 재시도", stage="page_load")
+                return self._fail(job.section_idx, job.lecture_idx, lecture.title, PAGE_LOAD, "강의 페이지 로딩 실패")
+
+            with log.timed("transcript"):
+                transcript_content, failed_stage = self._extract_transcript_with_retry(log)
+            if not transcript_content:
+                self.log_callback(f"    ⚠️ 트랜스크립트 추출 실패 - 실행 끝에 재시도")
+                return self._fail(job.section_idx, job.lecture_idx, lecture.title, failed_stage, "트랜스크립트 추출 실패")
+
+            self._save_transcript(transcript_content, lecture.title, job.section_idx, job.lecture_idx)
+            self._capture_caption_languages(lecture.title, job.section_idx, job.lecture_idx, log)
+            return "success"
+
+        except Exception as e:
+            self.log_callback(f"    ❌ 강의 {job.lecture_idx + 1} 처리 중 오류: {str(e)}")
+            return self._fail(job.section_idx, job.lecture_idx, lecture.title, "error", str(e))
+
     def _process_section(self, section: Section, section_idx: int) -> bool:
         """개별 섹션 처리"""
         try:
@@ -161,39 +391,55 @@ class TranscriptScraper(BrowserBase):
             lecture_elements = self._find_lecture_elements(section_content)
             if not lecture_elements:
                 self.log_callback(f"❌ 섹션 {section_idx + 1}에서 강의를 찾을 수 없음")
-                # 디버깅: 섹션 내용 구조 확인
-                self._debug_section_structure(section_content, section_idx)
+                # 디버깅: 섹션 내용 구조 확인 (DEBUG 레벨에서만 DOM 탐색)
+                if self.log_callback.debug_enabled:
+                    self._debug_section_structure(section_content, section_idx)
                 return False
 
             self.log_callback(f"🔍 섹션 {section_idx + 1}에서 {len(lecture_elements)}개 강의 발견")
 
+            # 비디오가 아닌 항목은 클릭하기 전에 작업 목록에서 제외
+            lecture_types = self._section_lecture_types(section, section_idx, len(lecture_elements))
+            video_indices = [idx for idx, lecture_type in enumerate(lecture_types) if lecture_type in ("video", "unknown")]
+
             # 각 강의 처리 (스마트 대기 적용)
             success_count = 0
-            skip_count = 0
-
-            for lecture_idx in range(len(lecture_elements)):
-                # 각 강의마다 DOM에서 최신 요소를 다시 찾기 (stale element 방지)
-                # 섹션 콘텐츠 영역도 다시 찾기
-                fresh_section_content = self._find_section_content_area(section_idx)
-                if not fresh_section_content:
-                    self.log_callback(f"  ⚠️ 섹션 {section_idx + 1} 콘텐츠 영역을 다시 찾을 수 없음 - 건너뜀")
-                    skip_count += 1
-                    continue
+            skip_count = len(lecture_elements) - len(video_indices)
+            if skip_count:
+                self.log_callback(f"  ⏭️ 비디오가 아닌 항목 {skip_count}개 제외 (문서/퀴즈/리소스)")
+            if not video_indices:
+                # 추출할 강의가 없는 섹션은 실패가 아님 (섹션 작업이 재시도되지 않도록)
+                return True
 
-                fresh_lecture_elements = self._find_lecture_elements(fresh_section_content)
-                if not fresh_lecture_elements or len(fresh_lecture_elements) <= lecture_idx:
-                    self.log_callback(f"  ⚠️ 강의 {lecture_idx + 1} 요소를 다시 찾을 수 없음 - 건너뜀")
+            # 분할 실행이면 다른 프로세스가 맡은 강의, 업데이트 모드면 바뀌지 않은 강의 제외
+            shard_indices = [idx for idx in video_indices if self._in_shard(section_idx, idx)]
+            if len(shard_indices) != len(video_indices):
+                if self.shard:
+                    self.log_callback(f"  🧩 분할 {self.shard[0] + 1}/{self.shard[1]}: {len(shard_indices)}/{len(video_indices)}개 강의 담당")
+                else:
+                    self.log_callback(f"  🔄 변경된 강의 {len(shard_indices)}/{len(video_indices)}개만 처리")
+                if not shard_indices:
+                    return True
+                video_indices = shard_indices
+
+            for lecture_idx in video_indices:
+                # 세션이 끊겼으면 복구 후 현재 강의부터 이어서 진행
+                if not self._ensure_session(section_idx):
+                    self._fail(section_idx, lecture_idx, "", "session", "브라우저 세션 복구 실패")
                     skip_count += 1
                     continue
 
-                current_lecture_element = fresh_lecture_elements[lecture_idx]
-
-                # 강의 처리
-                result = self._process_single_lecture(current_lecture_element, lecture_idx, section_idx, fresh_section_content)
+                with get_metrics().busy():
+                    result = self._process_lecture_at(section_idx, lecture_idx, lecture_types[lecture_idx])
+                if result != "success" and self._session_recovered(section_idx):
+                    # 세션 끊김으로 실패한 강의는 복구 직후 한 번 더
+                    self._unfail(section_idx, lecture_idx)
+                    with get_metrics().busy():
+                        result = self._process_lecture_at(section_idx, lecture_idx, lecture_types[lecture_idx])
 
                 if result == "success":
                     success_count += 1
-                elif result == "skip":
+                else:
                     skip_count += 1
 
             # 결과 로그
@@ -206,14 +452,47 @@ class TranscriptScraper(BrowserBase):
             self.log_callback(f"❌ 섹션 {section_idx + 1} 비디오 처리 실패: {str(e)}")
             return False
 
-    def _process_single_lecture(self, lecture_element, lecture_idx: int, section_idx: int, section_content=None) -> str:
+    def _process_lecture_at(self, section_idx: int, lecture_idx: int, lecture_type: str) -> str:
+        """섹션 내 lecture_idx번째 강의를 DOM에서 다시 찾아 처리"""
+        # 각 강의마다 DOM에서 최신 요소를 다시 찾기 (stale element 방지)
+        # 섹션 콘텐츠 영역도 다시 찾기
+        fresh_section_content = self._find_section_content_area(section_idx)
+        if not fresh_section_content:
+            self.log_callback(f"  ⚠️ 섹션 {section_idx + 1} 콘텐츠 영역을 다시 찾을 수 없음 - 건너뜀")
+            return "skip"
+
+        fresh_lecture_elements = self._find_lecture_elements(fresh_section_content)
+        if not fresh_lecture_elements or len(fresh_lecture_elements) <= lecture_idx:
+            self.log_callback(f"  ⚠️ 강의 {lecture_idx + 1} 요소를 다시 찾을 수 없음 - 실행 끝에 재시도")
+            return self._fail(section_idx, lecture_idx, "", CLICK, "강의 요소를 찾을 수 없음")
+
+        # 강의 처리
+        return self._process_single_lecture(fresh_lecture_elements[lecture_idx], lecture_idx, section_idx,
+                                            fresh_section_content, lecture_type=lecture_type)
+
+    def _section_lecture_types(self, section: Section, section_idx: int, element_count: int) -> List[str]:
+        """섹션 항목 타입 목록 (분류된 커리큘럼 우선, 없으면 섹션 스냅샷 한 번)"""
+        types = [lecture.lecture_type for lecture in section.lectures]
+        if len(types) == element_count and "unknown" not in types:
+            return types
+
+        snapshot_types = self.classifier.section_types(section_idx)
+        if len(snapshot_types) == element_count:
+            return snapshot_types
+
+        # 대응이 안 되면 분류 없이 전부 처리 (강의별 아이콘 감지로 대체)
+        return ["unknown"] * element_count
+
+    def _process_single_lecture(self, lecture_element, lecture_idx: int, section_idx: int, section_content=None,
+                                lecture_type: Optional[str] = None) -> str:
         """개별 강의 처리"""
         try:
             # 강의 제목 추출
             lecture_title = self._extract_lecture_title(lecture_element)
 
-            # 강의 타입 감지 (커리큘럼 아이콘 기반)
-            lecture_type = self._get_lecture_type_from_element(lecture_element)
+            # 강의 타입 감지 (일괄 분류 결과가 없을 때만 커리큘럼 아이콘 조회)
+            if not lecture_type or lecture_type == "unknown":
+                lecture_type = self._get_lecture_type_from_element(lecture_element)
             self.log_callback(f"  📚 강의 {lecture_idx + 1}: {lecture_title} (타입: {lecture_type})")
 
             # 문서/아티클 강의는 스킵 (트랜스크립트가 없음)
@@ -226,28 +505,72 @@ class TranscriptScraper(BrowserBase):
                 self.log_callback(f"    ⏭️ {lecture_type} 강의는 스킵합니다 - 트랜스크립트 없음")
                 return "skip"
 
+            # 패널 유지 모드: 이미 열린 패널의 cue 목록이 바뀌는 것으로 강의 전환 감지
+            keep_open = Config.KEEP_TRANSCRIPT_PANEL_OPEN and self.transcript_extractor.is_panel_open()
+            previous_cue = self.transcript_extractor.capture_first_cue() if keep_open else None
+
+            log = self.log_callback.bind(section=section_idx + 1, lecture=lecture_idx + 1)
+
             # 강의 클릭 (디버깅 추가)
             self.log_callback(f"    🖱️ 강의 {lecture_idx + 1} 클릭 시도 중...")
-            if not self.click_handler.click_lecture_item(lecture_element):
+            get_scheduler().acquire(NAVIGATION)  # 강의 클릭도 페이지 이동으로 계산
+            clicked = self.click_handler.click_lecture_item(lecture_element)
+            if not clicked and keep_open:
+                # 패널에 가려 클릭이 안 되면 패널을 닫고 일반 모드로 한 번 더 시도
+                self.log_callback("    🔄 패널을 닫고 다시 클릭 시도...")
+                self.transcript_extractor.close_transcript_panel()
+                keep_open = False
+            if not clicked:
+                clicked = retry_call(CLICK, self.click_handler.click_lecture_item, lecture_element, log=log)
+            if not clicked:
                 self.log_callback(f"    ❌ 강의 클릭 실패")
-                # 클릭 실패 원인 디버깅
-                self._debug_click_failure(lecture_element, lecture_idx)
-                return "skip"
+                # 클릭 실패 원인 디버깅 (DEBUG 레벨에서만 DOM 탐색)
+                if self.log_callback.debug_enabled:
+                    self._debug_click_failure(lecture_element, lecture_idx)
+                return self._fail(section_idx, lecture_idx, lecture_title, CLICK, "강의 클릭 실패")
             self.log_callback(f"    ✅ 강의 {lecture_idx + 1} 클릭 성공")
 
-            # 페이지 로딩 대기 (타입별 최적화된 대기)
-            if not self.video_navigator.wait_for_video_page_load(lecture_type_hint=lecture_type):
-                self.log_callback(f"    ⚠️ 강의 페이지 로딩 실패 - 건너뜀")
-                return "skip"
+            if keep_open:
+                # 패널 토글 없이 새 cue 목록이 그려질 때까지만 대기
+                with log.timed("cue_switch"):
+                    switched = self.transcript_extractor.wait_for_cue_list_replaced(previous_cue, Config.CUE_SWITCH_TIMEOUT)
+                if not switched:
+                    log.warning("    ⚠️ 트랜스크립트 전환 감지 실패 - 실행 끝에 재시도", stage="cue_switch")
+                    return self._fail(section_idx, lecture_idx, lecture_title, PAGE_LOAD, "트랜스크립트 전환 감지 실패")
+
+                self._record_lecture_id(section_idx, lecture_idx)
+
+                with log.timed("transcript"):
+                    transcript_content = retry_call(EXTRACTION, self.transcript_extractor.extract_transcript_content, log=log)
+                failed_stage = EXTRACTION
+            else:
+                # 페이지 로딩 대기 (타입별 최적화된 대기)
+                with log.timed("page_load"):
+                    page_loaded = retry_call(PAGE_LOAD, self.video_navigator.wait_for_video_page_load,
+                                             lecture_type_hint=lecture_type, log=log,
+                                             before_retry=lambda: self._reclick_lecture(lecture_element))
+                if not page_loaded:
+                    log.warning("    ⚠️ 강의 페이지 로딩 실패 - 실행 끝에 재시도", stage="page_load")
+                    return self._fail(section_idx, lecture_idx, lecture_title, PAGE_LOAD, "강의 페이지 로딩 실패")
+
+                self._record_lecture_id(section_idx, lecture_idx)
+
+                # 트랜스크립트 추출 (패널 열기 / 내용 추출 단계별 재시도)
+                with log.timed("transcript"):
+                    transcript_content, failed_stage = self._extract_transcript_with_retry(log)
 
-            # 트랜스크립트 추출 (타입 힌트 전달)
-            transcript_content = self.transcript_extractor.extract_transcript_from_video()
             if not transcript_content:
-                self.log_callback(f"    ⚠️ 트랜스크립트 추출 실패 - 건너뜀")
-                return "skip"
+                self.log_callback(f"    ⚠️ 트랜스크립트 추출 실패 - 실행 끝에 재시도")
+                return self._fail(section_idx, lecture_idx, lecture_title, failed_stage, "트랜스크립트 추출 실패")
 
-            # 파일 저장
+            # 파일 저장 (CAPTION_LANGUAGES면 같은 방문에서 다른 언어도)
             self._save_transcript(transcript_content, lecture_title, section_idx, lecture_idx)
+            self._capture_caption_languages(lecture_title, section_idx, lecture_idx, log)
+
+            # 패널 유지 모드에서는 닫지 않고 다음 강의로 진행
+            if Config.KEEP_TRANSCRIPT_PANEL_OPEN:
+                self.log_callback(f"    ✅ 강의 {lecture_idx + 1} 자막 추출 완료 (패널 유지)")
+                return "success"
 
             # 섹션 목록으로 돌아가기 (스마트 대기)
             if self._return_to_section_list_smart(section_content):
@@ -259,7 +582,224 @@ class TranscriptScraper(BrowserBase):
 
         except Exception as e:
             self.log_callback(f"    ❌ 강의 {lecture_idx + 1} 처리 중 오류: {str(e)}")
-            return "error"
+            return self._fail(section_idx, lecture_idx, "", "error", str(e))
+
+    def _reclick_lecture(self, lecture_element):
+        """페이지 로딩 재시도 전에 강의를 다시 클릭 (페이지 이동으로 계산)"""
+        get_scheduler().acquire(NAVIGATION)
+        self.click_handler.click_lecture_item(lecture_element)
+
+    def _extract_transcript_with_retry(self, log):
+        """패널 열기와 내용 추출을 단계별 정책으로 재시도 → (내용, 실패 단계)"""
+        if not retry_call(PANEL_OPEN, self.transcript_extractor.open_transcript_panel, log=log):
+            return None, PANEL_OPEN
+        content = retry_call(EXTRACTION, self.transcript_extractor.extract_transcript_content, log=log)
+        return content, EXTRACTION
+
+    def _capture_caption_languages(self, lecture_title: str, section_idx: int, lecture_idx: int, log):
+        """자막 언어를 바꿔 가며 다른 언어 트랜스크립트를 languages/<언어>/에 저장하고 원래 언어로 복귀"""
+        if not Config.CAPTION_LANGUAGES:
+            return
+
+        languages = self.transcript_extractor.caption_languages()
+        active = next((label for label, checked in languages if checked), None)
+        others = [label for label in self._wanted_caption_languages([label for label, _ in languages]) if label != active]
+        if not others:
+            return
+
+        try:
+            for language in others:
+                with log.timed("caption_language", language=language):
+                    switched = self.transcript_extractor.select_caption_language(language, Config.CUE_SWITCH_TIMEOUT)
+                    content = retry_call(EXTRACTION, self.transcript_extractor.extract_transcript_content, log=log) if switched else None
+                if content:
+                    self._save_transcript(content, lecture_title, section_idx, lecture_idx, language=language)
+                else:
+                    log.warning(f"    ⚠️ {language} 자막 추출 실패", stage="caption_language")
+        finally:
+            # 다음 강의도 원래 언어로 기본 파일을 저장하도록 복귀
+            if active and not self.transcript_extractor.select_caption_language(active, Config.CUE_SWITCH_TIMEOUT):
+                log.warning(f"    ⚠️ 자막 언어 복귀 실패: {active}", stage="caption_language")
+
+    @staticmethod
+    def _wanted_caption_languages(available: List[str]) -> List[str]:
+        """CAPTION_LANGUAGES 설정에 해당하는 언어 (all이면 전부, 아니면 이름 앞부분 일치)"""
+        setting = Config.CAPTION_LANGUAGES.strip()
+        if setting.lower() == 'all':
+            return available
+        wanted = [name.strip() for name in setting.split(",") if name.strip()]
+        return [label for label in available if any(label == name or label.startswith(name) for name in wanted)]
+
+    def _fail(self, section_idx: int, lecture_idx: int, title: str, stage: str, reason: str) -> str:
+        """실패 큐에 강의를 넣고 "failed" 반환"""
+        get_metrics().record_failure(stage)
+        lecture = self._lecture_model(section_idx, lecture_idx)
+        self.failures.add(FailedLecture(
+            section_idx=section_idx,
+            lecture_idx=lecture_idx,
+            title=title or (lecture.title if lecture else ""),
+            stage=stage,
+            reason=reason,
+            lecture_id=lecture.lecture_id if lecture else None
+        ))
+        return "failed"
+
+    def _unfail(self, section_idx: int, lecture_idx: int):
+        """다시 처리할 강의를 실패 큐와 처리량 지표의 실패 수에서 제거"""
+        failure = self.failures.discard(section_idx, lecture_idx)
+        if failure:
+            get_metrics().record_recovery(failure.stage)
+
+    def _requeue(self, failure: FailedLecture):
+        """재처리하지 못한 강의를 실패 큐에 되돌림"""
+        get_metrics().record_failure(failure.stage)
+        self.failures.add(failure)
+
+    def _lecture_model(self, section_idx: int, lecture_idx: int) -> Optional[Lecture]:
+        """커리큘럼 모델의 강의 (없으면 None)"""
+        if not self.current_course or section_idx >= len(self.current_course.sections):
+            return None
+        lectures = self.current_course.sections[section_idx].lectures
+        return lectures[lecture_idx] if lecture_idx < len(lectures) else None
+
+    def _retry_failed_lectures(self):
+        """실패 큐를 페이지를 새로 불러온 상태에서 한 번 더 처리"""
+        failures = self.failures.drain()
+        if not failures:
+            return
+        # 대시보드 실패 수는 재처리 결과로 다시 집계 (복구된 강의는 빠짐)
+        for failure in failures:
+            get_metrics().record_recovery(failure.stage)
+
+        self.log_callback(f"\\n🔁 실패한 강의 {len(failures)}개 재처리 (페이지 새로 고침 후)")
+        try:
+            self.navigate(self.driver.current_url)
+            self._ensure_normal_body_state()
+        except Exception as e:
+            self.log_callback(f"⚠️ 재처리 전 페이지 초기화 실패: {str(e)}")
+
+        recovered_sections = set()
+        for section_idx, group in groupby(failures, key=lambda failure: failure.section_idx):
+            group = list(group)
+            if not self.section_navigator.open_section_accordion(section_idx):
+                for failure in group:
+                    self._requeue(failure)
+                continue
+
+            for failure in group:
+                section_content = self._find_section_content_area(section_idx)
+                elements = self._find_lecture_elements(section_content) if section_content else []
+                if len(elements) <= failure.lecture_idx:
+                    self._requeue(failure)
+                    continue
+
+                lecture = self._lecture_model(section_idx, failure.lecture_idx)
+                with get_metrics().busy():
+                    result = self._process_single_lecture(elements[failure.lecture_idx], failure.lecture_idx, section_idx,
+                                                          section_content, lecture_type=lecture.lecture_type if lecture else None)
+                if result == "success":
+                    recovered_sections.add(section_idx)
+
+        for section_idx in sorted(recovered_sections):
+            self._create_section_merged_file(section_idx)
+        self.log_callback(f"🔁 재처리 결과: {len(failures) - len(self.failures)}개 복구, {len(self.failures)}개 실패")
+
+    def _course_output_dir(self) -> Path:
+        """강의 출력 폴더"""
+        return Path("output") / sanitize_filename(self.current_course.title)
+
+    def _in_shard(self, section_idx: int, lecture_idx: int) -> bool:
+        """맡은 섹션이고, 분할 배정(없으면 강의 전체 순번) 기준으로 이 프로세스가 맡은 강의인지 (업데이트 모드면 바뀐 강의만)"""
+        if self.only_sections is not None and section_idx not in self.only_sections:
+            return False
+        if self.update_targets is not None and (section_idx, lecture_idx) not in self.update_targets:
+            return False
+        if not self.shard or not self.current_course:
+            return True
+        shard_index, shard_count = self.shard
+        if self.shard_plan and (section_idx, lecture_idx) in self.shard_plan:
+            return self.shard_plan[(section_idx, lecture_idx)] == shard_index
+        ordinal = sum(len(section.lectures) for section in self.current_course.sections[:section_idx]) + lecture_idx
+        return ordinal % shard_count == shard_index
+
+    def _plan_work(self, course: Course):
+        """강의별 재생 시간으로 진행률 작업량 계산 (분할 배정은 오케스트레이터가 한 번만 계산해 전달)"""
+        self._weights = lecture_weights(course)
+        mine = [position for position in self._weights if self._in_shard(*position)]
+        self._completed = set()
+        self.progress.reset(len(mine), sum(self._weights[position] for position in mine))
+        self.progress.total_sections = len(course.sections)
+        get_metrics().reset(self.progress)
+        if course.total_seconds:
+            self.log_callback(f"⏳ 처리할 강의 {len(mine)}개, 재생 시간 {self.progress.total_seconds / 3600:.1f}시간")
+
+    def _lecture_done(self, section_idx: int, lecture_idx: int, cues: int = 0):
+        """강의 완료를 진행률/처리량 지표에 반영하고 남은 시간 알림"""
+        position = (section_idx, lecture_idx)
+        if position in self._completed:
+            return
+        self._completed.add(position)
+        get_metrics().record_lecture(cues)
+        self.progress.current_section = section_idx + 1
+        self.progress.complete_lecture(self._weights.get(position, 0.0))
+        if self.progress_callback:
+            self.progress_callback(self.progress.completed_lectures, self.progress.total_lectures)
+        if self.status_callback:
+            self.status_callback(f"강의 {self.progress.completed_lectures}/{self.progress.total_lectures} 완료 - "
+                                 f"남은 시간 {self.progress.estimated_time_remaining}")
+
+    def _plan_update(self, course: Course) -> Optional[Tuple[set, set]]:
+        """매니페스트와 비교해 파일 이동/삭제 후 (다시 추출할 위치, 통합 파일을 다시 만들 섹션) 반환 (전체 추출이면 None)"""
+        if self.shard or self.only_sections is not None:
+            self.log_callback("⚠️ 분할 실행/섹션 작업에서는 업데이트 모드를 지원하지 않음 - 맡은 강의 전체 추출")
+            return None
+
+        manifest = CourseManifest(self._course_output_dir(), self.log_callback)
+        if not manifest.load():
+            self.log_callback("📋 이전 실행의 매니페스트 없음 - 전체 추출")
+            return None
+
+        diff = manifest.diff(course)
+        if manifest.last_update_date != course.last_update_date:
+            self.log_callback(f"🔄 강의 업데이트: {manifest.last_update_date or '알 수 없음'} → {course.last_update_date or '알 수 없음'}")
+        self.log_callback(f"📋 커리큘럼 비교: {diff.summary()}")
+        affected_sections = manifest.apply(diff, course) if not diff.is_empty else set()
+        self._superseded = diff.superseded
+        return diff.to_scrape, affected_sections
+
+    def _save_manifest(self, course: Course):
+        """디스크에 있는 강의 파일 기준으로 매니페스트 갱신 (다음 업데이트 모드 비교 기준)"""
+        course_dir = self._course_output_dir()
+        if course_dir.exists():
+            manifest = CourseManifest(course_dir, self.log_callback)
+            # 다시 추출하지 못한 변경 강의는 이전 항목을 유지해 다음 실행에서 다시 시도
+            manifest.rebuild(course, pending=self._superseded)
+            manifest.save(course)
+
+    def _failures_file_name(self) -> Optional[str]:
+        """분할 실행/섹션 작업이면 작업별 실패 기록 파일"""
+        if self.shard:
+            return f"failed_lectures.shard{self.shard[0] + 1}.json"
+        if self.only_sections is not None:
+            sections = "-".join(f"{idx + 1:02d}" for idx in sorted(self.only_sections))
+            return f"failed_lectures.section{sections}.json"
+        return None
+
+    def _record_lecture_id(self, section_idx: int, lecture_idx: int):
+        """현재 URL의 /lecture/<id>를 커리큘럼 모델에 기록 (세션 복구 지점도 갱신)"""
+        try:
+            current_url = self.driver.current_url
+            self._resume_url = current_url
+            if not self.current_course or section_idx >= len(self.current_course.sections):
+                return
+            lectures = self.current_course.sections[section_idx].lectures
+            if lecture_idx >= len(lectures):
+                return
+            match = re.search(r"/lecture/(\d+)", current_url)
+            if match:
+                lectures[lecture_idx].lecture_id = int(match.group(1))
+        except Exception:
+            pass
 
     def _find_section_content_area(self, section_idx: int):
         """섹션 콘텐츠 영역 찾기"""
@@ -292,11 +832,11 @@ class TranscriptScraper(BrowserBase):
                             valid_elements.append(elem)
 
                     if valid_elements:
-                        self.log_callback(f"      '{selector}': {len(valid_elements)}개 유효한 강의 발견 (전체 {len(elements)}개 중)")
+                        self.log_callback.debug("      '%s': %d개 유효한 강의 발견 (전체 %d개 중)", selector, len(valid_elements), len(elements))
                         return valid_elements
 
             except Exception as e:
-                self.log_callback(f"      '{selector}' 검색 오류: {str(e)}")
+                self.log_callback.debug("      '%s' 검색 오류: %s", selector, e)
                 continue
 
         return []
@@ -375,8 +915,9 @@ class TranscriptScraper(BrowserBase):
         except:
             return f"비디오_{int(time.time())}"
 
-    def _save_transcript(self, content: str, video_title: str, section_idx: int, video_idx: int):
-        """트랜스크립트 파일 저장"""
+    def _save_transcript(self, content: str, video_title: str, section_idx: int, video_idx: int,
+                         language: Optional[str] = None):
+        """트랜스크립트 파일 저장 (language면 강의 폴더의 languages/<언어>/ 아래 같은 구조로)"""
         try:
             if not self.current_course:
                 self.log_callback("    ⚠️ 강의 정보가 없어 파일 저장 실패")
@@ -391,6 +932,8 @@ class TranscriptScraper(BrowserBase):
             # 강의명 폴더 생성
             safe_course_name = sanitize_filename(self.current_course.title)
             course_dir = output_dir / safe_course_name
+            if language:
+                course_dir = course_dir / "languages" / sanitize_filename(language)
             ensure_directory(course_dir)
 
             # 섹션 디렉토리 생성 (섹션 제목 포함)
@@ -413,11 +956,20 @@ class TranscriptScraper(BrowserBase):
                 f.write("=" * 50 + "\\n\\n")
                 f.write(content)
 
-            self.log_callback(f"    💾 저장완료: {filename}")
+            self.log_callback(f"    💾 저장완료: {filename}" + (f" ({language})" if language else ""))
+            if not language:
+                self._discard_superseded(section_idx, video_idx, file_path.relative_to(course_dir))
+                self._lecture_done(section_idx, video_idx, content.count("\\n") + 1)
 
         except Exception as e:
             self.log_callback(f"    ❌ 파일 저장 실패: {str(e)}")
 
+    def _discard_superseded(self, section_idx: int, lecture_idx: int, saved_path: Path):
+        """업데이트 모드에서 새 자막이 저장된 변경 강의의 이전 파일(언어별 사본 포함) 삭제"""
+        previous = self._superseded.pop((section_idx, lecture_idx), None)
+        if previous and Path(previous.path) != saved_path:
+            CourseManifest(self._course_output_dir(), self.log_callback).remove_copies(previous.path)
+
     def _return_to_section_list(self):
         """섹션 목록으로 돌아가기 (기존 방식)"""
         try:
@@ -457,30 +1009,30 @@ class TranscriptScraper(BrowserBase):
 
                     if href:
                         if "#icon-video" in href:
-                            self.log_callback(f"      🎬 비디오 아이콘 발견: {href}")
+                            self.log_callback.debug("      🎬 비디오 아이콘 발견: %s", href)
                             return "video"
                         elif "#icon-article" in href:
-                            self.log_callback(f"      📄 문서 아이콘 발견: {href}")
+                            self.log_callback.debug("      📄 문서 아이콘 발견: %s", href)
                             return "document"
                         elif "#icon-quiz" in href or "#icon-assignment" in href:
-                            self.log_callback(f"      📝 퀴즈 아이콘 발견: {href}")
+                            self.log_callback.debug("      📝 퀴즈 아이콘 발견: %s", href)
                             return "quiz"
                         elif "#icon-file" in href or "#icon-download" in href:
-                            self.log_callback(f"      📁 리소스 아이콘 발견: {href}")
+                            self.log_callback.debug("      📁 리소스 아이콘 발견: %s", href)
                             return "resource"
                 except Exception:
                     continue
 
             # 디버깅: 발견된 아이콘들 로그
             try:
-                if all_use_elements:
+                if all_use_elements and self.log_callback.debug_enabled:
                     icon_hrefs = []
                     for use_elem in all_use_elements[:3]:  # 처음 3개만
                         href = use_elem.get_attribute("xlink:href") or use_elem.get_attribute("href")
                         if href:
                             icon_hrefs.append(href)
                     if icon_hrefs:
-                        self.log_callback(f"      ❓ 알 수 없는 아이콘: {icon_hrefs}")
+                        self.log_callback.debug("      ❓ 알 수 없는 아이콘: %s", icon_hrefs)
             except Exception:
                 pass
 
@@ -502,14 +1054,14 @@ class TranscriptScraper(BrowserBase):
     def _debug_section_structure(self, section_content, section_idx: int):
         """섹션 구조 디버깅"""
         try:
-            self.log_callback(f"🔍 섹션 {section_idx + 1} 구조 디버깅:")
-            self.log_callback(f"      섹션 태그: {section_content.tag_name}")
-            self.log_callback(f"      섹션 클래스: {section_content.get_attribute('class')}")
-            self.log_callback(f"      섹션 data-purpose: {section_content.get_attribute('data-purpose')}")
+            self.log_callback.debug(f"🔍 섹션 {section_idx + 1} 구조 디버깅:")
+            self.log_callback.debug(f"      섹션 태그: {section_content.tag_name}")
+            self.log_callback.debug(f"      섹션 클래스: {section_content.get_attribute('class')}")
+            self.log_callback.debug(f"      섹션 data-purpose: {section_content.get_attribute('data-purpose')}")
 
             # 모든 하위 요소들 확인
             all_children = section_content.find_elements(By.CSS_SELECTOR, "*")
-            self.log_callback(f"      전체 하위 요소 수: {len(all_children)}")
+            self.log_callback.debug(f"      전체 하위 요소 수: {len(all_children)}")
 
             # 강의 관련 가능성이 있는 요소들 찾기
             potential_lecture_selectors = [
@@ -527,53 +1079,53 @@ class TranscriptScraper(BrowserBase):
                 try:
                     elements = section_content.find_elements(By.CSS_SELECTOR, selector)
                     if elements:
-                        self.log_callback(f"      '{selector}': {len(elements)}개 발견")
+                        self.log_callback.debug(f"      '{selector}': {len(elements)}개 발견")
                         for i, elem in enumerate(elements[:3]):  # 처음 3개만
                             try:
                                 text_preview = elem.text[:50] if elem.text else "텍스트 없음"
                                 classes = elem.get_attribute('class') or "클래스 없음"
                                 data_purpose = elem.get_attribute('data-purpose') or "data-purpose 없음"
-                                self.log_callback(f"        {i+1}. [{elem.tag_name}] {text_preview} (class: {classes[:30]}, data: {data_purpose})")
+                                self.log_callback.debug(f"        {i+1}. [{elem.tag_name}] {text_preview} (class: {classes[:30]}, data: {data_purpose})")
                             except:
-                                self.log_callback(f"        {i+1}. [정보 추출 실패]")
+                                self.log_callback.debug(f"        {i+1}. [정보 추출 실패]")
                     else:
-                        self.log_callback(f"      '{selector}': 0개 발견")
+                        self.log_callback.debug(f"      '{selector}': 0개 발견")
                 except Exception as e:
-                    self.log_callback(f"      '{selector}': 오류 - {str(e)}")
+                    self.log_callback.debug(f"      '{selector}': 오류 - {str(e)}")
 
             # 텍스트 내용에서 강의 단서 찾기
             section_text = section_content.text
             if section_text:
                 if "분" in section_text or "강의" in section_text or "재생" in section_text:
                     lines = section_text.split('\n')[:10]  # 처음 10줄만
-                    self.log_callback("      섹션 텍스트 미리보기:")
+                    self.log_callback.debug("      섹션 텍스트 미리보기:")
                     for i, line in enumerate(lines):
                         if line.strip():
-                            self.log_callback(f"        {i+1}. {line.strip()[:50]}")
+                            self.log_callback.debug(f"        {i+1}. {line.strip()[:50]}")
 
         except Exception as e:
-            self.log_callback(f"      ❌ 구조 디버깅 실패: {str(e)}")
+            self.log_callback.debug(f"      ❌ 구조 디버깅 실패: {str(e)}")
 
     def _debug_click_failure(self, lecture_element, lecture_idx: int):
         """강의 클릭 실패 원인 디버깅"""
         try:
-            self.log_callback(f"    🔍 강의 {lecture_idx + 1} 클릭 실패 원인 분석:")
-            self.log_callback(f"      태그: {lecture_element.tag_name}")
-            self.log_callback(f"      표시됨: {lecture_element.is_displayed()}")
-            self.log_callback(f"      활성화됨: {lecture_element.is_enabled()}")
+            self.log_callback.debug(f"    🔍 강의 {lecture_idx + 1} 클릭 실패 원인 분석:")
+            self.log_callback.debug(f"      태그: {lecture_element.tag_name}")
+            self.log_callback.debug(f"      표시됨: {lecture_element.is_displayed()}")
+            self.log_callback.debug(f"      활성화됨: {lecture_element.is_enabled()}")
 
             # 기본 속성
             classes = lecture_element.get_attribute('class') or 'None'
             href = lecture_element.get_attribute('href') or 'None'
             data_purpose = lecture_element.get_attribute('data-purpose') or 'None'
 
-            self.log_callback(f"      클래스: {classes[:50]}")
-            self.log_callback(f"      href: {href[:50]}")
-            self.log_callback(f"      data-purpose: {data_purpose}")
+            self.log_callback.debug(f"      클래스: {classes[:50]}")
+            self.log_callback.debug(f"      href: {href[:50]}")
+            self.log_callback.debug(f"      data-purpose: {data_purpose}")
 
             # 텍스트 확인
             text = lecture_element.text[:100] if lecture_element.text else 'None'
-            self.log_callback(f"      텍스트: {text}")
+            self.log_callback.debug(f"      텍스트: {text}")
 
             # 클릭 가능한 하위 요소들 확인
             from .selectors import UdemySelectors
@@ -582,24 +1134,25 @@ class TranscriptScraper(BrowserBase):
                     elements = lecture_element.find_elements(By.CSS_SELECTOR, selector)
                     visible_elements = [e for e in elements if e.is_displayed() and e.is_enabled()]
                     if visible_elements:
-                        self.log_callback(f"      '{selector}': {len(visible_elements)}개 클릭 가능 요소 발견")
+                        self.log_callback.debug(f"      '{selector}': {len(visible_elements)}개 클릭 가능 요소 발견")
                         break
                 except:
                     continue
             else:
-                self.log_callback(f"      ❌ 클릭 가능한 하위 요소를 찾을 수 없음")
+                self.log_callback.debug(f"      ❌ 클릭 가능한 하위 요소를 찾을 수 없음")
 
             # 현재 활성 강의 확인
             is_current = lecture_element.get_attribute("aria-current") == "true"
-            self.log_callback(f"      현재 활성 강의: {is_current}")
+            self.log_callback.debug(f"      현재 활성 강의: {is_current}")
 
         except Exception as e:
-            self.log_callback(f"      ❌ 클릭 실패 디버깅 오류: {str(e)}")
+            self.log_callback.debug(f"      ❌ 클릭 실패 디버깅 오류: {str(e)}")
 
     def _create_section_merged_file(self, section_idx: int):
         """섹션별 통합 파일 생성"""
         try:
-            if not self.current_course:
+            # 분할 실행에서는 섹션 일부만 있으므로 모든 프로세스가 끝난 뒤 한 번에 병합
+            if not self.current_course or self.shard:
                 return
 
             from pathlib import Path
@@ -630,10 +1183,18 @@ class TranscriptScraper(BrowserBase):
 
             # SectionMerger를 사용하여 섹션별 통합 파일 생성
             merger = SectionMerger(str(course_dir))
+            self._merged_sections.add(section_idx)
             if merger._merge_section(section_dir):
                 self.log_callback(f"    ✅ 섹션 {section_idx + 1} 통합 파일 생성 완료")
             else:
                 self.log_callback(f"    ⚠️ 섹션 {section_idx + 1} 통합 파일 생성 실패")
 
+            # 다른 자막 언어도 언어 폴더 안에 같은 형식으로 통합
+            languages_dir = course_dir / "languages"
+            if languages_dir.exists():
+                for language_dir in sorted(languages_dir.iterdir()):
+                    if (language_dir / section_dir.name).is_dir():
+                        SectionMerger(str(language_dir))._merge_section(language_dir / section_dir.name)
+
         except Exception as e:
             self.log_callback(f"    ❌ 섹션 {section_idx + 1} 통합 파일 생성 중 오류: {str(e)}")
\ No newline at end of file
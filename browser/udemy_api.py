@@ -0,0 +1,107 @@
+"""
+Udemy 내부 API 호출 모듈 (로그인된 페이지 컨텍스트에서 fetch)
+"""
+
+import json
+from typing import Optional, Dict, Any, Iterator, List
+from urllib.parse import urlencode
+from config import Config
+from utils.rate_limiter import get_scheduler, API
+from .base import BrowserBase
+
+
+class UdemyApiClient(BrowserBase):
+    """브라우저 세션 쿠키를 그대로 쓰는 api-2.0 클라이언트"""
+
+    API_PREFIX = "/api-2.0"
+
+    FETCH_SCRIPT = """
+        var url = arguments[0];
+        var done = arguments[arguments.length - 1];
+        fetch(url, {credentials: 'include', headers: {'Accept': 'application/json'}})
+            .then(function (response) {
+                return response.text().then(function (body) {
+                    done({status: response.status, body: body, retryAfter: response.headers.get('Retry-After')});
+                });
+            })
+            .catch(function (error) { done({status: 0, body: String(error)}); });
+    """
+
+    def __init__(self, driver, wait, log_callback=None):
+        super().__init__(driver, wait, log_callback)
+
+    def get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """GET 요청 후 JSON 반환 (실패 시 None)"""
+        url = path if path.startswith("/api-2.0") else f"{self.API_PREFIX}{path}"
+        if params:
+            url = f"{url}?{urlencode(params)}"
+
+        scheduler = get_scheduler()
+        for attempt in range(Config.MAX_RETRIES):
+            scheduler.acquire(API)
+            try:
+                result = self.driver.execute_async_script(self.FETCH_SCRIPT, url)
+            except Exception as e:
+                self.log_callback(f"⚠️ API 호출 실패: {url} ({str(e)})")
+                return None
+
+            if not result or result.get('status') != 429:
+                break
+
+            # 속도 제한 → 속도를 낮추고 Retry-After(없으면 기본 쿨다운)만큼 쉰 뒤 재시도
+            rate = scheduler.report_throttled(API, self._retry_after(result))
+            self.log_callback.warning(f"🐢 API 속도 제한(429) - 호출 속도 분당 {rate:.1f}회로 감소 ({attempt + 1}/{Config.MAX_RETRIES})")
+
+        if not result or result.get('status') != 200:
+            status = result.get('status') if result else 'no response'
+            self.log_callback(f"⚠️ API 응답 오류: {url} (status={status})")
+            return None
+
+        scheduler.report_success(API)
+        try:
+            return json.loads(result['body'])
+        except ValueError:
+            self.log_callback(f"⚠️ API 응답 파싱 실패: {url}")
+            return None
+
+    def _retry_after(self, result: Dict[str, Any]) -> Optional[float]:
+        """Retry-After 헤더(초) 해석 (날짜 형식이거나 없으면 None)"""
+        try:
+            return float(result.get('retryAfter'))
+        except (TypeError, ValueError):
+            return None
+
+    def iter_pages(self, path: str, params: Optional[Dict[str, Any]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """페이지네이션된 결과를 페이지 단위로 순회"""
+        page_params = dict(params or {})
+        page_params.setdefault('page_size', 100)
+        page = 1
+
+        while True:
+            page_params['page'] = page
+            data = self.get_json(path, page_params)
+            if not data:
+                return
+
+            yield data.get('results', [])
+
+            if not data.get('next'):
+                return
+            page += 1
+
+    def iter_subscribed_courses(self, ordering: str = "-enroll_time") -> Iterator[List[Dict[str, Any]]]:
+        """수강 중인 강의 목록 (페이지 단위)"""
+        return self.iter_pages("/users/me/subscribed-courses/", {
+            'ordering': ordering,
+            'fields[course]': 'id,title,url,last_update_date'
+        })
+
+    def iter_curriculum_items(self, course_id: int) -> Iterator[List[Dict[str, Any]]]:
+        """강의 커리큘럼 항목 (챕터/강의/퀴즈, 순서대로, 페이지 단위)"""
+        return self.iter_pages(f"/courses/{course_id}/subscriber-curriculum-items/", {
+            'fields[chapter]': 'title,object_index',
+            'fields[lecture]': 'title,object_index,asset',
+            'fields[quiz]': 'title,object_index,type',
+            'fields[practice]': 'title,object_index',
+            'fields[asset]': 'asset_type,time_estimation'
+        })
@@ -16,6 +16,8 @@ class Config:
     BASE_DIR = Path(__file__).parent.parent
     OUTPUT_DIR = BASE_DIR / (os.getenv('OUTPUT_DIR', 'output_udemy_scripts'))
     SESSION_DIR = BASE_DIR / 'sessions'
+    CACHE_DIR = BASE_DIR / 'cache'
+    LOG_DIR = BASE_DIR / 'logs'
 
     # Udemy 관련 설정
     UDEMY_BASE_URL = "https://www.udemy.com"
@@ -25,24 +27,75 @@ class Config:
     # 브라우저 설정
     HEADLESS_MODE = False  # 항상 False로 고정 (2FA 수동 입력 필요)
     DEBUG_MODE = os.getenv('DEBUG_MODE', 'true').lower() == 'true'
+    CHROME_DEBUG_PORT = int(os.getenv('CHROME_DEBUG_PORT', '9222'))  # 디버그 브라우저 원격 디버깅 포트
+    SESSION_WATCHDOG_ENABLED = os.getenv('SESSION_WATCHDOG_ENABLED', 'true').lower() == 'true'  # 세션 끊김 시 자동 재연결
+    SESSION_RECONNECT_ATTEMPTS = int(os.getenv('SESSION_RECONNECT_ATTEMPTS', '3'))
+    BROWSER_BACKEND = os.getenv('BROWSER_BACKEND', 'selenium').lower()  # selenium / cdp (자막 추출을 CDP 웹소켓으로)
+    CDP_CONCURRENCY = int(os.getenv('CDP_CONCURRENCY', '3'))  # CDP 백엔드가 동시에 여는 탭 수
+    SHARD_COUNT = int(os.getenv('SHARD_COUNT', '2'))  # shard_runner.py가 띄우는 Chrome/워커 프로세스 수
+    SHARD_PORT_START = int(os.getenv('SHARD_PORT_START', '9223'))  # 분할용 Chrome 디버그 포트 시작 번호
 
     # 타이밍 설정
     WAIT_TIMEOUT = 10  # 요소 대기 시간 (초)
     BETWEEN_LECTURES_DELAY = (1, 3)  # 강의 간 대기시간 (초) - 랜덤
     PAGE_LOAD_DELAY = 2  # 페이지 로드 대기시간 (초)
 
+    # 트랜스크립트 설정
+    KEEP_TRANSCRIPT_PANEL_OPEN = os.getenv('KEEP_TRANSCRIPT_PANEL_OPEN', 'false').lower() == 'true'  # 강의 간 패널 유지
+    CUE_SWITCH_TIMEOUT = int(os.getenv('CUE_SWITCH_TIMEOUT', '10'))  # 패널 유지 모드에서 cue 목록 전환 대기 (초)
+    CAPTION_LANGUAGES = os.getenv('CAPTION_LANGUAGES', '')  # all 또는 쉼표 구분 언어 (비우면 현재 언어만, 예: 한국어,영어)
+    PREFETCH_NEXT_LECTURE = os.getenv('PREFETCH_NEXT_LECTURE', 'false').lower() == 'true'  # 두 번째 탭에서 다음 강의 미리 로딩
+
+    # 요청 속도 설정 (토큰 버킷, 0이면 제한 없음)
+    NAVIGATIONS_PER_MINUTE = float(os.getenv('NAVIGATIONS_PER_MINUTE', '30'))  # 페이지 이동/강의 전환
+    NAVIGATION_BURST = int(os.getenv('NAVIGATION_BURST', '3'))
+    API_FETCHES_PER_MINUTE = float(os.getenv('API_FETCHES_PER_MINUTE', '60'))  # api-2.0 호출
+    API_FETCH_BURST = int(os.getenv('API_FETCH_BURST', '5'))
+    RATE_BACKOFF_FACTOR = 0.5  # 429/차단 페이지 시 속도 배율
+    RATE_BACKOFF_COOLDOWN = 30  # 429/차단 페이지 후 일시 정지 (초, Retry-After가 있으면 그 값)
+
+    # 작업 큐 설정 (worker.py)
+    JOB_QUEUE_PATH = os.getenv('JOB_QUEUE_PATH', '')  # SQLite 큐 파일 (비우면 cache/jobs.sqlite3, 여러 머신이면 공유 볼륨 경로)
+    JOB_LEASE_SECONDS = int(os.getenv('JOB_LEASE_SECONDS', '600'))  # heartbeat 없이 이 시간이 지나면 다른 워커가 가져감
+    JOB_MAX_ATTEMPTS = int(os.getenv('JOB_MAX_ATTEMPTS', '3'))
+    JOB_POLL_INTERVAL = int(os.getenv('JOB_POLL_INTERVAL', '30'))  # 대기 모드에서 빈 큐 확인 간격 (초)
+
     # 재시도 설정
     MAX_RETRIES = 3
     RETRY_DELAY = 2  # 재시도 간격 (초)
 
     # 로그 설정
-    LOG_LEVEL = "INFO" if not DEBUG_MODE else "DEBUG"
+    LOG_LEVEL = os.getenv('LOG_LEVEL', "INFO" if not DEBUG_MODE else "DEBUG").upper()  # DEBUG/INFO/WARNING/ERROR
+    LOG_FILE_ENABLED = os.getenv('LOG_FILE_ENABLED', 'true').lower() == 'true'  # logs/scraper.jsonl 기록
+    LOG_FILE_MAX_BYTES = int(os.getenv('LOG_FILE_MAX_BYTES', str(5 * 1024 * 1024)))
+    LOG_FILE_BACKUP_COUNT = int(os.getenv('LOG_FILE_BACKUP_COUNT', '3'))
+
+    # 프로파일링 설정 (logs/profiles/에 flamegraph용 .folded와 요약 저장)
+    PROFILE_ENABLED = os.getenv('PROFILE_ENABLED', 'false').lower() == 'true'  # 실행 전체 샘플링 프로파일링
+    PROFILE_INTERVAL_MS = float(os.getenv('PROFILE_INTERVAL_MS', '10'))  # 샘플링 간격
+    PROFILE_TOP_N = int(os.getenv('PROFILE_TOP_N', '15'))  # 요약에 보여줄 상위 함수/sleep 위치 수
+
+    # GUI 로그 설정
+    GUI_LOG_FLUSH_INTERVAL_MS = int(os.getenv('GUI_LOG_FLUSH_INTERVAL_MS', '100'))  # 로그 일괄 반영 주기
+    GUI_LOG_MAX_LINES = int(os.getenv('GUI_LOG_MAX_LINES', '5000'))  # 로그 창에 남길 최대 줄 수
+    GUI_LOG_SPILL_FILE = os.getenv('GUI_LOG_SPILL_FILE', '')  # 전체 로그 보관 파일 (비우면 사용 안 함)
+    GUI_METRICS_INTERVAL_MS = int(os.getenv('GUI_METRICS_INTERVAL_MS', '1000'))  # 처리량 대시보드 갱신 주기
+    METRICS_WINDOW_SECONDS = float(os.getenv('METRICS_WINDOW_SECONDS', '300'))  # 처리 속도 계산 구간 (최근 N초)
+
+    # 캐시 설정
+    CURRICULUM_CACHE_ENABLED = os.getenv('CURRICULUM_CACHE_ENABLED', 'true').lower() == 'true'
+    COURSE_CATALOG_ENABLED = os.getenv('COURSE_CATALOG_ENABLED', 'true').lower() == 'true'  # 수강 강의 카탈로그로 검색 생략
+    UPDATE_ONLY = os.getenv('UPDATE_ONLY', 'false').lower() == 'true'  # 이전 실행의 manifest.json과 비교해 바뀐 강의만 추출
+
+    # 학습자료 설정
+    STUDY_SUMMARY_ENABLED = os.getenv('STUDY_SUMMARY_ENABLED', 'false').lower() == 'true'  # 병합 후 핵심 요약 생성
 
     @classmethod
     def ensure_directories(cls):
         """필요한 디렉토리 생성"""
         cls.OUTPUT_DIR.mkdir(exist_ok=True)
         cls.SESSION_DIR.mkdir(exist_ok=True)
+        cls.CACHE_DIR.mkdir(exist_ok=True)
 
     @classmethod
     def get_output_directory(cls) -> Path:
@@ -57,6 +110,21 @@ class Config:
         safe_name = "".join(c for c in course_name if c.isalnum() or c in (' ', '-', '_')).strip()
         return cls.OUTPUT_DIR / safe_name
 
+    @classmethod
+    def get_curriculum_cache_dir(cls) -> Path:
+        """커리큘럼 캐시 디렉토리 반환"""
+        return cls.CACHE_DIR / 'curriculum'
+
+    @classmethod
+    def get_job_queue_path(cls) -> Path:
+        """작업 큐 파일 경로 반환"""
+        return Path(cls.JOB_QUEUE_PATH) if cls.JOB_QUEUE_PATH else cls.CACHE_DIR / 'jobs.sqlite3'
+
+    @classmethod
+    def get_course_catalog_path(cls) -> Path:
+        """수강 강의 카탈로그 파일 경로 반환"""
+        return cls.CACHE_DIR / 'course_catalog.json'
+
     @classmethod
     def get_session_file_path(cls) -> Path:
         """세션 쿠키 파일 경로 반환"""
@@ -2,11 +2,38 @@
 데이터 모델 클래스들
 """
 
+import re
+from array import array
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Iterable, Iterator
 from datetime import datetime
 
-@dataclass
+_DURATION_PART = re.compile(r"(\d+)\s*(시간|분|초|hours?|hrs?|h|minutes?|mins?|m|seconds?|secs?|s)(?![a-z])", re.IGNORECASE)
+_UNIT_SECONDS = {'시': 3600, 'h': 3600, '분': 60, 'm': 60}  # 단위 첫 글자 → 초 (나머지는 초 단위)
+
+
+def parse_duration(text: str) -> int:
+    """재생 시간 문자열 → 초 ("05:30", "1:02:03", "1시간 2분", "3min", 모르면 0)"""
+    if not text:
+        return 0
+    text = text.strip()
+    if re.fullmatch(r"\d+(:\d{1,2}){1,2}", text):
+        seconds = 0
+        for part in text.split(":"):
+            seconds = seconds * 60 + int(part)
+        return seconds
+    return sum(int(value) * _UNIT_SECONDS.get(unit[0].lower(), 1) for value, unit in _DURATION_PART.findall(text))
+
+
+def format_duration(seconds: int) -> str:
+    """초 → Udemy 표기 ("3분", "1시간 2분")"""
+    minutes = max(1, round(seconds / 60))
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}시간 {minutes}분" if minutes else f"{hours}시간"
+    return f"{minutes}분"
+
+@dataclass(slots=True)
 class Subtitle:
     """자막 데이터 모델"""
     timestamp: str  # "00:05:30" 형식
@@ -14,21 +41,149 @@ class Subtitle:
     start_seconds: float = 0.0
     end_seconds: float = 0.0
 
-@dataclass
+class SubtitleTrack:
+    """열 지향 자막 저장소
+
+    시작/종료 시간은 array('d')에, 타임스탬프와 텍스트는 하나의 문자열 버퍼에
+    오프셋으로 저장합니다. 순회 시에는 Subtitle 객체를 그때그때 만들어 반환하므로
+    List[Subtitle]을 받던 코드와 호환됩니다.
+    """
+
+    __slots__ = ('_starts', '_ends', '_offsets', '_buffer', '_pending')
+
+    def __init__(self, subtitles: Optional[Iterable[Subtitle]] = None):
+        self._starts = array('d')
+        self._ends = array('d')
+        self._offsets = array('q', [0])  # i번째 자막: [2i, 2i+1) 타임스탬프, [2i+1, 2i+2) 텍스트
+        self._buffer = ""
+        self._pending = []
+        if subtitles:
+            self.extend(subtitles)
+
+    def add(self, timestamp: str, text: str, start_seconds: float = 0.0, end_seconds: float = 0.0):
+        """자막 한 개 추가"""
+        self._starts.append(start_seconds)
+        self._ends.append(end_seconds)
+        end = self._offsets[-1]
+        self._offsets.append(end + len(timestamp))
+        self._offsets.append(end + len(timestamp) + len(text))
+        self._pending.append(timestamp)
+        self._pending.append(text)
+
+    def append(self, subtitle: Subtitle):
+        """Subtitle 객체 추가 (list 호환)"""
+        self.add(subtitle.timestamp, subtitle.text, subtitle.start_seconds, subtitle.end_seconds)
+
+    def extend(self, subtitles: Iterable[Subtitle]):
+        """여러 Subtitle 객체 추가 (list 호환)"""
+        for subtitle in subtitles:
+            self.append(subtitle)
+
+    def text_at(self, index: int) -> str:
+        """index번째 자막 텍스트"""
+        self._flush()
+        return self._buffer[self._offsets[2 * index + 1]:self._offsets[2 * index + 2]]
+
+    def iter_sorted(self) -> Iterator[Subtitle]:
+        """시작 시간순으로 순회"""
+        for index in sorted(range(len(self)), key=self._starts.__getitem__):
+            yield self[index]
+
+    def texts(self) -> Iterator[str]:
+        """텍스트만 순서대로 순회"""
+        for index in range(len(self)):
+            yield self.text_at(index)
+
+    @property
+    def nbytes(self) -> int:
+        """저장된 데이터의 대략적인 메모리 사용량 (바이트)"""
+        self._flush()
+        return (self._starts.itemsize * len(self._starts) * 2 +
+                self._offsets.itemsize * len(self._offsets) +
+                len(self._buffer.encode('utf-8')))
+
+    def _flush(self):
+        """추가 대기 중인 문자열을 버퍼에 합치기"""
+        if self._pending:
+            self._buffer += "".join(self._pending)
+            self._pending = []
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, index: int) -> Subtitle:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("subtitle index out of range")
+        self._flush()
+        offsets = self._offsets
+        return Subtitle(
+            timestamp=self._buffer[offsets[2 * index]:offsets[2 * index + 1]],
+            text=self._buffer[offsets[2 * index + 1]:offsets[2 * index + 2]],
+            start_seconds=self._starts[index],
+            end_seconds=self._ends[index]
+        )
+
+    def __iter__(self) -> Iterator[Subtitle]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"SubtitleTrack({len(self)} cues)"
+
+@dataclass(slots=True)
 class Lecture:
     """강의 데이터 모델"""
     title: str
     duration: str
     video_url: Optional[str] = None
     has_subtitles: bool = False
-    subtitles: List[Subtitle] = None
+    subtitles: SubtitleTrack = None
     lecture_index: int = 0
+    lecture_id: Optional[int] = None  # Udemy 강의 ID (URL의 /lecture/<id>)
+    lecture_type: str = "unknown"  # video/document/quiz/resource/unknown
+    duration_seconds: int = 0  # duration을 초로 변환한 값 (모르면 0)
     
     def __post_init__(self):
         if self.subtitles is None:
-            self.subtitles = []
+            self.subtitles = SubtitleTrack()
+        elif not isinstance(self.subtitles, SubtitleTrack):
+            self.subtitles = SubtitleTrack(self.subtitles)
+        if not self.duration_seconds:
+            self.duration_seconds = parse_duration(self.duration)
+
+    def set_duration(self, duration: str, seconds: Optional[int] = None):
+        """재생 시간 문자열과 초 값을 함께 갱신"""
+        self.duration = duration
+        self.duration_seconds = parse_duration(duration) if seconds is None else seconds
 
-@dataclass
+    def to_dict(self) -> dict:
+        """커리큘럼 정보 직렬화 (자막 제외)"""
+        return {
+            'title': self.title,
+            'duration': self.duration,
+            'video_url': self.video_url,
+            'lecture_index': self.lecture_index,
+            'lecture_id': self.lecture_id,
+            'lecture_type': self.lecture_type,
+            'duration_seconds': self.duration_seconds
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Lecture':
+        """직렬화된 커리큘럼 정보에서 복원"""
+        return cls(
+            title=data['title'],
+            duration=data.get('duration', ""),
+            video_url=data.get('video_url'),
+            lecture_index=data.get('lecture_index', 0),
+            lecture_id=data.get('lecture_id'),
+            lecture_type=data.get('lecture_type', "unknown"),
+            duration_seconds=data.get('duration_seconds', 0)
+        )
+
+@dataclass(slots=True)
 class Section:
     """섹션 데이터 모델"""
     title: str
@@ -39,18 +194,40 @@ class Section:
         if self.lectures is None:
             self.lectures = []
     
+    @property
+    def total_seconds(self) -> int:
+        """섹션 총 재생 시간 (초, 재생 시간을 아는 강의만)"""
+        return sum(lecture.duration_seconds for lecture in self.lectures)
+
     @property
     def total_duration(self) -> str:
-        """섹션 총 재생시간 계산"""
-        # 추후 구현 (강의 duration 파싱 필요)
-        return "계산 중..."
+        """섹션 총 재생시간 ("1시간 2분")"""
+        total = self.total_seconds
+        return format_duration(total) if total else "시간 정보 없음"
     
     @property
     def lecture_count(self) -> int:
         """섹션 내 강의 수"""
         return len(self.lectures)
 
-@dataclass
+    def to_dict(self) -> dict:
+        """커리큘럼 정보 직렬화"""
+        return {
+            'title': self.title,
+            'section_index': self.section_index,
+            'lectures': [lecture.to_dict() for lecture in self.lectures]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Section':
+        """직렬화된 커리큘럼 정보에서 복원"""
+        return cls(
+            title=data['title'],
+            section_index=data.get('section_index', 0),
+            lectures=[Lecture.from_dict(item) for item in data.get('lectures', [])]
+        )
+
+@dataclass(slots=True)
 class Course:
     """강의 데이터 모델"""
     title: str
@@ -59,6 +236,8 @@ class Course:
     sections: List[Section] = None
     total_duration: str = ""
     created_at: datetime = None
+    course_id: Optional[int] = None  # data-module-args의 courseId
+    last_update_date: str = ""  # courseLeadData.last_update_date (예: "2025-02-24")
     
     def __post_init__(self):
         if self.sections is None:
@@ -76,7 +255,75 @@ class Course:
         """전체 섹션 수"""
         return len(self.sections)
 
-@dataclass
+    @property
+    def total_seconds(self) -> int:
+        """전체 재생 시간 (초, 재생 시간을 아는 강의만)"""
+        return sum(section.total_seconds for section in self.sections)
+
+    def to_dict(self) -> dict:
+        """커리큘럼 트리 직렬화"""
+        return {
+            'title': self.title,
+            'course_id': self.course_id,
+            'last_update_date': self.last_update_date,
+            'instructor': self.instructor,
+            'description': self.description,
+            'total_duration': self.total_duration,
+            'sections': [section.to_dict() for section in self.sections]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Course':
+        """직렬화된 커리큘럼 트리에서 복원"""
+        return cls(
+            title=data['title'],
+            instructor=data.get('instructor', ""),
+            description=data.get('description', ""),
+            total_duration=data.get('total_duration', ""),
+            course_id=data.get('course_id'),
+            last_update_date=data.get('last_update_date', ""),
+            sections=[Section.from_dict(item) for item in data.get('sections', [])]
+        )
+
+@dataclass(slots=True)
+class EnrolledCourse:
+    """수강 중인 강의 카탈로그 항목"""
+    course_id: int
+    title: str
+    url: str  # "/course/<slug>/" 형식
+    last_update_date: str = ""
+
+    @property
+    def slug(self) -> str:
+        """URL의 강의 slug"""
+        parts = [part for part in self.url.split('/') if part]
+        return parts[1] if len(parts) > 1 and parts[0] == 'course' else ""
+
+    @property
+    def learn_url(self) -> str:
+        """강의 수강 페이지 경로"""
+        return f"/course/{self.slug}/learn/" if self.slug else self.url
+
+    def to_dict(self) -> dict:
+        """카탈로그 항목 직렬화"""
+        return {
+            'course_id': self.course_id,
+            'title': self.title,
+            'url': self.url,
+            'last_update_date': self.last_update_date
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'EnrolledCourse':
+        """직렬화된 카탈로그 항목에서 복원"""
+        return cls(
+            course_id=int(data['course_id']),
+            title=data.get('title', ""),
+            url=data.get('url', ""),
+            last_update_date=data.get('last_update_date') or ""
+        )
+
+@dataclass(slots=True)
 class ScrapingProgress:
     """스크래핑 진행 상황 모델"""
     current_section: int = 0
@@ -86,6 +333,8 @@ class ScrapingProgress:
     completed_lectures: int = 0
     errors: List[str] = None
     start_time: datetime = None
+    total_seconds: float = 0.0  # 처리할 강의 재생 시간 합 (남은 시간 가중치)
+    completed_seconds: float = 0.0
     
     def __post_init__(self):
         if self.errors is None:
@@ -100,10 +349,40 @@ class ScrapingProgress:
             return 0.0
         return (self.completed_lectures / self.total_lectures) * 100
     
+    def reset(self, total_lectures: int, total_seconds: float):
+        """처리할 작업량으로 초기화하고 시간 측정 다시 시작"""
+        self.total_lectures = total_lectures
+        self.total_seconds = total_seconds
+        self.completed_lectures = 0
+        self.completed_seconds = 0.0
+        self.start_time = datetime.now()
+
+    def complete_lecture(self, seconds: float = 0.0):
+        """강의 하나 완료 (재생 시간만큼 진행한 것으로 계산)"""
+        self.completed_lectures += 1
+        self.completed_seconds += seconds
+
+    @property
+    def remaining_seconds(self) -> Optional[float]:
+        """예상 남은 시간 (초) - 재생 시간 가중, 재생 시간을 모르면 강의 수 기준"""
+        elapsed = (datetime.now() - self.start_time).total_seconds()
+        if self.total_seconds and self.completed_seconds:
+            return elapsed * max(0.0, self.total_seconds - self.completed_seconds) / self.completed_seconds
+        if self.total_lectures and self.completed_lectures:
+            return elapsed * max(0, self.total_lectures - self.completed_lectures) / self.completed_lectures
+        return None
+
     @property
     def estimated_time_remaining(self) -> str:
-        """예상 남은 시간 (추후 구현)"""
-        return "계산 중..."
+        """예상 남은 시간 ("약 12분 30초")"""
+        remaining = self.remaining_seconds
+        if remaining is None:
+            return "계산 중..."
+        minutes, seconds = divmod(int(remaining), 60)
+        hours, minutes = divmod(minutes, 60)
+        if hours:
+            return f"약 {hours}시간 {minutes}분"
+        return f"약 {minutes}분 {seconds}초" if minutes else f"약 {seconds}초"
     
     def add_error(self, error_message: str):
         """에러 추가"""
@@ -0,0 +1,74 @@
+"""
+GUI 로그/진행률 버퍼 (워커 스레드 → 타이머 일괄 반영)
+"""
+
+import threading
+from collections import deque
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+class LogBuffer:
+    """스레드 안전한 링 버퍼
+
+    워커 스레드는 push()로 쌓기만 하고, GUI 스레드가 타이머마다 drain()으로
+    한꺼번에 가져갑니다. 진행률/상태는 마지막 값만 남깁니다.
+    """
+
+    def __init__(self, capacity: int = 5000, spill_path: Optional[Path] = None):
+        self._lines = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._dropped = 0
+        self._progress: Optional[Tuple[int, int]] = None
+        self._status: Optional[str] = None
+        self._spill = None
+        if spill_path:
+            spill_path = Path(spill_path)
+            spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._spill = open(spill_path, 'a', encoding='utf-8')
+
+    def push(self, line: str):
+        """로그 한 줄 추가 (버퍼가 차면 가장 오래된 줄을 버림)"""
+        with self._lock:
+            if len(self._lines) == self._lines.maxlen:
+                self._dropped += 1
+            self._lines.append(line)
+            if self._spill:
+                self._spill.write(line + "\n")
+
+    def set_progress(self, current: int, total: int):
+        """진행률 (마지막 값만 유지)"""
+        with self._lock:
+            self._progress = (current, total)
+
+    def set_status(self, status: str):
+        """상태 메시지 (마지막 값만 유지)"""
+        with self._lock:
+            self._status = status
+
+    def drain(self) -> Tuple[List[str], int, Optional[Tuple[int, int]], Optional[str]]:
+        """쌓인 로그, 버려진 줄 수, 최신 진행률/상태를 꺼내고 비움"""
+        with self._lock:
+            lines = list(self._lines)
+            self._lines.clear()
+            dropped, self._dropped = self._dropped, 0
+            progress, self._progress = self._progress, None
+            status, self._status = self._status, None
+            if self._spill and lines:
+                self._spill.flush()
+        return lines, dropped, progress, status
+
+    def clear(self):
+        """대기 중인 항목 모두 비움"""
+        with self._lock:
+            self._lines.clear()
+            self._dropped = 0
+            self._progress = None
+            self._status = None
+
+    def close(self):
+        """스필 파일 닫기"""
+        with self._lock:
+            if self._spill:
+                self._spill.close()
+                self._spill = None
@@ -8,18 +8,15 @@ import threading
 import time
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget,
-    QPushButton, QLineEdit, QTextEdit, QLabel, QProgressBar
+    QPushButton, QLineEdit, QPlainTextEdit, QLabel, QProgressBar, QCheckBox, QGroupBox, QGridLayout
 )
-from PySide6.QtCore import Signal, QObject
+from PySide6.QtCore import QTimer
 
 from app import UdemyScraperApp
-
-
-class SimpleSignals(QObject):
-    """시그널 클래스"""
-    log_signal = Signal(str)
-    progress_signal = Signal(int, int)
-    status_signal = Signal(str)
+from config import Config
+from utils.profiler import profile_run
+from utils.run_metrics import get_metrics
+from .log_buffer import LogBuffer
 
 
 class SimpleUdemyGUI(QMainWindow):
@@ -27,14 +24,17 @@ class SimpleUdemyGUI(QMainWindow):
 
     def __init__(self):
         super().__init__()
-        self.signals = SimpleSignals()
+        self.log_buffer = LogBuffer(
+            capacity=Config.GUI_LOG_MAX_LINES,
+            spill_path=Config.GUI_LOG_SPILL_FILE or None
+        )
         self.setup_ui()
         self.connect_signals()
 
     def setup_ui(self):
         """UI 설정"""
         self.setWindowTitle("Udemy Scraper")
-        self.setFixedSize(600, 500)
+        self.setFixedSize(600, 680)
 
         # 메인 위젯
         main = QWidget()
@@ -70,9 +70,15 @@ class SimpleUdemyGUI(QMainWindow):
         input_layout = QHBoxLayout()
         input_layout.addWidget(QLabel("강의명:"))
         self.course_input = QLineEdit()
+        self.course_input.setPlaceholderText("강의명, 강의 URL, slug 또는 강의 ID")
         input_layout.addWidget(self.course_input)
         layout.addLayout(input_layout)
 
+        # 프로파일링 (logs/profiles/에 flamegraph용 파일 저장)
+        self.profile_check = QCheckBox("프로파일링")
+        self.profile_check.setChecked(Config.PROFILE_ENABLED)
+        layout.addWidget(self.profile_check)
+
         # 진행률
         self.progress = QProgressBar()
         layout.addWidget(self.progress)
@@ -81,16 +87,36 @@ class SimpleUdemyGUI(QMainWindow):
         self.status = QLabel("준비")
         layout.addWidget(self.status)
 
-        # 로그
-        self.log = QTextEdit()
+        # 처리량 대시보드 (강의별 이벤트를 GUI_METRICS_INTERVAL_MS마다 반영)
+        metrics_box = QGroupBox("처리량")
+        metrics_layout = QGridLayout(metrics_box)
+        self.metric_labels = {}
+        for idx, (key, name) in enumerate([("speed", "처리 속도"), ("workers", "활성 워커"),
+                                           ("eta", "남은 시간"), ("failures", "단계별 실패")]):
+            metrics_layout.addWidget(QLabel(f"{name}:"), idx // 2, (idx % 2) * 2)
+            self.metric_labels[key] = QLabel("-")
+            metrics_layout.addWidget(self.metric_labels[key], idx // 2, (idx % 2) * 2 + 1)
+        self.stage_table = QLabel("단계별 소요 시간: -")
+        self.stage_table.setStyleSheet("font-family: monospace;")
+        metrics_layout.addWidget(self.stage_table, 2, 0, 1, 4)
+        layout.addWidget(metrics_box)
+
+        # 로그 (최대 줄 수를 넘으면 오래된 줄부터 삭제)
+        self.log = QPlainTextEdit()
+        self.log.setReadOnly(True)
+        self.log.setMaximumBlockCount(Config.GUI_LOG_MAX_LINES)
         self.log.setMaximumHeight(200)
         layout.addWidget(self.log)
 
     def connect_signals(self):
-        """시그널 연결"""
-        self.signals.log_signal.connect(self.add_log)
-        self.signals.progress_signal.connect(self.update_progress)
-        self.signals.status_signal.connect(self.update_status)
+        """로그 버퍼 반영 타이머 연결"""
+        self.flush_timer = QTimer(self)
+        self.flush_timer.timeout.connect(self.flush_log_buffer)
+        self.flush_timer.start(Config.GUI_LOG_FLUSH_INTERVAL_MS)
+
+        self.metrics_timer = QTimer(self)
+        self.metrics_timer.timeout.connect(self.refresh_metrics)
+        self.metrics_timer.start(Config.GUI_METRICS_INTERVAL_MS)
 
     def launch_debug(self):
         """디버그 브라우저 실행"""
@@ -125,8 +151,9 @@ class SimpleUdemyGUI(QMainWindow):
 
         self.connect_btn.setEnabled(False)
         self.status.setText("브라우저 연결 및 스크래핑 진행 중...")
+        profile = self.profile_check.isChecked()
 
-        def run():
+        def scrape():
             try:
                 from browser.auth import UdemyAuth
                 from browser.course_finder import CourseFinder
@@ -137,26 +164,20 @@ class SimpleUdemyGUI(QMainWindow):
                 if success:
                     # 이미 디버그 브라우저에서 Udemy 열려있으니 바로 진행
                     finder = CourseFinder(auth.driver, auth.wait, self.emit_log)
-                    my_learning = finder.go_to_my_learning()
-
-                    if my_learning:
-                        self.emit_status("스크래핑 진행 중...")
-                        self.emit_log("🔍 강의 검색 및 스크래핑 시작...")
-
-                        # 바로 강의 검색하고 스크래핑 진행
-                        success = finder.find_and_scrape_course(course_name,
-                                                               self.emit_progress,
-                                                               self.emit_status)
-
-                        if success:
-                            self.emit_status("스크래핑 완료!")
-                            self.emit_log("🎉 스크래핑이 완료되었습니다!")
-                        else:
-                            self.emit_status("스크래핑 실패")
-                            self.emit_log("❌ 스크래핑에 실패했습니다")
+                    self.emit_status("스크래핑 진행 중...")
+                    self.emit_log("🔍 강의 검색 및 스크래핑 시작...")
+
+                    # 강의명은 카탈로그에서 찾아 바로 이동 (없을 때만 My Learning에서 검색)
+                    success = finder.find_and_scrape_course(course_name,
+                                                           self.emit_progress,
+                                                           self.emit_status)
+
+                    if success:
+                        self.emit_status("스크래핑 완료!")
+                        self.emit_log("🎉 스크래핑이 완료되었습니다!")
                     else:
-                        self.emit_status("로그인 후 다시 연결하세요")
-                        self.emit_log("⚠️ 로그인이 필요합니다")
+                        self.emit_status("스크래핑 실패")
+                        self.emit_log("❌ 스크래핑에 실패했습니다")
                 else:
                     self.emit_status("브라우저 연결 실패")
 
@@ -165,6 +186,10 @@ class SimpleUdemyGUI(QMainWindow):
             finally:
                 self.connect_btn.setEnabled(True)
 
+        def run():
+            with profile_run("gui_scrape", self.emit_log, enabled=profile):
+                scrape()
+
         threading.Thread(target=run, daemon=True).start()
 
 
@@ -173,27 +198,62 @@ class SimpleUdemyGUI(QMainWindow):
         self.course_input.clear()
         self.progress.setValue(0)
         self.status.setText("준비")
+        self.log_buffer.clear()
         self.log.clear()
+        get_metrics().reset()
+        self.refresh_metrics()
         self.emit_log("🔄 초기화 완료")
 
     def emit_log(self, message):
-        """로그 발신"""
+        """로그 발신 (버퍼에 쌓고 타이머에서 반영)"""
         timestamp = time.strftime("%H:%M:%S")
-        self.signals.log_signal.emit(f"[{timestamp}] {message}")
+        self.log_buffer.push(f"[{timestamp}] {message}")
 
     def emit_progress(self, current, total):
-        """진행률 발신"""
+        """진행률 발신 (마지막 값만 반영)"""
         if total > 0:
-            percent = int((current / total) * 100)
-            self.signals.progress_signal.emit(current, total)
+            self.log_buffer.set_progress(current, total)
 
     def emit_status(self, status):
-        """상태 발신"""
-        self.signals.status_signal.emit(status)
+        """상태 발신 (마지막 값만 반영)"""
+        self.log_buffer.set_status(status)
+
+    def flush_log_buffer(self):
+        """쌓인 로그/진행률/상태를 한 번에 위젯에 반영"""
+        lines, dropped, progress, status = self.log_buffer.drain()
+        if dropped:
+            self.add_log(f"... 로그 {dropped}줄 생략 ...")
+        if lines:
+            self.add_log("\n".join(lines))
+        if progress:
+            self.update_progress(*progress)
+        if status is not None:
+            self.update_status(status)
+
+    def refresh_metrics(self):
+        """처리량 지표 스냅샷을 대시보드에 반영"""
+        snapshot = get_metrics().snapshot()
+        self.metric_labels["speed"].setText(f"{snapshot.lectures_per_minute:.1f} 강의/분, {snapshot.cues_per_second:.1f} cue/초")
+        self.metric_labels["workers"].setText(f"{snapshot.active_workers}개")
+        self.metric_labels["eta"].setText(f"{snapshot.eta} ({snapshot.completed}/{snapshot.total})" if snapshot.total else "-")
+        failures = ", ".join(f"{stage} {count}" for stage, count in sorted(snapshot.failures.items()))
+        self.metric_labels["failures"].setText(failures or "없음")
+
+        rows = [f"{stage:<18} 평균 {stats.average:6.2f}초  p95 {stats.p95:6.2f}초  ({stats.count}회)"
+                for stage, stats in sorted(snapshot.stages.items())]
+        self.stage_table.setText("\n".join(["단계별 소요 시간:"] + rows) if rows else "단계별 소요 시간: -")
 
     def add_log(self, message):
         """로그 추가"""
-        self.log.append(message)
+        self.log.appendPlainText(message)
+
+    def closeEvent(self, event):
+        """창 닫을 때 남은 로그 반영 후 스필 파일 정리"""
+        self.flush_timer.stop()
+        self.metrics_timer.stop()
+        self.flush_log_buffer()
+        self.log_buffer.close()
+        super().closeEvent(event)
 
     def update_progress(self, current, total):
         """진행률 업데이트"""
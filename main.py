@@ -16,6 +16,11 @@ def main():
     try:
         print("🚀 Udemy Scraper GUI 시작...")
 
+        # --profile: 프로파일링 체크박스를 켠 상태로 시작
+        if "--profile" in sys.argv:
+            from config import Config
+            Config.PROFILE_ENABLED = True
+
         from gui.simple_ui import run_simple_gui
         run_simple_gui()
 
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+여러 디버그 포트 Chrome에 작업을 나눠 병렬 스크래핑 (멀티 프로세스)
+
+포트 범위마다 Chrome을 하나씩 띄우고(기본 프로필의 쿠키를 복제해 로그인 공유)
+Chrome마다 워커 프로세스 하나를 붙입니다. 결과는 각 워커가 output/ 폴더에 바로
+저장하고, 모든 워커가 끝나면 섹션 통합 파일을 한 번에 만듭니다.
+
+    python shard_runner.py "강의1" "강의2" "강의3"   # 강의 여러 개 → 강의 단위로 분배
+    python shard_runner.py "강의명"                  # 강의 하나 → 강의 안의 강의(lecture) 단위로 분배
+"""
+
+import multiprocessing
+import socket
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from config import Config
+from utils.file_utils import sanitize_filename
+from utils.logger import as_logger
+
+# 워커 프로세스마다 할당된 디버그 포트 (초기화 시 설정)
+_worker_port: Optional[int] = None
+
+# (강의명, (분할 번호, 분할 수) 또는 None, (섹션, 강의) → 담당 분할 번호 또는 None)
+ShardTask = Tuple[str, Optional[Tuple[int, int]], Optional[Dict[Tuple[int, int], int]]]
+
+
+def _port_open(port: int) -> bool:
+    try:
+        with socket.create_connection(('127.0.0.1', port), timeout=1):
+            return True
+    except OSError:
+        return False
+
+
+def _init_worker(port_queue, shard_count: int):
+    """워커 프로세스 초기화: 포트 하나를 맡고, 요청 속도 예산을 프로세스 수로 나눔"""
+    from utils.rate_limiter import get_scheduler
+
+    global _worker_port
+    _worker_port = port_queue.get()
+    # 토큰 버킷은 프로세스마다 따로 있으므로 전체 속도가 설정값을 넘지 않게 함
+    get_scheduler(share=1 / shard_count)
+
+
+def _scrape_task(task: ShardTask) -> Dict:
+    """워커 프로세스: 자기 Chrome에 붙어 강의 하나(또는 그 일부)를 스크래핑"""
+    course_name, shard, plan = task
+    port = _worker_port
+    log = as_logger(lambda message: print(f"[:{port}] {message}", flush=True))
+    result = {'course_name': course_name, 'shard': shard, 'port': port, 'title': None, 'success': False}
+
+    manager = None
+    try:
+        from browser.manager import ExistingBrowserManager
+        from browser.course_finder import CourseFinder
+
+        manager = ExistingBrowserManager(log_callback=log)
+        if not manager.connect_to_existing_browser(port):
+            return result
+
+        finder = CourseFinder(manager.driver, manager.wait, log)
+        result['success'] = finder.find_and_scrape_course(course_name, shard=shard, shard_plan=plan)
+        if finder.last_course:
+            result['title'] = finder.last_course.title
+    except Exception as e:
+        log(f"❌ 워커 오류: {str(e)}")
+    finally:
+        # 중간에 끝나도 chromedriver 세션이 남지 않도록 항상 연결 해제
+        if manager is not None:
+            manager.cleanup()
+    return result
+
+
+class ShardOrchestrator:
+    """디버그 포트 Chrome K개와 워커 프로세스 K개로 강의 큐 분배"""
+
+    def __init__(self, shard_count: Optional[int] = None, port_start: Optional[int] = None, log_callback=None):
+        self.shard_count = max(1, shard_count or Config.SHARD_COUNT)
+        self.port_start = port_start or Config.SHARD_PORT_START
+        self.log_callback = as_logger(log_callback)
+
+    @property
+    def ports(self) -> List[int]:
+        return [self.port_start + i for i in range(self.shard_count)]
+
+    def prepare_instances(self) -> List[int]:
+        """포트마다 Chrome 준비 (이미 열려 있으면 재사용), 준비된 포트 목록 반환"""
+        from browser.manager import ExistingBrowserManager, profile_dir_for_port
+
+        ready = []
+        for port in self.ports:
+            if _port_open(port):
+                self.log_callback(f"♻️ 포트 {port}의 Chrome 재사용")
+                ready.append(port)
+                continue
+
+            manager = ExistingBrowserManager(log_callback=self.log_callback)
+            profile_dir = profile_dir_for_port(port)
+            manager.clone_profile(profile_dir)
+            if manager.start_chrome_with_debug_port(port, user_data_dir=profile_dir):
+                ready.append(port)
+            else:
+                self.log_callback(f"⚠️ 포트 {port} Chrome 시작 실패 - 이 분할은 제외")
+        return ready
+
+    def build_tasks(self, course_names: List[str], ports: List[int]) -> List[ShardTask]:
+        """강의가 여러 개면 강의 단위, 하나면 강의 안의 강의 단위로 작업 분할
+
+        강의 안에서 나눌 때는 배정을 여기서 한 번만 계산해 모든 워커에 같은 표를 전달합니다.
+        워커마다 따로 가져온 재생 시간(API/캐시)이 다르면 배정이 어긋나 강의가 빠지거나
+        두 번 처리될 수 있기 때문입니다.
+        """
+        worker_count = len(ports)
+        if len(course_names) == 1 and worker_count > 1:
+            plan = self.plan_course(course_names[0], ports[0], worker_count)
+            return [(course_names[0], (index, worker_count), plan) for index in range(worker_count)]
+        return [(name, None, None) for name in course_names]
+
+    def plan_course(self, course_name: str, port: int, shard_count: int) -> Optional[Dict[Tuple[int, int], int]]:
+        """커리큘럼을 한 번 분석해 강의별 담당 분할 번호 계산 (실패 시 None → 워커가 순번으로 나눔)"""
+        from browser.manager import ExistingBrowserManager
+        from browser.course_finder import CourseFinder
+        from browser.navigation import UdemyNavigator
+        from utils.work_scheduler import durations_known, shard_plan
+
+        manager = ExistingBrowserManager(log_callback=self.log_callback)
+        try:
+            if not manager.connect_to_existing_browser(port):
+                return None
+            finder = CourseFinder(manager.driver, manager.wait, self.log_callback)
+            course = finder.open_course(course_name)
+            navigator = UdemyNavigator(manager.driver, manager.wait, self.log_callback)
+            if not course or not navigator.analyze_curriculum(course):
+                return None
+        except Exception as e:
+            self.log_callback(f"⚠️ 분할 배정 계산 실패 - 순번으로 분할: {str(e)}")
+            return None
+        finally:
+            manager.cleanup()
+
+        plan = shard_plan(course, shard_count)
+        counts = [list(plan.values()).count(index) for index in range(shard_count)]
+        basis = "재생 시간 기준 긴 강의부터" if durations_known(course) else "재생 시간을 모르는 강의가 있어 순번으로"
+        self.log_callback(f"🧮 {basis} 분할 배정: 분할별 {', '.join(map(str, counts))}개 강의")
+        return plan
+
+    def run(self, course_names: List[str]) -> List[Dict]:
+        """모든 작업을 워커 프로세스에 나눠 실행하고 결과 목록 반환"""
+        ports = self.prepare_instances()
+        if not ports:
+            self.log_callback("❌ 사용할 수 있는 Chrome 인스턴스가 없습니다")
+            return []
+
+        tasks = self.build_tasks(course_names, ports)
+        self.log_callback(f"🧩 Chrome {len(ports)}개(포트 {ports[0]}~{ports[-1]})에 작업 {len(tasks)}개 분배")
+
+        # Selenium/스레드 상태를 물려받지 않도록 spawn 사용
+        context = multiprocessing.get_context('spawn')
+        port_queue = context.Queue()
+        for port in ports:
+            port_queue.put(port)
+
+        results = []
+        with context.Pool(len(ports), initializer=_init_worker, initargs=(port_queue, len(ports))) as pool:
+            for result in pool.imap_unordered(_scrape_task, tasks):
+                results.append(result)
+                shard = f" (분할 {result['shard'][0] + 1}/{result['shard'][1]})" if result['shard'] else ""
+                status = "✅" if result['success'] else "❌"
+                self.log_callback(f"{status} {result['course_name']}{shard} - 포트 {result['port']}")
+
+        self.merge_outputs(results)
+        return results
+
+    def merge_outputs(self, results: List[Dict]):
+        """워커들이 저장한 강의 폴더마다 섹션 통합 파일 생성"""
+        from section_merger import SectionMerger
+
+        for title in sorted({result['title'] for result in results if result['title']}):
+            course_dir = Path("output") / sanitize_filename(title)
+            if not course_dir.exists():
+                continue
+            self.log_callback(f"📚 섹션 통합 파일 생성: {course_dir}")
+            SectionMerger(str(course_dir)).merge_all_sections()
+            languages_dir = course_dir / "languages"
+            for language_dir in sorted(languages_dir.iterdir()) if languages_dir.exists() else []:
+                SectionMerger(str(language_dir)).merge_all_sections()
+
+
+def main():
+    """메인 실행 함수"""
+    if len(sys.argv) < 2:
+        print("사용법: python shard_runner.py <강의명/URL/ID> [<강의명/URL/ID> ...]")
+        return
+
+    Config.ensure_directories()
+    results = ShardOrchestrator(log_callback=print).run(sys.argv[1:])
+    succeeded = sum(1 for result in results if result['success'])
+    print(f"🏁 분할 실행 완료: {succeeded}/{len(results)}개 작업 성공")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""
+섹션 통합 대본에서 핵심 키워드와 핵심 문장을 추출하는 모듈 (추출 요약)
+
+강의 전체를 하나의 희소 단어 행렬로 만든 뒤 TF-IDF와 TextRank를
+한 번의 벡터 연산으로 계산합니다.
+"""
+
+import re
+import sys
+from pathlib import Path
+from typing import List, Dict, Optional
+
+import numpy as np
+from scipy import sparse
+
+from create_study_materials import read_large_file, extract_key_sections
+
+
+# 문장 경계: 줄바꿈은 강의 경계로만 사용
+SENTENCE_PATTERN = re.compile(r"[^.!?。\n]+[.!?。]*")
+
+# 한글은 조사를 떼어낸 2글자 이상 어간, 영문은 소문자 단어
+TOKEN_PATTERN = re.compile(
+    r"[가-힣]{2,}?(?=(?:으로|에서|에게|까지|부터|처럼|보다|은|는|이|가|을|를|에|의|로|와|과|도|만)?(?![가-힣]))"
+    r"|[A-Za-z][A-Za-z0-9+#]+"
+)
+
+# 자막 줄 끝의 종결 어미를 문장 끝으로 간주
+CUE_ENDING_PATTERN = re.compile(r"(다|요|죠|까)\s*\n")
+
+STOPWORDS = {
+    # 조사/어미 잔여물
+    "으로", "에서", "에게", "까지", "부터", "처럼", "보다", "입니다", "합니다", "있습니다",
+    # 구어체 군더더기
+    "그리고", "그래서", "그러면", "그런데", "하지만", "이제", "여기", "저기", "우리", "여러분",
+    "이것", "그것", "저것", "이건", "그건", "정말", "바로", "다시", "먼저", "다음", "지금",
+    "그냥", "약간", "이렇게", "그렇게", "어떻게", "이런", "그런", "하는", "하고", "해서",
+    "있는", "없는", "같은", "같이", "위해", "통해", "대해", "있고", "됩니다", "되는",
+    # 영어 불용어
+    "the", "and", "for", "you", "this", "that", "with", "are", "was", "but", "not",
+    "can", "will", "have", "has", "its", "our", "your", "all", "any", "from",
+}
+
+# 키워드에서 제외할 서술어 어미
+PREDICATE_SUFFIXES = ("니다", "해서", "하는", "하고", "했는데", "세요", "어요", "아요", "지만", "는데")
+
+
+class StudySummarizer:
+    """섹션 통합 대본(Section_XX_제목_total.md)에 대한 추출 요약 클래스"""
+
+    def __init__(self, course_dir: str, keywords_per_item: int = 10,
+                 sentences_per_lecture: int = 3, sentences_per_section: int = 5,
+                 damping: float = 0.85, log_callback=None):
+        self.course_dir = Path(course_dir)
+        self.course_name = self.course_dir.name
+        self.keywords_per_item = keywords_per_item
+        self.sentences_per_lecture = sentences_per_lecture
+        self.sentences_per_section = sentences_per_section
+        self.damping = damping
+        self.log_callback = log_callback or print
+
+    def run(self) -> bool:
+        """요약 계산 후 섹션별 요약 파일 저장"""
+        try:
+            self.log_callback(f"🧠 핵심 요약 생성 시작: {self.course_name}")
+
+            summary = self.summarize()
+            if not summary:
+                return False
+
+            written = self.write_summary_files(summary)
+            self.log_callback(f"✅ 핵심 요약 생성 완료: {written}개 섹션")
+            return written > 0
+
+        except Exception as e:
+            self.log_callback(f"❌ 핵심 요약 생성 실패: {str(e)}")
+            return False
+
+    def summarize(self) -> Optional[Dict]:
+        """강의 전체를 한 번에 분석하여 강의/섹션별 키워드와 핵심 문장 반환"""
+        section_files = self._find_section_files()
+        if not section_files:
+            self.log_callback("❌ 섹션 통합 대본 파일을 찾을 수 없습니다.")
+            return None
+
+        lectures = self._load_lectures(section_files)
+        if not lectures:
+            self.log_callback("❌ 요약할 강의 대본이 없습니다.")
+            return None
+
+        # 1. 강의 전체를 하나의 텍스트로 연결 (강의 경계 = 줄바꿈)
+        bodies = [lecture['body'] for lecture in lectures]
+        text = "\n".join(bodies)
+        lecture_starts = np.cumsum([0] + [len(body) + 1 for body in bodies[:-1]])
+        lecture_section = np.array([lecture['section_idx'] for lecture in lectures])
+        n_sections = len(section_files)
+
+        # 2. 문장 분할
+        spans = np.array([m.span() for m in SENTENCE_PATTERN.finditer(text)], dtype=np.int64).reshape(-1, 2)
+        spans = spans[(spans[:, 1] - spans[:, 0]) >= 10]
+        if len(spans) == 0:
+            self.log_callback("❌ 분석할 문장이 없습니다.")
+            return None
+
+        sent_starts, sent_ends = spans[:, 0], spans[:, 1]
+        sent_lecture = np.searchsorted(lecture_starts, sent_starts, side='right') - 1
+        n_sentences, n_lectures = len(spans), len(lectures)
+        self.log_callback(f"📊 {len(section_files)}개 섹션, {n_lectures}개 강의, {n_sentences}개 문장 분석")
+
+        # 3. 토큰화 및 희소 단어 행렬 (문장 × 단어)
+        matches = [(m.start(), m.group().lower()) for m in TOKEN_PATTERN.finditer(text)]
+        if not matches:
+            return None
+        token_pos = np.fromiter((pos for pos, _ in matches), dtype=np.int64, count=len(matches))
+        vocab, token_ids = np.unique(np.array([token for _, token in matches]), return_inverse=True)
+
+        token_sent = np.searchsorted(sent_starts, token_pos, side='right') - 1
+        keep = (token_sent >= 0) & (token_pos < sent_ends[np.maximum(token_sent, 0)])
+        excluded = np.isin(vocab, list(STOPWORDS))
+        for suffix in PREDICATE_SUFFIXES:
+            excluded |= np.char.endswith(vocab, suffix)
+        keep &= ~excluded[token_ids]
+        counts = sparse.csr_matrix(
+            (np.ones(int(keep.sum())), (token_sent[keep], token_ids[keep])),
+            shape=(n_sentences, len(vocab))
+        )
+
+        # 4. TF-IDF (문서 단위 = 강의)
+        lecture_matrix = sparse.csr_matrix(
+            (np.ones(n_sentences), (sent_lecture, np.arange(n_sentences))),
+            shape=(n_lectures, n_sentences)
+        )
+        lecture_counts = (lecture_matrix @ counts).tocsr()
+        df = np.asarray((lecture_counts > 0).sum(axis=0)).ravel()
+        idf = np.log((1 + n_lectures) / (1 + df)) + 1.0
+
+        tfidf = counts.copy()
+        tfidf.data = np.log1p(tfidf.data)
+        tfidf = (tfidf @ sparse.diags(idf)).tocsr()
+        norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+        tfidf = (sparse.diags(np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)) @ tfidf).tocoo()
+
+        # 5. TextRank (강의 내부 문장 그래프, 전 강의 동시 계산)
+        scores = self._textrank(tfidf, sent_lecture, n_lectures)
+
+        # 6. 키워드: 강의/섹션별 TF-IDF 합계 상위 단어
+        lecture_weights = (lecture_counts @ sparse.diags(idf)).tocsr()
+        section_matrix = sparse.csr_matrix(
+            (np.ones(n_lectures), (lecture_section, np.arange(n_lectures))),
+            shape=(n_sections, n_lectures)
+        )
+        section_weights = (section_matrix @ lecture_weights).tocoo()
+        lecture_weights = lecture_weights.tocoo()
+
+        lecture_keywords = self._group_top_terms(lecture_weights, vocab, n_lectures)
+        section_keywords = self._group_top_terms(section_weights, vocab, n_sections)
+
+        # 7. 핵심 문장: 강의별 상위 / 섹션별 상위 (강의 크기 보정 점수)
+        lecture_size = np.bincount(sent_lecture, minlength=n_lectures)
+        relative_scores = scores * lecture_size[sent_lecture]
+        sent_section = lecture_section[sent_lecture]
+
+        lecture_picks = _top_k_per_group(sent_lecture, scores, self.sentences_per_lecture)
+        section_picks = _top_k_per_group(sent_section, relative_scores, self.sentences_per_section)
+
+        def sentences_by_group(picks, groups, n_groups):
+            result = [[] for _ in range(n_groups)]
+            for idx in np.sort(picks):  # 원문 순서 유지
+                result[groups[idx]].append(text[sent_starts[idx]:sent_ends[idx]].strip())
+            return result
+
+        lecture_sentences = sentences_by_group(lecture_picks, sent_lecture, n_lectures)
+        section_sentences = sentences_by_group(section_picks, sent_section, n_sections)
+
+        # 8. 결과 구성
+        sections = []
+        for section_idx, section_file in enumerate(section_files):
+            sections.append({
+                'file': section_file,
+                'keywords': section_keywords[section_idx],
+                'key_sentences': section_sentences[section_idx],
+                'lectures': []
+            })
+        for lecture_idx, lecture in enumerate(lectures):
+            sections[lecture['section_idx']]['lectures'].append({
+                'title': lecture['title'],
+                'keywords': lecture_keywords[lecture_idx],
+                'key_sentences': lecture_sentences[lecture_idx]
+            })
+
+        return {'course_name': self.course_name, 'sections': sections}
+
+    def write_summary_files(self, summary: Dict) -> int:
+        """섹션별 요약 마크다운 파일 저장 (Section_XX_제목_summary.md)"""
+        written = 0
+        for section in summary['sections']:
+            try:
+                section_file = section['file']
+                output_file = section_file.with_name(section_file.name.replace("_total.md", "_summary.md"))
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    f.write(self._create_summary_markdown(section))
+                self.log_callback(f"    ✅ {output_file.name} 생성 완료")
+                written += 1
+            except Exception as e:
+                self.log_callback(f"    ❌ {section['file'].name} 요약 저장 실패: {str(e)}")
+        return written
+
+    def _textrank(self, tfidf, sent_lecture: np.ndarray, n_lectures: int, max_iter: int = 50,
+                  tol: float = 1e-6) -> np.ndarray:
+        """강의 단위 블록 대각 유사도 그래프에서 PageRank 계산
+
+        유사도 행렬 S = X·Xᵀ 를 직접 만들지 않고, 강의별 단어 합계 벡터를 통해
+        S·v 를 O(nnz)로 계산합니다.
+        """
+        n_sentences = len(sent_lecture)
+        rows, cols, vals = tfidf.row, tfidf.col, tfidf.data
+
+        # (강의, 단어) 쌍별로 묶어서 블록 내부 내적 계산
+        pair_keys = sent_lecture[rows].astype(np.int64) * tfidf.shape[1] + cols
+        _, pair_ids = np.unique(pair_keys, return_inverse=True)
+        self_similarity = np.bincount(rows, weights=vals * vals, minlength=n_sentences)
+
+        def block_matvec(vector):
+            pair_sums = np.bincount(pair_ids, weights=vals * vector[rows])
+            result = np.bincount(rows, weights=vals * pair_sums[pair_ids], minlength=n_sentences)
+            return result - self_similarity * vector
+
+        degree = block_matvec(np.ones(n_sentences))
+        lecture_size = np.bincount(sent_lecture, minlength=n_lectures)[sent_lecture]
+        teleport = (1.0 - self.damping) / lecture_size
+
+        scores = 1.0 / lecture_size
+        for _ in range(max_iter):
+            share = np.divide(scores, degree, out=np.zeros(n_sentences), where=degree > 0)
+            updated = teleport + self.damping * block_matvec(share)
+            # 연결이 없는 문장의 확률 질량을 강의 내부에서 재정규화
+            totals = np.bincount(sent_lecture, weights=updated, minlength=n_lectures)
+            updated /= totals[sent_lecture]
+            converged = np.abs(updated - scores).max() < tol
+            scores = updated
+            if converged:
+                break
+
+        return scores
+
+    def _group_top_terms(self, weights, vocab: np.ndarray, n_groups: int) -> List[List[str]]:
+        """그룹(강의/섹션)별 가중치 상위 단어 목록"""
+        result = [[] for _ in range(n_groups)]
+        picks = _top_k_per_group(weights.row, weights.data, self.keywords_per_item)
+        for idx in picks:
+            result[weights.row[idx]].append(str(vocab[weights.col[idx]]))
+        return result
+
+    def _find_section_files(self) -> List[Path]:
+        """섹션 통합 대본 파일들 찾기 (섹션 번호순)"""
+        files = [f for f in self.course_dir.glob("Section_*_total.md") if f.is_file()]
+        files.sort(key=lambda x: int(x.name.split("_")[1]))
+        return files
+
+    def _load_lectures(self, section_files: List[Path]) -> List[Dict]:
+        """통합 대본을 강의 단위로 분해"""
+        lectures = []
+        for section_idx, section_file in enumerate(section_files):
+            content = read_large_file(section_file)
+            if not content:
+                continue
+
+            # 기존 저장 형식의 리터럴 "\n" 구분자 처리
+            content = content.replace("\\n", "\n")
+
+            for item in extract_key_sections(content, section_file.name):
+                title = re.sub(r"^\d+\.\s*", "", item['title'])
+                lines = [line for line in item['content'].split('\n')
+                         if line.strip() and line.strip() != '---' and not line.startswith('*')]
+                body = CUE_ENDING_PATTERN.sub(r"\1.\n", "\n".join(lines) + "\n")
+                body = " ".join(body.split())
+                if body:
+                    lectures.append({'section_idx': section_idx, 'title': title, 'body': body})
+        return lectures
+
+    def _create_summary_markdown(self, section: Dict) -> str:
+        """섹션 요약 마크다운 내용 생성"""
+        section_name = section['file'].name.replace("_total.md", "")
+        content = []
+
+        content.append(f"# {section_name} 핵심 요약\n\n")
+        content.append(f"**강의명**: {self.course_name}\n")
+        content.append(f"**키워드**: {', '.join(section['keywords'])}\n\n")
+
+        content.append("## 📌 섹션 핵심 문장\n\n")
+        for sentence in section['key_sentences']:
+            content.append(f"- {sentence}\n")
+        content.append("\n---\n\n")
+
+        for i, lecture in enumerate(section['lectures'], 1):
+            content.append(f"## {i}. {lecture['title']}\n\n")
+            if lecture['keywords']:
+                content.append(f"**키워드**: {', '.join(lecture['keywords'])}\n\n")
+            for sentence in lecture['key_sentences']:
+                content.append(f"- {sentence}\n")
+            content.append("\n")
+
+        return ''.join(content)
+
+
+def _top_k_per_group(groups: np.ndarray, scores: np.ndarray, k: int) -> np.ndarray:
+    """그룹별 점수 상위 k개 인덱스 (정렬 한 번으로 계산)"""
+    if len(groups) == 0:
+        return np.array([], dtype=np.int64)
+    order = np.lexsort((-scores, groups))
+    sorted_groups = groups[order]
+    rank = np.arange(len(order)) - np.searchsorted(sorted_groups, sorted_groups, side='left')
+    return order[rank < k]
+
+
+def main():
+    """메인 실행 함수"""
+    if len(sys.argv) < 2:
+        print("사용법: python study_summarizer.py <강의 출력 디렉토리>")
+        return
+
+    course_dir = sys.argv[1]
+    if not Path(course_dir).exists():
+        print(f"❌ 강의 디렉토리를 찾을 수 없습니다: {course_dir}")
+        return
+
+    StudySummarizer(course_dir).run()
+
+
+if __name__ == "__main__":
+    main()
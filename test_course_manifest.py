@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+업데이트 모드 매니페스트 비교/적용 테스트 (파일 시스템만 사용)
+"""
+
+from core.models import Course, Section, Lecture
+from utils.course_manifest import CourseManifest, section_dir_name
+
+
+def make_course(*sections):
+    """[(섹션 제목, [(강의 제목, 재생 시간, 강의 ID), ...]), ...] → Course"""
+    course = Course(title="테스트 강의")
+    for title, lectures in sections:
+        course.sections.append(Section(title=title, lectures=[
+            Lecture(name, duration, lecture_id=lecture_id, lecture_type="video")
+            for name, duration, lecture_id in lectures
+        ]))
+    return course
+
+
+def write_outputs(course_dir, course, languages=()):
+    """TranscriptScraper와 같은 구조로 강의 파일(과 언어별 사본) 생성"""
+    for root in [course_dir] + [course_dir / "languages" / language for language in languages]:
+        for section_idx, section in enumerate(course.sections):
+            section_dir = root / section_dir_name(section_idx, section.title)
+            section_dir.mkdir(parents=True, exist_ok=True)
+            for lecture_idx, lecture in enumerate(section.lectures):
+                (section_dir / f"{lecture_idx + 1:02d}_{lecture.title}.txt").write_text(
+                    f"{root.name}:{lecture.title}", encoding='utf-8')
+
+
+def saved_manifest(course_dir, course):
+    manifest = CourseManifest(course_dir, log_callback=lambda message: None)
+    manifest.rebuild(course)
+    manifest.save(course)
+    loaded = CourseManifest(course_dir, log_callback=lambda message: None)
+    assert loaded.load()
+    return loaded
+
+
+def listing(root):
+    return sorted(path.relative_to(root).as_posix() for path in root.rglob("*.txt"))
+
+
+OLD = make_course(
+    ("Intro", [("Welcome", "3:00", 1), ("Setup", "5:00", 2)]),
+    ("Basics", [("Variables", "7:00", 3), ("Loops", "6:00", 4)]),
+)
+
+
+def test_reorder_moves_files_and_language_copies(tmp_path):
+    write_outputs(tmp_path, OLD, languages=["English"])
+    manifest = saved_manifest(tmp_path, OLD)
+
+    new = make_course(
+        ("Intro", [("Setup", "5:00", 2), ("Welcome", "3:00", 1)]),
+        ("Basics", [("Variables", "7:00", 3), ("Loops", "6:00", 4)]),
+    )
+    diff = manifest.diff(new)
+    assert not diff.added and not diff.changed and not diff.removed
+    assert len(diff.moved) == 2
+
+    affected = manifest.apply(diff, new)
+    assert affected == {0}
+    for root in (tmp_path, tmp_path / "languages" / "English"):
+        section_dir = root / "Section_01_Intro"
+        assert (section_dir / "01_Setup.txt").read_text(encoding='utf-8').endswith("Setup")
+        assert (section_dir / "02_Welcome.txt").read_text(encoding='utf-8').endswith("Welcome")
+        assert sorted(path.name for path in section_dir.iterdir()) == ["01_Setup.txt", "02_Welcome.txt"]
+    assert not (tmp_path / ".update_staging").exists()
+
+
+def test_remove_deletes_files_and_empty_sections(tmp_path):
+    write_outputs(tmp_path, OLD, languages=["English"])
+    (tmp_path / "Section_02_Basics_total.md").write_text("merged", encoding='utf-8')
+    manifest = saved_manifest(tmp_path, OLD)
+
+    new = make_course(("Intro", [("Welcome", "3:00", 1)]))
+    diff = manifest.diff(new)
+    assert [entry.title for entry in diff.removed] == ["Setup", "Variables", "Loops"]
+
+    affected = manifest.apply(diff, new)
+    assert affected == {0}
+    assert listing(tmp_path) == ["Section_01_Intro/01_Welcome.txt", "languages/English/Section_01_Intro/01_Welcome.txt"]
+    assert not (tmp_path / "Section_02_Basics").exists()
+    assert not (tmp_path / "Section_02_Basics_total.md").exists()
+
+
+def test_rerecorded_lecture_keeps_old_file_until_replaced(tmp_path):
+    write_outputs(tmp_path, OLD, languages=["English"])
+    manifest = saved_manifest(tmp_path, OLD)
+
+    # "Loops"가 재녹화(재생 시간 변경)되고 "Variables" 앞으로 이동
+    new = make_course(
+        ("Intro", [("Welcome", "3:00", 1), ("Setup", "5:00", 2)]),
+        ("Basics", [("Loops", "9:00", 4), ("Variables", "7:00", 3)]),
+    )
+    diff = manifest.diff(new)
+    assert diff.changed == [(1, 0)]
+    assert diff.to_scrape == {(1, 0)}
+
+    manifest.apply(diff, new)
+    # 다시 추출 전: 이전 자막이 새 위치에 남아 있음
+    previous = diff.superseded[(1, 0)]
+    assert previous.path == "Section_02_Basics/01_Loops.txt"
+    for root in (tmp_path, tmp_path / "languages" / "English"):
+        assert (root / previous.path).read_text(encoding='utf-8').endswith("Loops")
+        assert (root / "Section_02_Basics/02_Variables.txt").exists()
+
+    # 다시 추출에 실패하면 이전 제목/재생 시간을 유지해 다음 실행에서 다시 변경으로 잡힘
+    manifest.rebuild(new, pending=diff.superseded)
+    manifest.save(new)
+    retried = CourseManifest(tmp_path, log_callback=lambda message: None)
+    retried.load()
+    assert retried.diff(new).changed == [(1, 0)]
+
+    # 새 자막이 다른 이름으로 저장되면 이전 파일과 언어별 사본 삭제
+    new.sections[1].lectures[0].title = "Loops and Ranges"
+    (tmp_path / "Section_02_Basics/01_Loops and Ranges.txt").write_text("new", encoding='utf-8')
+    manifest.remove_copies(previous.path)
+    assert listing(tmp_path / "Section_02_Basics") == ["01_Loops and Ranges.txt", "02_Variables.txt"]
+    assert not (tmp_path / "languages/English" / previous.path).exists()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+SQLite 작업 큐 임대/재시도 테스트 (가짜 시계 사용)
+"""
+
+import pytest
+
+import utils.job_queue as job_queue
+from config import Config
+from utils.job_queue import JobQueue, DONE, FAILED, LEASED, PENDING, SECTION
+
+
+class FakeClock:
+    """time.time 대체 (advance로만 시간이 흐름)"""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(job_queue, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def queue(tmp_path, clock):
+    return JobQueue(tmp_path / "jobs.db", lease_seconds=60, max_attempts=2)
+
+
+def status_of(queue, job_id):
+    with queue._transaction() as db:
+        return db.execute("SELECT status FROM jobs WHERE job_id = ?", (job_id,)).fetchone()['status']
+
+
+def test_expired_lease_is_reclaimed(queue, clock):
+    assert queue.enqueue("강의")
+    assert not queue.enqueue("강의")  # 같은 작업은 한 번만
+
+    job = queue.claim("worker-a")
+    assert job.attempts == 1
+    assert queue.claim("worker-b") is None
+
+    # heartbeat로 연장하는 동안에는 다른 워커가 못 가져감
+    clock.advance(50)
+    assert queue.heartbeat(job.job_id, "worker-a")
+    clock.advance(50)
+    assert queue.claim("worker-b") is None
+
+    clock.advance(11)
+    reclaimed = queue.claim("worker-b")
+    assert reclaimed.job_id == job.job_id
+    assert reclaimed.attempts == 2
+    assert not queue.heartbeat(job.job_id, "worker-a")
+
+
+def test_stale_owner_cannot_complete(queue, clock):
+    queue.enqueue("강의")
+    job = queue.claim("worker-a")
+    clock.advance(61)
+    queue.claim("worker-b")
+
+    assert not queue.complete(job.job_id, "worker-a")
+    assert not queue.fail(job.job_id, "worker-a", "늦은 실패")
+    assert status_of(queue, job.job_id) == LEASED
+
+    assert queue.complete(job.job_id, "worker-b")
+    assert status_of(queue, job.job_id) == DONE
+    assert queue.claim("worker-a") is None
+
+
+def test_fail_backs_off_then_fails_at_max_attempts(queue, clock):
+    queue.enqueue("강의")
+    job = queue.claim("worker-a")
+    assert queue.fail(job.job_id, "worker-a", "첫 실패")
+    assert status_of(queue, job.job_id) == PENDING
+
+    # 백오프(RETRY_DELAY * 2^시도 횟수)가 끝나기 전에는 다시 가져가지 않음
+    backoff = Config.RETRY_DELAY * 2 ** job.attempts
+    clock.advance(backoff - 0.5)
+    assert queue.claim("worker-b") is None
+    clock.advance(1)
+    retry = queue.claim("worker-b")
+    assert retry.attempts == 2
+
+    assert queue.fail(retry.job_id, "worker-b", "두 번째 실패")
+    assert status_of(queue, job.job_id) == FAILED
+    clock.advance(3600)
+    assert queue.claim("worker-c") is None
+    assert [row['last_error'] for row in queue.failed_jobs()] == ["두 번째 실패"]
+
+    assert queue.requeue_failed() == 1
+    assert queue.claim("worker-c").attempts == 1
+
+
+def test_expired_lease_at_max_attempts_is_failed(queue, clock):
+    queue.enqueue("강의")
+    queue.claim("worker-a")
+    clock.advance(61)
+    queue.claim("worker-b")
+    clock.advance(61)
+
+    # 두 번째 워커도 임대 중에 죽으면 더 이상 임대하지 않고 실패 처리
+    assert queue.claim("worker-c") is None
+    assert queue.stats() == {FAILED: 1}
+
+
+def test_sections_claimed_longest_first(queue):
+    assert queue.enqueue_sections("강의", [120.0, 900.0, 300.0]) == 3
+    claimed = [queue.claim("worker-a") for _ in range(3)]
+    assert [job.section_idx for job in claimed] == [1, 2, 0]
+    assert all(job.kind == SECTION for job in claimed)
+    assert claimed[0].label == "강의 섹션 2"
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+토큰 버킷 속도 제한 테스트 (가짜 시계 사용)
+"""
+
+import pytest
+
+import utils.rate_limiter as rate_limiter
+from utils.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    """time.monotonic/sleep 대체 (sleep하면 시간만 흐름)"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", fake)
+    return fake
+
+
+def test_burst_then_rate(clock):
+    bucket = TokenBucket(rate_per_minute=60, burst=3)
+    started = clock.now
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.now == started
+
+    bucket.acquire()
+    assert clock.now == pytest.approx(started + 1.0)
+
+
+def test_pause_does_not_accumulate_tokens(clock):
+    bucket = TokenBucket(rate_per_minute=60, burst=3)
+    bucket.pause(10.0)
+    started = clock.now
+
+    # 멈춘 동안 아무도 토큰을 요청하지 않아도 멈춘 시간만큼 토큰이 쌓이면 안 됨
+    bucket.acquire()
+    assert clock.now == pytest.approx(started + 11.0)
+    bucket.acquire()
+    assert clock.now == pytest.approx(started + 12.0)
+
+
+def test_pause_after_idle_keeps_no_backlog(clock):
+    bucket = TokenBucket(rate_per_minute=60, burst=3)
+    clock.sleep(30.0)
+    bucket.pause(5.0)
+    clock.sleep(20.0)
+
+    # 멈춤이 끝난 뒤 15초가 지났으므로 버스트까지만 쌓임
+    started = clock.now
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.now == started
+    bucket.acquire()
+    assert clock.now == pytest.approx(started + 1.0)
+
+
+def test_acquire_timeout_during_pause(clock):
+    bucket = TokenBucket(rate_per_minute=60, burst=3)
+    bucket.pause(5.0)
+    assert not bucket.acquire(timeout=2.0)
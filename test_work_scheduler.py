@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+재생 시간 파싱과 긴 강의 우선 분할 배정 테스트
+"""
+
+import pytest
+
+from core.models import Course, Section, Lecture, parse_duration, format_duration
+from utils.work_scheduler import (assign_longest_first, durations_known, lecture_weights,
+                                  longest_first, shard_plan)
+
+
+def make_course(*sections):
+    """[[(재생 시간, 강의 종류), ...], ...] → Course"""
+    course = Course(title="테스트 강의")
+    for section_idx, lectures in enumerate(sections):
+        course.sections.append(Section(title=f"섹션 {section_idx + 1}", lectures=[
+            Lecture(f"강의 {lecture_idx + 1}", duration, lecture_type=lecture_type)
+            for lecture_idx, (duration, lecture_type) in enumerate(lectures)
+        ]))
+    return course
+
+
+@pytest.mark.parametrize("text, seconds", [
+    ("05:30", 330),
+    ("1:02:03", 3723),
+    ("3분", 180),
+    ("1시간 2분", 3720),
+    ("1시간 2분 5초", 3725),
+    ("3min", 180),
+    ("1h 30m", 5400),
+    ("2 hours 5 minutes", 7500),
+    ("45 sec", 45),
+    ("", 0),
+    ("알 수 없음", 0),
+])
+def test_parse_duration_mixed_units(text, seconds):
+    assert parse_duration(text) == seconds
+
+
+def test_format_duration_round_trip():
+    assert format_duration(3720) == "1시간 2분"
+    assert format_duration(3600) == "1시간"
+    assert format_duration(20) == "1분"
+    assert parse_duration(format_duration(5400)) == 5400
+
+
+def test_longest_first_keeps_order_for_ties():
+    weights = {"a": 1, "b": 5, "c": 5, "d": 3}
+    assert longest_first(weights, weights.get) == ["b", "c", "d", "a"]
+
+
+def test_assign_longest_first_balances_load():
+    weights = {"a": 7, "b": 5, "c": 4, "d": 3, "e": 1}
+    assignment = assign_longest_first(weights, weights.get, 2)
+    loads = [sum(weights[item] for item, worker in assignment.items() if worker == w) for w in range(2)]
+    assert assignment["a"] != assignment["b"]
+    assert sorted(loads) == [10, 10]
+
+
+def test_shard_plan_longest_first_when_durations_known():
+    course = make_course(
+        [("10:00", "video"), ("1:00", "video"), ("5분", "video")],
+        [("2:00", "video"), ("읽기", "document"), ("9:00", "video")],
+    )
+    assert durations_known(course)
+
+    plan = shard_plan(course, 2)
+    # 자막이 없는 강의는 배정하지 않음
+    assert (1, 1) not in plan
+    assert set(plan) == set(lecture_weights(course))
+    assert plan[(0, 0)] != plan[(1, 2)]
+    loads = [sum(seconds for position, seconds in lecture_weights(course).items() if plan[position] == shard)
+             for shard in range(2)]
+    assert max(loads) - min(loads) <= 60
+
+
+def test_shard_plan_falls_back_to_ordinal_when_duration_unknown():
+    course = make_course(
+        [("10:00", "video"), ("", "video"), ("퀴즈", "quiz")],
+        [("2:00", "video"), ("9:00", "video")],
+    )
+    assert not durations_known(course)
+
+    # 전체 순번(자막 없는 강의 포함)의 나머지로 배정
+    assert shard_plan(course, 2) == {(0, 0): 0, (0, 1): 1, (1, 0): 1, (1, 1): 0}
+
+
+def test_unknown_duration_weighted_by_known_average():
+    course = make_course([("10:00", "video"), ("", "video"), ("20:00", "video")])
+    assert lecture_weights(course)[(0, 1)] == 900.0
@@ -0,0 +1,85 @@
+"""
+수강 강의 카탈로그 로컬 저장소
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, List, Iterable
+from config import Config
+from core.models import EnrolledCourse
+
+
+class CourseCatalog:
+    """수강 중인 강의 목록을 강의 ID별로 보관하는 JSON 저장소"""
+
+    def __init__(self, path: Optional[Path] = None, log_callback=None):
+        self.path = Path(path) if path else Config.get_course_catalog_path()
+        self.log_callback = log_callback or print
+        self.courses: Dict[int, EnrolledCourse] = {}
+        self.synced_at: Optional[str] = None
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self.courses)
+
+    def __contains__(self, course_id: int) -> bool:
+        return course_id in self.courses
+
+    def load(self):
+        """저장된 카탈로그 읽기"""
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            self.log_callback(f"⚠️ 강의 카탈로그 읽기 실패: {str(e)}")
+            return
+
+        self.synced_at = data.get('synced_at')
+        for item in data.get('courses', []):
+            entry = EnrolledCourse.from_dict(item)
+            self.courses[entry.course_id] = entry
+
+    def save(self) -> bool:
+        """카탈로그 저장"""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'synced_at': self.synced_at,
+                    'courses': [entry.to_dict() for entry in self.courses.values()]
+                }, f, ensure_ascii=False, indent=2)
+            tmp_path.replace(self.path)
+            return True
+        except OSError as e:
+            self.log_callback(f"⚠️ 강의 카탈로그 저장 실패: {str(e)}")
+            return False
+
+    def upsert(self, entries: Iterable[EnrolledCourse]) -> int:
+        """항목 추가/갱신 후 새로 추가된 개수 반환"""
+        added = 0
+        for entry in entries:
+            if entry.course_id not in self.courses:
+                added += 1
+            self.courses[entry.course_id] = entry
+        return added
+
+    def replace_all(self, entries: Iterable[EnrolledCourse]):
+        """전체 동기화 결과로 교체"""
+        self.courses = {entry.course_id: entry for entry in entries}
+
+    def mark_synced(self):
+        """동기화 시각 기록"""
+        self.synced_at = datetime.now().isoformat(timespec='seconds')
+
+    def get(self, course_id: int) -> Optional[EnrolledCourse]:
+        """강의 ID로 조회"""
+        return self.courses.get(course_id)
+
+    def entries(self) -> List[EnrolledCourse]:
+        """전체 항목"""
+        return list(self.courses.values())
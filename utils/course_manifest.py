@@ -0,0 +1,255 @@
+"""
+강의 출력 매니페스트와 커리큘럼 비교 (UPDATE_ONLY 업데이트 모드)
+
+실행이 끝나면 강의 폴더의 manifest.json에 저장된 강의 파일(강의 ID, 제목, 재생 시간,
+경로)을 기록하고, 다음 실행에서 새로 분석한 커리큘럼과 비교해 추가/변경/삭제/이동된
+강의를 계산합니다. 이동된 강의는 파일 이름만 바꾸고, 추가/변경된 강의만 다시 추출합니다.
+변경된 강의의 이전 파일은 새 위치로 옮겨 두었다가 새 자막이 저장된 뒤에 지우므로
+다시 추출에 실패해도 이전 자막이 남습니다. languages/<언어>/ 아래 사본도 함께 옮깁니다.
+"""
+
+import json
+import time
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from core.models import Course, Lecture
+from utils.file_utils import sanitize_filename
+
+MANIFEST_FILE = "manifest.json"
+_STAGING_DIR = ".update_staging"
+_LANGUAGES_DIR = "languages"
+_NO_TRANSCRIPT_TYPES = ("document", "quiz", "resource")
+
+
+@dataclass(slots=True)
+class ManifestEntry:
+    """저장된 강의 파일 하나"""
+    section_idx: int
+    lecture_idx: int
+    title: str
+    duration: str
+    lecture_id: Optional[int]
+    path: str  # 강의 폴더 기준 상대 경로
+
+
+@dataclass
+class CurriculumDiff:
+    """이전 매니페스트 대비 커리큘럼 변경 내역 (위치는 새 커리큘럼 기준)"""
+    added: List[Tuple[int, int]] = field(default_factory=list)
+    changed: List[Tuple[int, int]] = field(default_factory=list)  # 제목/재생 시간이 바뀜 (재녹화)
+    moved: List[Tuple[ManifestEntry, Tuple[int, int]]] = field(default_factory=list)  # 내용은 같고 위치만 바뀜
+    removed: List[ManifestEntry] = field(default_factory=list)
+    superseded: Dict[Tuple[int, int], ManifestEntry] = field(default_factory=dict)  # 변경된 위치 → 새 자막 저장 후 지울 이전 파일
+    unchanged: int = 0
+
+    @property
+    def to_scrape(self) -> Set[Tuple[int, int]]:
+        return set(self.added) | set(self.changed)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.changed or self.moved or self.removed)
+
+    def summary(self) -> str:
+        return (f"추가 {len(self.added)}개, 변경 {len(self.changed)}개, 이동 {len(self.moved)}개, "
+                f"삭제 {len(self.removed)}개, 그대로 {self.unchanged}개")
+
+
+class CourseManifest:
+    """강의 폴더의 manifest.json 읽기/쓰기와 변경분 적용"""
+
+    def __init__(self, course_dir: Path, log_callback=None):
+        self.course_dir = Path(course_dir)
+        self.log_callback = log_callback or print
+        self.entries: List[ManifestEntry] = []
+        self.last_update_date = ""
+
+    @property
+    def path(self) -> Path:
+        return self.course_dir / MANIFEST_FILE
+
+    def load(self) -> bool:
+        """이전 실행의 매니페스트 읽기 (없거나 깨졌으면 False)"""
+        if not self.path.exists():
+            return False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.entries = [ManifestEntry(**item) for item in data.get('lectures', [])]
+            self.last_update_date = data.get('last_update_date', "")
+            return True
+        except (OSError, ValueError, TypeError) as e:
+            self.log_callback(f"⚠️ 매니페스트 읽기 실패: {str(e)}")
+            return False
+
+    def rebuild(self, course: Course, pending: Optional[Dict[Tuple[int, int], ManifestEntry]] = None) -> int:
+        """커리큘럼 위치마다 디스크에 있는 강의 파일을 찾아 매니페스트 갱신 → 기록된 파일 수
+
+        pending: 다시 추출하지 못해 이전 파일이 남은 위치 → 이전 항목 (다음 실행에서도 변경으로 잡히도록
+        이전 제목/재생 시간을 유지)
+        """
+        pending = pending or {}
+        entries = []
+        for section_idx, section in enumerate(course.sections):
+            section_dir = self.course_dir / section_dir_name(section_idx, section.title)
+            if not section_dir.is_dir():
+                continue
+            for lecture_idx, lecture in enumerate(section.lectures):
+                found = next(iter(sorted(section_dir.glob(f"{lecture_idx + 1:02d}_*.txt"))), None)
+                if not found:
+                    continue
+                source = pending.get((section_idx, lecture_idx))
+                title, duration, lecture_id = ((source.title, source.duration, source.lecture_id) if source
+                                               else (lecture.title, lecture.duration, lecture.lecture_id))
+                entries.append(ManifestEntry(section_idx, lecture_idx, title, duration, lecture_id,
+                                             found.relative_to(self.course_dir).as_posix()))
+        self.entries = entries
+        self.last_update_date = course.last_update_date
+        return len(entries)
+
+    def save(self, course: Course) -> bool:
+        """원자적으로 저장 (여러 프로세스가 써도 파일이 깨지지 않음)"""
+        try:
+            self.course_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'title': course.title,
+                    'course_id': course.course_id,
+                    'last_update_date': self.last_update_date,
+                    'updated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                    'lectures': [asdict(entry) for entry in self.entries]
+                }, f, ensure_ascii=False, indent=2)
+            tmp_path.replace(self.path)
+            return True
+        except OSError as e:
+            self.log_callback(f"⚠️ 매니페스트 저장 실패: {str(e)}")
+            return False
+
+    def diff(self, course: Course) -> CurriculumDiff:
+        """새 커리큘럼과 비교 (강의 ID로 대응, ID가 없으면 제목으로)"""
+        by_id = {entry.lecture_id: entry for entry in self.entries if entry.lecture_id is not None}
+        by_title = {entry.title: entry for entry in self.entries}
+        matched = set()
+        result = CurriculumDiff()
+
+        for section_idx, section in enumerate(course.sections):
+            new_dir = section_dir_name(section_idx, section.title)
+            for lecture_idx, lecture in enumerate(section.lectures):
+                if lecture.lecture_type in _NO_TRANSCRIPT_TYPES:
+                    continue
+                position = (section_idx, lecture_idx)
+                previous = by_id.get(lecture.lecture_id) if lecture.lecture_id is not None else None
+                if previous is None:
+                    candidate = by_title.get(lecture.title)
+                    if candidate is not None and (candidate.lecture_id is None or lecture.lecture_id is None):
+                        previous = candidate
+                if previous is None or id(previous) in matched:
+                    result.added.append(position)
+                    continue
+
+                matched.add(id(previous))
+                if _content_changed(previous, lecture):
+                    result.changed.append(position)
+                    result.superseded[position] = previous
+                elif ((previous.section_idx, previous.lecture_idx) != position
+                      or Path(previous.path).parent.name != new_dir):
+                    result.moved.append((previous, position))
+                else:
+                    result.unchanged += 1
+
+        result.removed = [entry for entry in self.entries if id(entry) not in matched]
+        return result
+
+    def apply(self, diff: CurriculumDiff, course: Course) -> Set[int]:
+        """삭제된 파일을 지우고 이동/변경된 파일을 새 위치로 옮김 → 통합 파일을 다시 만들 섹션
+
+        변경된 강의의 이전 파일은 지우지 않고 새 위치로 옮기며, diff.superseded의 경로를
+        옮긴 위치로 갱신합니다 (새 자막 저장 후 remove_copies로 삭제).
+        """
+        touched_dirs = set()
+        for entry in diff.removed:
+            touched_dirs.add(Path(entry.path).parent.name)
+            for path in self.copies(entry.path):
+                path.unlink()
+
+        relocations = list(diff.moved) + [(entry, position) for position, entry in diff.superseded.items()]
+        # 번호가 서로 밀리는 경우를 위해 임시 폴더를 거쳐 두 단계로 이동
+        staging = self.course_dir / _STAGING_DIR
+        staged = []
+        for number, (entry, position) in enumerate(relocations):
+            touched_dirs.add(Path(entry.path).parent.name)
+            if not (self.course_dir / entry.path).exists():
+                if position in diff.superseded:
+                    del diff.superseded[position]
+                else:
+                    diff.added.append(position)
+                continue
+            staging.mkdir(exist_ok=True)
+            copies = []
+            for copy_number, path in enumerate(self.copies(entry.path)):
+                temp_path = staging / f"{number}_{copy_number}.txt"
+                path.replace(temp_path)
+                copies.append((temp_path, path.parents[1]))
+            staged.append((entry, copies, position))
+
+        affected = {section_idx for section_idx, _ in diff.added + diff.changed}
+        for entry, copies, (section_idx, lecture_idx) in staged:
+            old_name = Path(entry.path).name
+            title_part = old_name.split("_", 1)[1] if "_" in old_name else old_name
+            relative = Path(section_dir_name(section_idx, course.sections[section_idx].title)) / f"{lecture_idx + 1:02d}_{title_part}"
+            for temp_path, root in copies:
+                (root / relative.parent).mkdir(parents=True, exist_ok=True)
+                temp_path.replace(root / relative)
+            entry.section_idx, entry.lecture_idx, entry.path = section_idx, lecture_idx, relative.as_posix()
+            affected.add(section_idx)
+        if staging.exists():
+            staging.rmdir()
+
+        current_dirs = {section_dir_name(idx, section.title): idx for idx, section in enumerate(course.sections)}
+        for dir_name in touched_dirs:
+            if dir_name in current_dirs:
+                affected.add(current_dirs[dir_name])
+            else:
+                for root in self.roots():
+                    self._remove_section_outputs(root, dir_name)
+        return affected
+
+    def roots(self) -> List[Path]:
+        """강의 폴더와 언어별 사본 폴더 (languages/<언어>/)"""
+        languages_dir = self.course_dir / _LANGUAGES_DIR
+        languages = sorted(path for path in languages_dir.iterdir() if path.is_dir()) if languages_dir.is_dir() else []
+        return [self.course_dir] + languages
+
+    def copies(self, relative_path: str) -> List[Path]:
+        """강의 파일과 언어별 사본 중 디스크에 있는 것"""
+        return [root / relative_path for root in self.roots() if (root / relative_path).exists()]
+
+    def remove_copies(self, relative_path: str):
+        """새 자막으로 대체된 이전 파일과 그 언어별 사본 삭제"""
+        for path in self.copies(relative_path):
+            path.unlink()
+
+    def _remove_section_outputs(self, root: Path, dir_name: str):
+        """커리큘럼에서 사라진 섹션 폴더(비었으면)와 그 통합 파일 삭제"""
+        section_dir = root / dir_name
+        if section_dir.is_dir() and not any(section_dir.iterdir()):
+            section_dir.rmdir()
+        merged_file = root / f"{dir_name}_total.md"
+        if merged_file.exists() and not section_dir.exists():
+            merged_file.unlink()
+            self.log_callback(f"🗑️ 사라진 섹션 통합 파일 삭제: {merged_file.relative_to(self.course_dir)}")
+
+
+def section_dir_name(section_idx: int, section_title: str) -> str:
+    """TranscriptScraper가 쓰는 섹션 폴더 이름"""
+    return f"Section_{section_idx + 1:02d}_{sanitize_filename(section_title)}"
+
+
+def _content_changed(previous: ManifestEntry, lecture: Lecture) -> bool:
+    """제목이나 재생 시간이 바뀌었으면 재녹화로 보고 다시 추출"""
+    if previous.title != lecture.title:
+        return True
+    return bool(previous.duration and lecture.duration and previous.duration != lecture.duration)
@@ -0,0 +1,54 @@
+"""
+강의 URL / slug / 숫자 ID 입력 해석
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+_COURSE_PATH = re.compile(r"/course/([A-Za-z0-9][A-Za-z0-9_-]*)")
+_SLUG = re.compile(r"^[a-z0-9]+(?:[-_][a-z0-9]+)+$")
+_COURSE_ID = re.compile(r"^\d{3,}$")
+
+
+@dataclass(slots=True)
+class CourseReference:
+    """강의명 대신 입력된 직접 참조"""
+    slug: str = ""
+    course_id: Optional[int] = None
+
+    @property
+    def learn_path(self) -> str:
+        """강의 수강 페이지 경로 (slug가 없으면 빈 문자열)"""
+        return f"/course/{self.slug}/learn/" if self.slug else ""
+
+    def __str__(self) -> str:
+        return self.slug or str(self.course_id)
+
+
+def parse_course_reference(text: str) -> Optional[CourseReference]:
+    """입력이 강의 URL, slug, 숫자 ID이면 CourseReference, 강의명이면 None
+
+    slug는 공백 없이 소문자/숫자를 하이픈으로 이은 형태만 인정합니다
+    (예: "100-days-of-code"). 한 단어짜리 입력은 강의명으로 취급합니다.
+    """
+    text = (text or "").strip()
+    if not text:
+        return None
+
+    if _COURSE_ID.match(text):
+        return CourseReference(course_id=int(text))
+
+    if "/" in text:
+        match = _COURSE_PATH.search(text)
+        if match:
+            return CourseReference(slug=match.group(1))
+        query_id = re.search(r"[?&]course_id=(\d+)", text)
+        if query_id:
+            return CourseReference(course_id=int(query_id.group(1)))
+        return None
+
+    if _SLUG.match(text):
+        return CourseReference(slug=text)
+
+    return None
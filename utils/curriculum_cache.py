@@ -0,0 +1,81 @@
+"""
+커리큘럼 분석 결과 캐시 (강의 ID + 최종 업데이트일 기준)
+"""
+
+import json
+from pathlib import Path
+from typing import Optional
+from config import Config
+from core.models import Course, Section
+
+
+class CurriculumCache:
+    """분석된 커리큘럼 트리를 강의 ID별 JSON으로 저장/복원"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, log_callback=None):
+        self.cache_dir = Path(cache_dir) if cache_dir else Config.get_curriculum_cache_dir()
+        self.log_callback = log_callback or print
+
+    def _cache_path(self, course_id: int) -> Path:
+        """캐시 파일 경로"""
+        return self.cache_dir / f"{course_id}.json"
+
+    def load(self, course: Course) -> bool:
+        """유효한 캐시가 있으면 course.sections를 채움"""
+        if not Config.CURRICULUM_CACHE_ENABLED or course.course_id is None:
+            return False
+
+        path = self._cache_path(course.course_id)
+        if not path.exists():
+            return False
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            self.log_callback(f"⚠️ 커리큘럼 캐시 읽기 실패: {str(e)}")
+            return False
+
+        # 최종 업데이트일을 모르면 캐시가 최신인지 확인할 수 없으므로 사용하지 않음
+        cached_date = data.get('last_update_date', "")
+        if not cached_date or not course.last_update_date:
+            self.log_callback("ℹ️ 강의 최종 업데이트일을 몰라 커리큘럼 캐시를 사용하지 않음")
+            return False
+
+        # 강의가 업데이트되었으면 캐시 무효
+        if cached_date != course.last_update_date:
+            self.log_callback(f"🔄 강의 업데이트 감지 ({cached_date} → {course.last_update_date}) - 캐시 무시")
+            return False
+
+        sections = [Section.from_dict(item) for item in data.get('sections', [])]
+        if not sections:
+            return False
+
+        course.sections = sections
+        if not course.total_duration:
+            course.total_duration = data.get('total_duration', "")
+        self.log_callback(f"💾 커리큘럼 캐시 사용: {len(course.sections)}개 섹션, {course.total_lectures}개 강의")
+        return True
+
+    def save(self, course: Course) -> bool:
+        """커리큘럼 트리 저장"""
+        if not Config.CURRICULUM_CACHE_ENABLED or course.course_id is None or not course.sections:
+            return False
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._cache_path(course.course_id)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(course.to_dict(), f, ensure_ascii=False, indent=2)
+            tmp_path.replace(path)
+            return True
+        except OSError as e:
+            self.log_callback(f"⚠️ 커리큘럼 캐시 저장 실패: {str(e)}")
+            return False
+
+    def invalidate(self, course_id: int):
+        """캐시 삭제"""
+        path = self._cache_path(course_id)
+        if path.exists():
+            path.unlink()
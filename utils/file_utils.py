@@ -6,8 +6,8 @@ import os
 import re
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional
-from core.models import Course, Section, Lecture, Subtitle
+from typing import List, Optional, Iterable
+from core.models import Course, Section, Lecture, Subtitle, SubtitleTrack
 
 class MarkdownGenerator:
     def __init__(self, log_callback=None):
@@ -91,7 +91,7 @@ class MarkdownGenerator:
             self.log_callback(f"     ❌ 강의 Markdown 생성 실패: {str(e)}")
             return [f"## 강의 {lecture_number} - {lecture.title}", "", "*자막 생성 중 오류가 발생했습니다.*"]
     
-    def _generate_subtitles_markdown(self, subtitles: List[Subtitle]) -> List[str]:
+    def _generate_subtitles_markdown(self, subtitles: Iterable[Subtitle]) -> List[str]:
         """자막 Markdown 내용 생성"""
         try:
             lines = []
@@ -101,7 +101,10 @@ class MarkdownGenerator:
                 return lines
             
             # 자막 정렬 (시간순)
-            sorted_subtitles = sorted(subtitles, key=lambda s: s.start_seconds)
+            if isinstance(subtitles, SubtitleTrack):
+                sorted_subtitles = subtitles.iter_sorted()
+            else:
+                sorted_subtitles = sorted(subtitles, key=lambda s: s.start_seconds)
             
             for subtitle in sorted_subtitles:
                 # 타임스탬프와 텍스트
@@ -0,0 +1,148 @@
+"""
+문자 trigram 기반 강의명 퍼지 매칭 (한글은 자모 단위로 분해)
+"""
+
+import heapq
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def _decompose_char(ch: str) -> str:
+    """한글 음절 한 글자를 자모로 분해 (그 외 문자는 그대로)"""
+    code = ord(ch)
+    if _HANGUL_BASE <= code <= _HANGUL_LAST:
+        offset = code - _HANGUL_BASE
+        jong = offset % 28
+        jung = (offset // 28) % 21
+        cho = offset // 588
+        return _CHOSEONG[cho] + _JUNGSEONG[jung] + (_JONGSEONG[jong] if jong else "")
+    return ch
+
+
+# 자주 쓰는 음절은 분해 결과를 재사용
+_DECOMPOSED: Dict[str, str] = {}
+
+
+def normalize(text: str) -> str:
+    """비교용 정규화: NFKC, 소문자, 괄호/기호 제거, 공백 정리"""
+    text = unicodedata.normalize('NFKC', text).lower()
+    return " ".join(_NON_WORD.sub(" ", text).split())
+
+
+def to_jamo(text: str) -> str:
+    """정규화된 문자열을 자모 문자열로 변환"""
+    parts = []
+    for ch in text:
+        jamo = _DECOMPOSED.get(ch)
+        if jamo is None:
+            jamo = _decompose_char(ch)
+            _DECOMPOSED[ch] = jamo
+        parts.append(jamo)
+    return "".join(parts)
+
+
+def trigrams(text: str) -> frozenset:
+    """자모 trigram 집합 (단어 경계는 공백 패딩으로 표현)"""
+    jamo = f"  {to_jamo(normalize(text))} "
+    return frozenset(jamo[i:i + 3] for i in range(len(jamo) - 2))
+
+
+def similarity(a: str, b: str) -> float:
+    """두 문자열의 trigram Dice 계수 (0.0 ~ 1.0)"""
+    grams_a = trigrams(a)
+    grams_b = trigrams(b)
+    if not grams_a or not grams_b:
+        return 0.0
+    return 2.0 * len(grams_a & grams_b) / (len(grams_a) + len(grams_b))
+
+
+@dataclass(slots=True)
+class MatchResult(Generic[K]):
+    """퍼지 매칭 결과 한 건"""
+    key: K
+    title: str
+    score: float
+
+
+class FuzzyMatcher(Generic[K]):
+    """trigram 역색인으로 후보를 좁힌 뒤 Dice 점수로 순위를 매기는 매처"""
+
+    MAX_CANDIDATES = 256  # 희귀 trigram부터 모은 후보 수 상한
+
+    def __init__(self, items: Iterable[Tuple[K, str]] = ()):
+        self._keys: List[K] = []
+        self._titles: List[str] = []
+        self._normalized: List[str] = []
+        self._grams: List[frozenset] = []
+        self._index: Dict[str, List[int]] = {}
+        for key, title in items:
+            self.add(key, title)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: K, title: str):
+        """항목 색인"""
+        doc_id = len(self._keys)
+        grams = trigrams(title)
+        self._keys.append(key)
+        self._titles.append(title)
+        self._normalized.append(normalize(title))
+        self._grams.append(grams)
+        for gram in grams:
+            self._index.setdefault(gram, []).append(doc_id)
+
+    def search(self, query: str, k: int = 5) -> List[MatchResult[K]]:
+        """상위 k개 후보 (점수 내림차순)"""
+        query_grams = trigrams(query)
+        if not query_grams or not self._keys:
+            return []
+
+        # 희귀한 trigram의 역색인부터 훑어 후보를 모음 (흔한 trigram은 점수 계산에만 사용)
+        postings = sorted((self._index[gram] for gram in query_grams if gram in self._index), key=len)
+        candidates = set()
+        for posting in postings:
+            if len(candidates) >= self.MAX_CANDIDATES:
+                break
+            candidates.update(posting)
+
+        query_size = len(query_grams)
+        normalized_query = normalize(query)
+        scored = []
+        for doc_id in candidates:
+            doc_grams = self._grams[doc_id]
+            score = 2.0 * len(query_grams & doc_grams) / (query_size + len(doc_grams))
+            # 검색어가 제목에 그대로 포함되면 긴 제목이라도 상위로
+            if normalized_query and normalized_query in self._normalized[doc_id]:
+                score = max(score, 0.8 + 0.2 * score)
+            scored.append((score, -doc_id))
+
+        return [
+            MatchResult(self._keys[-neg_id], self._titles[-neg_id], score)
+            for score, neg_id in heapq.nlargest(k, scored)
+        ]
+
+    def resolve(self, query: str, threshold: float = 0.3, margin: float = 0.05,
+                k: int = 5) -> Tuple[Optional[MatchResult[K]], List[MatchResult[K]]]:
+        """확실한 최적 후보와 순위 목록 반환
+
+        최고 점수가 threshold 미만이거나 2위와의 차이가 margin 이내이면
+        모호한 것으로 보고 첫 번째 값은 None입니다.
+        """
+        candidates = self.search(query, k)
+        if not candidates or candidates[0].score < threshold:
+            return None, candidates
+        if len(candidates) > 1 and candidates[0].score < 1.0 and candidates[0].score - candidates[1].score <= margin:
+            return None, candidates
+        return candidates[0], candidates
@@ -0,0 +1,188 @@
+"""
+SQLite 작업 큐 (여러 워커가 브로커 없이 강의/섹션 작업을 나눠 가짐)
+
+작업은 임대(lease) 방식으로 가져가고, 처리 중에는 heartbeat로 임대를 연장합니다.
+워커가 죽어 임대가 만료되면 다른 워커가 다시 가져갑니다.
+
+    queue = JobQueue()
+    queue.enqueue("강의명")                       # 강의 전체
+    job = queue.claim("host:1234")
+    queue.heartbeat(job.job_id, "host:1234")      # 처리 중 주기적으로
+    queue.complete(job.job_id, "host:1234")       # 또는 queue.fail(..., error)
+"""
+
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config import Config
+
+# 작업 종류
+COURSE = 'course'  # 강의 전체
+SPLIT = 'split'  # 커리큘럼 분석 후 섹션 작업으로 나눔
+SECTION = 'section'  # 강의의 섹션 하나
+
+# 작업 상태
+PENDING = 'pending'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    course TEXT NOT NULL,
+    section_idx INTEGER NOT NULL DEFAULT -1,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    available_at REAL NOT NULL DEFAULT 0,
+    last_error TEXT,
+    priority REAL NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    UNIQUE (kind, course, section_idx)
+)
+"""
+
+
+@dataclass(slots=True)
+class Job:
+    """가져간 작업"""
+    job_id: int
+    kind: str
+    course: str
+    section_idx: int
+    attempts: int
+    max_attempts: int
+
+    @property
+    def label(self) -> str:
+        return f"{self.course} 섹션 {self.section_idx + 1}" if self.kind == SECTION else self.course
+
+
+class JobQueue:
+    """SQLite 파일 하나로 된 작업 큐 (공유 디스크에 두면 여러 머신에서 사용)"""
+
+    def __init__(self, path: Optional[Path] = None, lease_seconds: Optional[float] = None,
+                 max_attempts: Optional[int] = None):
+        self.path = Path(path) if path else Config.get_job_queue_path()
+        self.lease_seconds = lease_seconds or Config.JOB_LEASE_SECONDS
+        self.max_attempts = max_attempts or Config.JOB_MAX_ATTEMPTS
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._transaction() as db:
+            db.execute(_SCHEMA)
+            # 이전 버전 큐 파일에는 priority 열이 없음
+            columns = {row['name'] for row in db.execute("PRAGMA table_info(jobs)")}
+            if 'priority' not in columns:
+                db.execute("ALTER TABLE jobs ADD COLUMN priority REAL NOT NULL DEFAULT 0")
+
+    @contextmanager
+    def _transaction(self):
+        """연결 하나 + 즉시 쓰기 잠금 트랜잭션 (스레드/프로세스마다 새 연결)"""
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        db.row_factory = sqlite3.Row
+        try:
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                yield db
+                db.execute("COMMIT")
+            except Exception:
+                db.execute("ROLLBACK")
+                raise
+        finally:
+            db.close()
+
+    def enqueue(self, course: str, kind: str = COURSE, section_idx: int = -1, priority: float = 0) -> bool:
+        """작업 추가 (같은 작업이 이미 있으면 무시, priority가 큰 작업부터 임대) → 새로 추가됐는지"""
+        with self._transaction() as db:
+            cursor = db.execute(
+                "INSERT OR IGNORE INTO jobs (kind, course, section_idx, max_attempts, priority, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, course, section_idx, self.max_attempts, priority, time.time())
+            )
+            return cursor.rowcount > 0
+
+    def enqueue_sections(self, course: str, section_seconds: List[float]) -> int:
+        """강의의 섹션마다 작업 추가 (재생 시간이 긴 섹션부터 임대) → 추가된 수"""
+        return sum(self.enqueue(course, SECTION, section_idx, seconds)
+                   for section_idx, seconds in enumerate(section_seconds))
+
+    def claim(self, owner: str) -> Optional[Job]:
+        """대기 중이거나 임대가 만료된 작업 하나를 임대"""
+        now = time.time()
+        with self._transaction() as db:
+            # 재시도 횟수를 다 쓴 채 만료된 작업은 실패 처리
+            db.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE status = ? AND lease_expires < ? AND attempts >= max_attempts",
+                (FAILED, now, LEASED, now)
+            )
+            row = db.execute(
+                "SELECT * FROM jobs WHERE ((status = ? AND available_at <= ?) OR (status = ? AND lease_expires < ?))"
+                " AND attempts < max_attempts ORDER BY priority DESC, job_id LIMIT 1",
+                (PENDING, now, LEASED, now)
+            ).fetchone()
+            if row is None:
+                return None
+
+            db.execute(
+                "UPDATE jobs SET status = ?, lease_owner = ?, lease_expires = ?, attempts = attempts + 1, updated_at = ?"
+                " WHERE job_id = ?",
+                (LEASED, owner, now + self.lease_seconds, now, row['job_id'])
+            )
+            return Job(row['job_id'], row['kind'], row['course'], row['section_idx'],
+                       row['attempts'] + 1, row['max_attempts'])
+
+    def heartbeat(self, job_id: int, owner: str) -> bool:
+        """임대 연장 (임대를 잃었으면 False)"""
+        return self._update_leased(job_id, owner, "lease_expires = ?", time.time() + self.lease_seconds)
+
+    def complete(self, job_id: int, owner: str) -> bool:
+        return self._update_leased(job_id, owner, "status = ?, lease_owner = NULL, last_error = NULL", DONE)
+
+    def fail(self, job_id: int, owner: str, error: str = "") -> bool:
+        """실패 기록 (재시도 횟수가 남았으면 지수 백오프 후 다시 대기)"""
+        now = time.time()
+        with self._transaction() as db:
+            row = db.execute("SELECT attempts, max_attempts FROM jobs WHERE job_id = ? AND lease_owner = ? AND status = ?",
+                             (job_id, owner, LEASED)).fetchone()
+            if row is None:
+                return False
+            retry = row['attempts'] < row['max_attempts']
+            db.execute(
+                "UPDATE jobs SET status = ?, lease_owner = NULL, available_at = ?, last_error = ?, updated_at = ?"
+                " WHERE job_id = ?",
+                (PENDING if retry else FAILED, now + Config.RETRY_DELAY * (2 ** row['attempts']), error, now, job_id)
+            )
+            return True
+
+    def _update_leased(self, job_id: int, owner: str, assignments: str, value) -> bool:
+        with self._transaction() as db:
+            cursor = db.execute(
+                f"UPDATE jobs SET {assignments}, updated_at = ? WHERE job_id = ? AND lease_owner = ? AND status = ?",
+                (value, time.time(), job_id, owner, LEASED)
+            )
+            return cursor.rowcount > 0
+
+    def requeue_failed(self) -> int:
+        """실패한 작업을 시도 횟수를 초기화해 다시 대기 → 개수"""
+        with self._transaction() as db:
+            cursor = db.execute("UPDATE jobs SET status = ?, attempts = 0, available_at = 0, updated_at = ? WHERE status = ?",
+                                (PENDING, time.time(), FAILED))
+            return cursor.rowcount
+
+    def stats(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        with self._transaction() as db:
+            rows = db.execute("SELECT status, COUNT(*) AS count FROM jobs GROUP BY status").fetchall()
+        return {row['status']: row['count'] for row in rows}
+
+    def failed_jobs(self) -> List[dict]:
+        with self._transaction() as db:
+            rows = db.execute("SELECT * FROM jobs WHERE status = ? ORDER BY job_id", (FAILED,)).fetchall()
+        return [dict(row) for row in rows]
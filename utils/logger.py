@@ -0,0 +1,178 @@
+"""
+레벨 기반 구조화 로거
+
+기존 log_callback(message) 호출과 호환되도록 로거 자체가 호출 가능하며
+(INFO 레벨로 기록), 비활성 레벨의 메시지는 포매팅하지 않습니다.
+
+    log = as_logger(log_callback)
+    log("✅ 완료")                                  # INFO
+    log.debug("선택자 %s: %d개", selector, count)   # DEBUG가 꺼져 있으면 포매팅 생략
+    log.bind(section=1, lecture=3).info("추출 완료", stage="transcript")
+    if log.debug_enabled:
+        self._debug_section_structure(...)           # 비싼 DOM 탐색은 조건부로
+"""
+
+import atexit
+import json
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Callable, Dict, Optional
+
+from config import Config
+from utils.profiler import profile_stage
+from utils.run_metrics import get_metrics
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+
+_LEVEL_NAMES = {'DEBUG': DEBUG, 'INFO': INFO, 'WARNING': WARNING, 'ERROR': ERROR}
+
+
+def level_from_name(name: str) -> int:
+    """'DEBUG'/'INFO' 등 레벨 이름을 숫자로 변환"""
+    return _LEVEL_NAMES.get(str(name).upper(), INFO)
+
+
+class _JsonLineFormatter(logging.Formatter):
+    """파일 싱크용 JSON Lines 포매터"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(record.created)),
+            'level': record.levelname,
+            'msg': record.getMessage()
+        }
+        entry.update(getattr(record, 'fields', None) or {})
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+_file_sink_lock = threading.Lock()
+_file_sink: Optional[logging.Logger] = None
+_file_listener: Optional[QueueListener] = None
+
+
+def _stop_file_sink():
+    """남은 레코드를 기록하고 싱크 스레드 종료"""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        _file_listener = None
+
+
+def _get_file_sink() -> Optional[logging.Logger]:
+    """회전 파일 싱크 (별도 스레드에서 기록, 프로세스당 하나)"""
+    global _file_sink, _file_listener
+    if not Config.LOG_FILE_ENABLED:
+        return None
+
+    with _file_sink_lock:
+        if _file_sink is None:
+            Config.LOG_DIR.mkdir(parents=True, exist_ok=True)
+            handler = RotatingFileHandler(
+                Config.LOG_DIR / 'scraper.jsonl',
+                maxBytes=Config.LOG_FILE_MAX_BYTES,
+                backupCount=Config.LOG_FILE_BACKUP_COUNT,
+                encoding='utf-8'
+            )
+            handler.setFormatter(_JsonLineFormatter())
+
+            log_queue = queue.SimpleQueue()
+            _file_listener = QueueListener(log_queue, handler)
+            _file_listener.start()
+            atexit.register(_stop_file_sink)
+
+            sink = logging.getLogger('udemy_scraper')
+            sink.setLevel(DEBUG)
+            sink.propagate = False
+            sink.addHandler(QueueHandler(log_queue))
+            _file_sink = sink
+    return _file_sink
+
+
+class StructuredLogger:
+    """레벨/필드를 가진 로거 (log_callback 대체)"""
+
+    __slots__ = ('_callback', 'level', 'fields', '_sink')
+
+    def __init__(self, callback: Optional[Callable[[str], Any]] = None, level: Optional[int] = None,
+                 fields: Optional[Dict[str, Any]] = None):
+        self._callback = callback or print
+        self.level = level_from_name(Config.LOG_LEVEL) if level is None else level
+        self.fields = fields or {}
+        self._sink = _get_file_sink()
+
+    def __call__(self, message: str, *args, **fields):
+        """log_callback(message) 호환 (INFO)"""
+        self.log(INFO, message, *args, **fields)
+
+    @property
+    def debug_enabled(self) -> bool:
+        """DEBUG 레벨 활성 여부 (비싼 디버그 작업 전에 확인)"""
+        return self.level <= DEBUG
+
+    def is_enabled_for(self, level: int) -> bool:
+        """해당 레벨 기록 여부"""
+        return level >= self.level
+
+    def bind(self, **fields) -> 'StructuredLogger':
+        """필드가 고정된 하위 로거"""
+        child = StructuredLogger.__new__(StructuredLogger)
+        child._callback = self._callback
+        child.level = self.level
+        child.fields = {**self.fields, **fields}
+        child._sink = self._sink
+        return child
+
+    def log(self, level: int, message: str, *args, **fields):
+        """레벨이 활성일 때만 포매팅 후 기록"""
+        if level < self.level:
+            return
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                message = f"{message} {args}"
+
+        self._callback(message)
+
+        if self._sink is not None:
+            record_fields = {**self.fields, **fields} if fields else self.fields
+            self._sink.log(level, message, extra={'fields': record_fields})
+
+    def debug(self, message: str, *args, **fields):
+        self.log(DEBUG, message, *args, **fields)
+
+    def info(self, message: str, *args, **fields):
+        self.log(INFO, message, *args, **fields)
+
+    def warning(self, message: str, *args, **fields):
+        self.log(WARNING, message, *args, **fields)
+
+    def error(self, message: str, *args, **fields):
+        self.log(ERROR, message, *args, **fields)
+
+    @contextmanager
+    def timed(self, stage: str, level: int = DEBUG, **fields):
+        """구간 소요 시간을 duration 필드로 기록 (처리량 지표에도 반영, 프로파일링 중이면 샘플에 단계 태그)"""
+        start = time.perf_counter()
+        try:
+            with profile_stage(stage):
+                yield self
+        finally:
+            duration = time.perf_counter() - start
+            get_metrics().record_stage(stage, duration)
+            if self.is_enabled_for(level):
+                self.log(level, "⏱️ %s: %.2f초", stage, duration, stage=stage, duration=round(duration, 3), **fields)
+
+
+def as_logger(log_callback=None) -> StructuredLogger:
+    """log_callback을 StructuredLogger로 감쌈 (이미 로거면 그대로 반환)"""
+    if isinstance(log_callback, StructuredLogger):
+        return log_callback
+    return StructuredLogger(log_callback)
@@ -0,0 +1,242 @@
+"""
+실행 전체 샘플링 프로파일러 (코드 수정 없이 PROFILE_ENABLED=true로 켬)
+
+백그라운드 스레드가 PROFILE_INTERVAL_MS마다 모든 스레드의 스택을 찍어 현재 단계로
+태그하고, 실행이 끝나면 logs/profiles/에 다음 파일을 남깁니다.
+
+- <이름>.folded: flamegraph.pl / speedscope에 바로 넣을 수 있는 접힌 스택
+- <이름>_summary.txt: 단계별 Python/WebDriver I/O/sleep 비율, 자체 시간 상위 함수,
+  time.sleep 호출 위치별 누적 시간
+
+    with profile_run("workflow"):
+        with profile_stage("curriculum"):
+            ...
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config import Config
+
+# WebDriver 통신으로 보는 모듈 경로 조각
+_IO_MARKERS = ('selenium', 'urllib3', os.sep + 'http' + os.sep, 'socket.py', 'ssl.py', 'websockets')
+_PROJECT_ROOT = str(Config.BASE_DIR)
+IDLE_STAGE = 'idle'  # 단계 스택이 빈 스레드
+
+_active: Optional['SamplingProfiler'] = None
+
+
+class SamplingProfiler:
+    """sys._current_frames() 기반 벽시계 샘플링 프로파일러"""
+
+    def __init__(self, label: str = "run", interval_ms: Optional[float] = None, output_dir: Optional[Path] = None):
+        self.label = label
+        self.interval = (interval_ms or Config.PROFILE_INTERVAL_MS) / 1000.0
+        self.output_dir = Path(output_dir) if output_dir else Config.LOG_DIR / 'profiles'
+        self.stacks: Counter = Counter()  # 접힌 스택 → 샘플 수
+        self.categories: Dict[str, Counter] = defaultdict(Counter)  # 단계 → {python/webdriver/sleep: 샘플 수}
+        self.self_time: Counter = Counter()  # 최하위 프레임 → 샘플 수
+        self.sleeps: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])  # 호출 위치 → [횟수, 누적 초]
+        self._stages: Dict[int, List[str]] = {}  # 스레드 ID → 단계 스택
+        self._sleeping: Dict[int, bool] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._original_sleep = None
+        self._started_wall = self._started_cpu = 0.0
+        self.wall_seconds = self.cpu_seconds = 0.0
+        self.samples = 0
+
+    # 단계 태그
+
+    def push_stage(self, name: str):
+        self._stages.setdefault(threading.get_ident(), []).append(name)
+
+    def pop_stage(self):
+        stack = self._stages.get(threading.get_ident())
+        if stack:
+            stack.pop()
+
+    def _stage_of(self, thread_id: int) -> str:
+        stack = self._stages.get(thread_id)
+        return stack[-1] if stack else IDLE_STAGE
+
+    # 시작/종료
+
+    def start(self):
+        self._started_wall, self._started_cpu = time.perf_counter(), time.process_time()
+        self._install_sleep_hook()
+        self._thread = threading.Thread(target=self._sample_loop, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Optional[Path]:
+        """샘플링 중단 후 파일 기록 → 요약 파일 경로"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self._remove_sleep_hook()
+        self.wall_seconds = time.perf_counter() - self._started_wall
+        self.cpu_seconds = time.process_time() - self._started_cpu
+        return self.write()
+
+    # 샘플링
+
+    def _sample_loop(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    self._record(thread_id, frame)
+            self.samples += 1
+
+    def _record(self, thread_id: int, frame):
+        # 단계 태그를 한 번도 달지 않은 스레드(GUI 이벤트 루프, 타이머 등)는 제외
+        if thread_id not in self._stages:
+            return
+
+        names = []
+        io = False
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename != __file__:  # sleep 훅 자신은 스택에서 뺌
+                io = io or any(marker in code.co_filename for marker in _IO_MARKERS)
+                names.append(f"{Path(code.co_filename).stem}:{code.co_name}")
+            frame = frame.f_back
+
+        stage = self._stage_of(thread_id)
+        if self._sleeping.get(thread_id):
+            category = 'sleep'
+            names.insert(0, "time:sleep")
+        else:
+            category = 'webdriver' if io else 'python'
+
+        names.append(f"[{stage}]")
+        self.stacks[";".join(reversed(names))] += 1
+        self.categories[stage][category] += 1
+        self.self_time[names[0]] += 1
+
+    # time.sleep 집계
+
+    def _install_sleep_hook(self):
+        self._original_sleep = original = time.sleep
+        profiler = self
+
+        def profiled_sleep(seconds):
+            caller = profiler._project_caller(sys._getframe(1))
+            thread_id = threading.get_ident()
+            profiler._sleeping[thread_id] = True
+            started = time.perf_counter()
+            try:
+                original(seconds)
+            finally:
+                profiler._sleeping[thread_id] = False
+                entry = profiler.sleeps[caller]
+                entry[0] += 1
+                entry[1] += time.perf_counter() - started
+
+        time.sleep = profiled_sleep
+
+    def _remove_sleep_hook(self):
+        if self._original_sleep is not None:
+            time.sleep = self._original_sleep
+            self._original_sleep = None
+
+    @staticmethod
+    def _project_caller(frame) -> str:
+        """sleep을 부른 가장 가까운 프로젝트 코드 위치 (selenium 내부 대기면 그 호출자)"""
+        direct = frame
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            if filename.startswith(_PROJECT_ROOT) and 'site-packages' not in filename:
+                location = f"{os.path.relpath(filename, _PROJECT_ROOT)}:{frame.f_lineno} ({frame.f_code.co_name})"
+                return location if frame is direct else f"{location} via {Path(direct.f_code.co_filename).stem}"
+            frame = frame.f_back
+        return f"{Path(direct.f_code.co_filename).name}:{direct.f_lineno} ({direct.f_code.co_name})"
+
+    # 결과
+
+    def write(self) -> Path:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        base = self.output_dir / f"{self.label}_{time.strftime('%Y%m%d_%H%M%S')}"
+        with open(f"{base}.folded", 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+        summary = Path(f"{base}_summary.txt")
+        with open(summary, 'w', encoding='utf-8') as f:
+            f.write(self.summary())
+        return summary
+
+    def summary(self, top: Optional[int] = None) -> str:
+        top = top or Config.PROFILE_TOP_N
+        ms = self.interval * 1000
+        lines = [
+            f"실행: {self.label}",
+            f"벽시계 {self.wall_seconds:.1f}초, 프로세스 CPU {self.cpu_seconds:.1f}초, 샘플 {self.samples}회 ({ms:.0f}ms 간격)",
+            "",
+            "단계별 시간 분포 (샘플 기준 추정 초)",
+        ]
+        for stage, counts in sorted(self.categories.items(), key=lambda item: -sum(item[1].values())):
+            total = sum(counts.values())
+            parts = ", ".join(f"{name} {counts[name] * self.interval:.1f}초 ({counts[name] / total:.0%})"
+                              for name in ('python', 'webdriver', 'sleep') if counts[name])
+            lines.append(f"  [{stage}] {total * self.interval:.1f}초: {parts}")
+
+        lines += ["", f"자체 시간 상위 {top}개 함수"]
+        for name, count in self.self_time.most_common(top):
+            lines.append(f"  {count * self.interval:8.2f}초  {name}")
+
+        lines += ["", f"time.sleep 누적 상위 {top}개 호출 위치"]
+        ranked = sorted(self.sleeps.items(), key=lambda item: -item[1][1])[:top]
+        for location, (calls, seconds) in ranked:
+            lines.append(f"  {seconds:8.2f}초  {int(calls):5d}회  {location}")
+        total_sleep = sum(seconds for _, seconds in self.sleeps.values())
+        lines.append(f"  합계 {total_sleep:.2f}초")
+        return "\n".join(lines) + "\n"
+
+
+def active_profiler() -> Optional[SamplingProfiler]:
+    return _active
+
+
+@contextmanager
+def profile_stage(name: str):
+    """현재 스레드의 단계 태그 (프로파일러가 꺼져 있으면 아무것도 안 함)"""
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+    profiler.push_stage(name)
+    try:
+        yield
+    finally:
+        profiler.pop_stage()
+
+
+@contextmanager
+def _profiling(label: str, log_callback=None):
+    global _active
+    profiler = SamplingProfiler(label)
+    _active = profiler
+    profiler.start()
+    try:
+        with profile_stage(label):
+            yield profiler
+    finally:
+        _active = None
+        summary = profiler.stop()
+        if log_callback:
+            log_callback(f"🔬 프로파일 저장: {summary} (flamegraph: {summary.name.replace('_summary.txt', '.folded')})")
+
+
+def profile_run(label: str, log_callback=None, enabled: Optional[bool] = None):
+    """PROFILE_ENABLED(또는 enabled)이면 실행 전체를 프로파일링 (이미 실행 중이면 그대로)"""
+    enabled = Config.PROFILE_ENABLED if enabled is None else enabled
+    if not enabled or _active is not None:
+        return nullcontext()
+    return _profiling(label, log_callback)
@@ -0,0 +1,151 @@
+"""
+토큰 버킷 요청 스케줄러 (페이지 이동 / API 호출 속도 제한)
+
+모든 탭과 워커 스레드가 프로세스당 하나의 스케줄러를 공유합니다.
+
+    scheduler = get_scheduler()
+    scheduler.acquire(NAVIGATION)       # 토큰이 생길 때까지 대기
+    driver.get(url)
+    scheduler.report_throttled(NAVIGATION)  # 429/차단 페이지 → 속도 자동 감소
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+from config import Config
+
+NAVIGATION = 'navigation'
+API = 'api'
+
+
+class TokenBucket:
+    """분당 rate개 토큰이 채워지고 최대 burst개까지 쌓이는 버킷 (스레드 안전)"""
+
+    def __init__(self, rate_per_minute: float, burst: int):
+        self.rate_per_minute = rate_per_minute
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def unlimited(self) -> bool:
+        """rate가 0 이하면 제한 없음"""
+        return self.rate_per_minute <= 0
+
+    def _refill(self, now: float):
+        # 멈춘 동안은 토큰이 쌓이지 않음 (멈춤이 끝난 시점부터 계산)
+        self._updated = max(self._updated, min(now, self._paused_until))
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate_per_minute / 60.0)
+
+    def _reserve(self) -> float:
+        """토큰 하나를 가져가거나, 가져갈 수 있을 때까지 남은 시간 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self.unlimited:
+                return 0.0
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) * 60.0 / self.rate_per_minute
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """토큰 하나 획득 (timeout 초 안에 못 얻으면 False)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._reserve()
+            if wait <= 0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+    def set_rate(self, rate_per_minute: float):
+        """속도 변경 (쌓인 토큰은 유지)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate_per_minute = rate_per_minute
+
+    def pause(self, seconds: float):
+        """seconds 동안 토큰 지급 중단 (쌓인 토큰도 비움)"""
+        with self._lock:
+            self._tokens = 0.0
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class RequestScheduler:
+    """종류별 토큰 버킷과 스로틀링 대응 (곱셈 감소 / 덧셈 회복)"""
+
+    RECOVERY_STEP = 0.1  # 성공할 때마다 설정 속도의 10%씩 회복
+    MIN_RATE_RATIO = 0.125  # 설정 속도의 1/8 밑으로는 줄이지 않음
+
+    def __init__(self, limits: Optional[Dict[str, tuple]] = None, share: float = 1.0):
+        """share: 여러 프로세스가 설정 속도를 나눠 쓸 때 이 프로세스의 몫 (예: 워커 4개면 0.25)"""
+        limits = limits or {
+            NAVIGATION: (Config.NAVIGATIONS_PER_MINUTE, Config.NAVIGATION_BURST),
+            API: (Config.API_FETCHES_PER_MINUTE, Config.API_FETCH_BURST)
+        }
+        limits = {kind: (rate * share if rate > 0 else rate, burst) for kind, (rate, burst) in limits.items()}
+        self.configured = {kind: rate for kind, (rate, _) in limits.items()}
+        self.buckets = {kind: TokenBucket(rate, burst) for kind, (rate, burst) in limits.items()}
+        self._lock = threading.Lock()
+
+    def acquire(self, kind: str, timeout: Optional[float] = None) -> bool:
+        """kind 요청 하나를 보낼 토큰 획득"""
+        bucket = self.buckets.get(kind)
+        return bucket.acquire(timeout) if bucket else True
+
+    def current_rate(self, kind: str) -> float:
+        """현재 분당 허용 속도"""
+        bucket = self.buckets.get(kind)
+        return bucket.rate_per_minute if bucket else 0.0
+
+    def report_throttled(self, kind: str, retry_after: Optional[float] = None) -> float:
+        """429/차단 응답 → 속도를 줄이고 잠시 멈춤. 새 속도 반환 (제한 없음이면 멈추기만 함)"""
+        bucket = self.buckets.get(kind)
+        if not bucket:
+            return 0.0
+        pause = retry_after if retry_after else Config.RATE_BACKOFF_COOLDOWN
+        if bucket.unlimited:
+            bucket.pause(pause)
+            return 0.0
+        with self._lock:
+            floor = self.configured[kind] * self.MIN_RATE_RATIO
+            rate = max(floor, bucket.rate_per_minute * Config.RATE_BACKOFF_FACTOR)
+            bucket.set_rate(rate)
+            bucket.pause(pause)
+            return rate
+
+    def report_success(self, kind: str):
+        """정상 응답 → 설정 속도까지 조금씩 회복"""
+        bucket = self.buckets.get(kind)
+        if not bucket or bucket.unlimited:
+            return
+        configured = self.configured[kind]
+        if bucket.rate_per_minute >= configured:
+            return
+        with self._lock:
+            bucket.set_rate(min(configured, bucket.rate_per_minute + configured * self.RECOVERY_STEP))
+
+
+_scheduler_lock = threading.Lock()
+_scheduler: Optional[RequestScheduler] = None
+
+
+def get_scheduler(share: Optional[float] = None) -> RequestScheduler:
+    """프로세스 공용 스케줄러 (share를 주면 설정 속도의 그 몫으로 새로 만듦)"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None or share is not None:
+            _scheduler = RequestScheduler(share=1.0 if share is None else share)
+        return _scheduler
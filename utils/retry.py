@@ -0,0 +1,132 @@
+"""
+단계별 재시도 정책과 실패 큐
+
+    ok = retry_call("click", click_handler.click_lecture_item, element, log=log)
+    loaded = retry_call("page_load", wait_for_load, before_retry=lambda: navigate(url), log=log)  # 다시 이동 후 대기
+    failures.add(job_info, stage="click", reason="클릭 실패")   # 실행 끝에 재처리
+"""
+
+import json
+import random
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from config import Config
+
+# 재시도 단계
+CLICK = 'click'
+PAGE_LOAD = 'page_load'
+PANEL_OPEN = 'panel_open'
+EXTRACTION = 'extraction'
+
+
+@dataclass(slots=True)
+class RetryPolicy:
+    """재시도 횟수와 지수 백오프 (지터 포함)"""
+    max_attempts: int
+    base_delay: float
+    max_delay: float = 30.0
+    jitter: float = 0.5  # 지연 시간의 ±50% 범위에서 무작위
+
+    def delay(self, attempt: int) -> float:
+        """attempt번째 실패 후 대기 시간 (1부터)"""
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+# 단계별 정책 (클릭/패널은 빠르게, 페이지 로딩은 길게)
+RETRY_POLICIES: Dict[str, RetryPolicy] = {
+    CLICK: RetryPolicy(Config.MAX_RETRIES, Config.RETRY_DELAY / 2, max_delay=5),
+    PAGE_LOAD: RetryPolicy(Config.MAX_RETRIES, Config.RETRY_DELAY, max_delay=20),
+    PANEL_OPEN: RetryPolicy(1, Config.RETRY_DELAY / 2, max_delay=5),  # open_transcript_panel이 버튼을 직접 폴링
+    EXTRACTION: RetryPolicy(max(1, Config.MAX_RETRIES - 1), Config.RETRY_DELAY, max_delay=10)
+}
+
+
+def retry_call(stage: str, func: Callable[..., Any], *args, log=None,
+               is_success: Callable[[Any], bool] = bool,
+               before_retry: Optional[Callable[[], Any]] = None, **kwargs) -> Any:
+    """stage 정책에 따라 func를 재시도하고 마지막 결과 반환 (예외는 실패로 간주)
+
+    before_retry: 두 번째 시도부터 func 전에 호출 (다시 이동/클릭처럼 상태를 되돌리는 동작)
+    """
+    policy = RETRY_POLICIES[stage]
+    result = None
+    for attempt in range(1, policy.max_attempts + 1):
+        try:
+            if attempt > 1 and before_retry is not None:
+                before_retry()
+            result = func(*args, **kwargs)
+            if is_success(result):
+                return result
+        except Exception as e:
+            result = None
+            if log is not None:
+                log.debug("%s 시도 %d 예외: %s", stage, attempt, e, stage=stage)
+
+        if attempt < policy.max_attempts:
+            delay = policy.delay(attempt)
+            if log is not None:
+                log.info("    🔁 %s 재시도 %d/%d (%.1f초 후)", stage, attempt + 1, policy.max_attempts, delay, stage=stage)
+            time.sleep(delay)
+    return result
+
+
+@dataclass(slots=True)
+class FailedLecture:
+    """재처리 대상 강의"""
+    section_idx: int
+    lecture_idx: int
+    title: str
+    stage: str
+    reason: str = ""
+    lecture_id: Optional[int] = None
+
+
+class FailureQueue:
+    """실패한 강의 모음 (실행 끝 재처리 및 실패 ID 기록)"""
+
+    FILE_NAME = 'failed_lectures.json'
+
+    def __init__(self):
+        self._items: Dict[tuple, FailedLecture] = {}
+
+    def add(self, failure: FailedLecture):
+        """같은 강의는 마지막 실패로 덮어씀"""
+        self._items[(failure.section_idx, failure.lecture_idx)] = failure
+
+    def discard(self, section_idx: int, lecture_idx: int) -> Optional[FailedLecture]:
+        """재처리할 강의를 큐에서 제거하고 반환 (없으면 None)"""
+        return self._items.pop((section_idx, lecture_idx), None)
+
+    def drain(self) -> List[FailedLecture]:
+        """섹션/강의 순으로 꺼내고 비움"""
+        items = [self._items[key] for key in sorted(self._items)]
+        self._items.clear()
+        return items
+
+    def items(self) -> List[FailedLecture]:
+        return [self._items[key] for key in sorted(self._items)]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def save(self, course_dir: Path, file_name: Optional[str] = None) -> Optional[Path]:
+        """남은 실패를 강의 폴더에 기록 (없으면 이전 기록 삭제)"""
+        path = Path(course_dir) / (file_name or self.FILE_NAME)
+        if not self._items:
+            if path.exists():
+                path.unlink()
+            return None
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'failed_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'lecture_ids': [item.lecture_id for item in self.items() if item.lecture_id is not None],
+            'lectures': [asdict(item) for item in self.items()]
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return path
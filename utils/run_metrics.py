@@ -0,0 +1,137 @@
+"""
+실행 처리량 지표 (강의별 이벤트 수집 → GUI 대시보드)
+
+스크래퍼가 강의 완료/실패, 단계별 소요 시간(StructuredLogger.timed), 처리 중인
+워커 수를 기록하면 GUI가 일정 주기로 snapshot()을 읽어 표시합니다.
+
+    metrics = get_metrics()
+    with metrics.busy():
+        ...
+    metrics.record_lecture(cues=120)
+"""
+
+import math
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from config import Config
+
+_STAGE_SAMPLES = 500  # 단계별로 유지할 최근 소요 시간 수
+
+
+@dataclass(slots=True)
+class StageStats:
+    """단계 하나의 소요 시간 통계 (최근 샘플 기준)"""
+    count: int
+    average: float
+    p95: float
+
+
+@dataclass(slots=True)
+class MetricsSnapshot:
+    """대시보드에 표시할 현재 지표"""
+    lectures_per_minute: float
+    cues_per_second: float
+    completed: int
+    total: int
+    active_workers: int
+    eta: str
+    stages: Dict[str, StageStats]
+    failures: Dict[str, int]
+
+
+class RunMetrics:
+    """스레드 안전한 처리량 지표 수집기 (속도는 최근 METRICS_WINDOW_SECONDS 기준)"""
+
+    def __init__(self, window_seconds: Optional[float] = None):
+        self.window = window_seconds or Config.METRICS_WINDOW_SECONDS
+        self._lock = threading.Lock()
+        self._active = 0
+        self.reset()
+
+    def reset(self, progress=None):
+        """새 실행 시작 (progress: 남은 시간을 계산할 ScrapingProgress)"""
+        with self._lock:
+            self.progress = progress
+            self._lectures = deque()  # (완료 시각, cue 수)
+            self._stages = defaultdict(lambda: deque(maxlen=_STAGE_SAMPLES))
+            self._failures = Counter()
+            self._started = time.monotonic()
+
+    def record_stage(self, stage: str, seconds: float):
+        with self._lock:
+            self._stages[stage].append(seconds)
+
+    def record_lecture(self, cues: int = 0):
+        with self._lock:
+            self._lectures.append((time.monotonic(), cues))
+
+    def record_failure(self, stage: str):
+        with self._lock:
+            self._failures[stage] += 1
+
+    def record_recovery(self, stage: str):
+        """다시 처리하게 된 실패 강의를 실패 수에서 뺌 (다시 실패하면 record_failure로 다시 집계)"""
+        with self._lock:
+            if self._failures[stage] > 0:
+                self._failures[stage] -= 1
+            if not self._failures[stage]:
+                del self._failures[stage]
+
+    @contextmanager
+    def busy(self):
+        """강의를 처리하는 동안 활성 워커로 계산"""
+        with self._lock:
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def snapshot(self) -> MetricsSnapshot:
+        now = time.monotonic()
+        with self._lock:
+            while self._lectures and self._lectures[0][0] < now - self.window:
+                self._lectures.popleft()
+            span = max(1.0, min(self.window, now - self._started))
+            cues = sum(count for _, count in self._lectures)
+            stages = {stage: _stage_stats(samples) for stage, samples in self._stages.items() if samples}
+            failures = dict(self._failures)
+            active = self._active
+            lectures = len(self._lectures)
+
+        progress = self.progress
+        return MetricsSnapshot(
+            lectures_per_minute=lectures / span * 60,
+            cues_per_second=cues / span,
+            completed=progress.completed_lectures if progress else 0,
+            total=progress.total_lectures if progress else 0,
+            active_workers=active,
+            eta=progress.estimated_time_remaining if progress else "계산 중...",
+            stages=stages,
+            failures=failures
+        )
+
+
+def _stage_stats(samples) -> StageStats:
+    ordered = sorted(samples)
+    p95 = ordered[max(0, math.ceil(len(ordered) * 0.95) - 1)]
+    return StageStats(len(ordered), sum(ordered) / len(ordered), p95)
+
+
+_metrics_lock = threading.Lock()
+_metrics: Optional[RunMetrics] = None
+
+
+def get_metrics() -> RunMetrics:
+    """프로세스 공용 지표 수집기"""
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = RunMetrics()
+        return _metrics
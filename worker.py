@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+작업 큐 워커 (로컬 디버그 Chrome으로 큐의 강의/섹션 작업을 처리)
+
+    python worker.py enqueue "강의1" "강의2"          # 강의 단위 작업 추가
+    python worker.py enqueue --split "강의명"         # 첫 워커가 커리큘럼 분석 후 섹션 작업으로 나눔
+    python worker.py run [--port 9222] [--wait]       # 작업을 가져와 처리 (--wait이면 큐가 비어도 대기)
+    python worker.py status                           # 상태별 작업 수
+    python worker.py retry-failed                     # 실패 작업 다시 대기
+
+같은 큐 파일(JOB_QUEUE_PATH)을 보는 워커를 늘리면 처리량이 늘어납니다.
+"""
+
+import argparse
+import os
+import socket
+import threading
+import time
+from typing import Optional
+
+from config import Config
+from utils.job_queue import JobQueue, Job, COURSE, SPLIT, SECTION
+from utils.logger import as_logger
+
+
+class QueueWorker:
+    """큐에서 작업을 임대해 TranscriptScraper로 처리 (처리 중에는 heartbeat)"""
+
+    def __init__(self, queue: JobQueue, port: Optional[int] = None, log_callback=None):
+        self.queue = queue
+        self.port = port or Config.CHROME_DEBUG_PORT
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{self.port}"
+        self.log_callback = as_logger(log_callback)
+        self.manager = None
+
+    def run(self, wait: bool = False, max_jobs: Optional[int] = None) -> int:
+        """작업이 없을 때까지(wait이면 계속) 처리 → 처리한 작업 수"""
+        from browser.manager import ExistingBrowserManager
+
+        self.manager = ExistingBrowserManager(log_callback=self.log_callback)
+        if not self.manager.connect_to_existing_browser(self.port):
+            return 0
+
+        processed = 0
+        try:
+            while max_jobs is None or processed < max_jobs:
+                job = self.queue.claim(self.owner)
+                if job is None:
+                    if not wait:
+                        break
+                    time.sleep(Config.JOB_POLL_INTERVAL)
+                    continue
+
+                self.log_callback(f"\\n📥 작업 #{job.job_id} ({job.kind}): {job.label} - 시도 {job.attempts}/{job.max_attempts}")
+                self._run_with_heartbeat(job)
+                processed += 1
+        finally:
+            self.manager.cleanup()
+
+        self.log_callback(f"🏁 워커 종료: {processed}개 작업 처리 ({self.queue.stats()})")
+        return processed
+
+    def _run_with_heartbeat(self, job: Job):
+        """처리하는 동안 임대를 주기적으로 연장하고 결과를 큐에 기록"""
+        stop = threading.Event()
+
+        def beat():
+            while not stop.wait(self.queue.lease_seconds / 3):
+                if not self.queue.heartbeat(job.job_id, self.owner):
+                    self.log_callback.warning(f"⚠️ 작업 #{job.job_id} 임대를 잃음 (다른 워커가 가져갔을 수 있음)")
+                    return
+
+        heartbeat = threading.Thread(target=beat, daemon=True)
+        heartbeat.start()
+        try:
+            error = self._process(job)
+        except Exception as e:
+            error = str(e)
+        finally:
+            stop.set()
+            heartbeat.join()
+
+        if error:
+            self.log_callback(f"❌ 작업 #{job.job_id} 실패: {error}")
+            self.queue.fail(job.job_id, self.owner, error)
+        else:
+            self.log_callback(f"✅ 작업 #{job.job_id} 완료")
+            self.queue.complete(job.job_id, self.owner)
+
+    def _process(self, job: Job) -> Optional[str]:
+        """작업 하나 처리 → 실패 사유 (성공이면 None)"""
+        from browser.course_finder import CourseFinder
+        from browser.navigation import UdemyNavigator
+        from browser.transcript_scraper import TranscriptScraper
+        from utils.work_scheduler import lecture_weights
+
+        driver, wait = self.manager.driver, self.manager.wait
+        finder = CourseFinder(driver, wait, self.log_callback)
+        course = finder.open_course(job.course)
+        if not course:
+            return "강의를 찾을 수 없음"
+        if not UdemyNavigator(driver, wait, self.log_callback).analyze_curriculum(course):
+            return "커리큘럼 분석 실패"
+
+        if job.kind == SPLIT:
+            added = self.queue.enqueue_sections(job.course, [section.total_seconds for section in course.sections])
+            self.log_callback(f"🧩 섹션 작업 {added}개 추가 ({len(course.sections)}개 섹션)")
+            return None
+
+        scraper = TranscriptScraper(driver, wait, self.log_callback)
+        if job.kind == SECTION:
+            if job.section_idx >= len(course.sections):
+                return f"섹션 {job.section_idx + 1}이 없음 (총 {len(course.sections)}개)"
+            if not any(section_idx == job.section_idx for section_idx, _ in lecture_weights(course)):
+                self.log_callback(f"⏭️ 섹션 {job.section_idx + 1}에 자막을 추출할 강의가 없음 (문서/퀴즈/리소스만) - 완료 처리")
+                return None
+            scraper.only_sections = {job.section_idx}
+        return None if scraper.start_complete_scraping_workflow(course) else "자막 추출 실패"
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="Udemy 스크래퍼 작업 큐 워커")
+    parser.add_argument('--queue', help="작업 큐 파일 (기본: JOB_QUEUE_PATH 또는 cache/jobs.sqlite3)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    enqueue = commands.add_parser('enqueue', help="강의 작업 추가")
+    enqueue.add_argument('courses', nargs='+', help="강의명/URL/ID")
+    enqueue.add_argument('--split', action='store_true', help="섹션 단위 작업으로 나눠 처리")
+
+    run = commands.add_parser('run', help="작업 처리")
+    run.add_argument('--port', type=int, help="디버그 Chrome 포트 (기본: CHROME_DEBUG_PORT)")
+    run.add_argument('--wait', action='store_true', help="큐가 비어도 종료하지 않고 대기")
+    run.add_argument('--max-jobs', type=int, help="처리할 최대 작업 수")
+
+    commands.add_parser('status', help="상태별 작업 수")
+    commands.add_parser('retry-failed', help="실패 작업 다시 대기")
+
+    args = parser.parse_args()
+    Config.ensure_directories()
+    queue = JobQueue(args.queue)
+
+    if args.command == 'enqueue':
+        kind = SPLIT if args.split else COURSE
+        added = sum(queue.enqueue(course, kind) for course in args.courses)
+        print(f"📥 작업 {added}개 추가 (중복 {len(args.courses) - added}개 무시)")
+    elif args.command == 'run':
+        QueueWorker(queue, args.port, log_callback=print).run(wait=args.wait, max_jobs=args.max_jobs)
+    elif args.command == 'status':
+        print(queue.stats())
+        for job in queue.failed_jobs():
+            print(f"  ❌ #{job['job_id']} {job['course']} ({job['kind']}): {job['last_error']}")
+    elif args.command == 'retry-failed':
+        print(f"🔁 실패 작업 {queue.requeue_failed()}개 다시 대기")
+
+
+if __name__ == "__main__":
+    main()